@@ -4,23 +4,36 @@ Faster-Whisper GPU Benchmark
 
 Tests transcription performance of different Whisper models on NVIDIA GPU.
 Downloads models on first run, caches for subsequent runs.
+
+`benchmark.py compare` compares result files instead (see compare.py) and
+`benchmark.py report` plots per-sample records (see report.py).
 """
 
 import argparse
 import json
+import multiprocessing
 import os
 import platform
+import queue
+import resource
+import shutil
 import subprocess
 import sys
+import tempfile
+import threading
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 import numpy as np
 import soundfile as sf
 import torch
-from faster_whisper import WhisperModel
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+from faster_whisper.audio import decode_audio
+from faster_whisper.utils import download_model as fetch_model
 from jiwer import wer
 from tqdm import tqdm
 
@@ -31,6 +44,29 @@ CACHE_DIR = Path("/cache/models")
 AUDIO_DIR = Path("/app/audio")
 RESULTS_DIR = Path("/results")
 TEST_COMMANDS_FILE = Path("/app/test-commands.txt")
+SAMPLE_RATE = 16000  # Whisper's native rate; preloaded audio is resampled to this
+BATCH_GAP_SEC = 0.5  # Silence between clips laid end to end for batched runs
+
+# --sweep grid defaults (each axis can be overridden on the command line)
+SWEEP_COMPUTE_TYPES = {
+    "cpu": ["int8", "int8_float32", "float32"],
+    "cuda": ["float16", "int8_float16", "int8"]
+}
+SWEEP_BEAM_SIZES = [1, 5]
+SWEEP_NUM_WORKERS = [1, 2]
+SWEEP_ITERATIONS = 2
+
+# --stream simulation (satellite -> VAD -> STT)
+STREAM_CHUNK_MS = [64]  # Wyoming satellites send 1024-sample chunks at 16 kHz
+STREAM_VAD_THRESHOLD_DBFS = -45.0  # Chunk RMS above this counts as speech
+STREAM_END_SILENCE_MS = 500  # Trailing silence that ends an utterance
+STREAM_PRE_ROLL_MS = 300  # Audio kept from before speech onset
+STREAM_LEAD_SEC = 1.0  # Silence replayed before each clip
+STREAM_TAIL_SEC = 1.5  # Silence replayed after each clip (must exceed END_SILENCE)
+STREAM_IDLE_SEC = 10.0  # Idle-listening window for CPU measurement
+
+# Per-process state for --workers pool processes (see _worker_init)
+_WORKER: Dict[str, Any] = {}
 
 
 def get_gpu_info() -> Dict[str, str]:
@@ -100,23 +136,209 @@ def load_audio_files() -> List[Dict[str, Any]]:
     return audio_files
 
 
+def preload_audio(audio_files: List[Dict[str, Any]], pcm_dir: Path) -> float:
+    """Decode every file once to 16 kHz float32 PCM backed by a shared memory map.
+
+    All clips are concatenated into a single .npy in ``pcm_dir``; each entry gets
+    ``pcm_offset``/``pcm_samples`` into it, a read-only ``audio`` view for direct
+    use and its own ``decode_ms``. Returns the total decode time in ms.
+    """
+    decoded = []
+    total_decode_ms = 0.0
+    offset = 0
+    for audio_info in tqdm(audio_files, desc="Decoding", leave=False):
+        start_time = time.perf_counter()
+        pcm = decode_audio(str(audio_info["path"]), sampling_rate=SAMPLE_RATE)
+        decode_ms = (time.perf_counter() - start_time) * 1000
+
+        audio_info["decode_ms"] = decode_ms
+        audio_info["pcm_offset"] = offset
+        audio_info["pcm_samples"] = len(pcm)
+        total_decode_ms += decode_ms
+        offset += len(pcm)
+        decoded.append(pcm.astype(np.float32, copy=False))
+
+    pcm_file = pcm_dir / "audio.npy"
+    np.save(pcm_file, np.concatenate(decoded))
+    shared = np.load(pcm_file, mmap_mode="r")
+    for audio_info in audio_files:
+        start = audio_info["pcm_offset"]
+        audio_info["audio"] = shared[start:start + audio_info["pcm_samples"]]
+    return total_decode_ms
+
+
+def audio_input(audio_info: Dict[str, Any]) -> Any:
+    """What to hand to transcribe(): preloaded PCM if available, else the file path."""
+    if "audio" in audio_info:
+        return audio_info["audio"]
+    return str(audio_info["path"])
+
+
+def model_cache_files(model_size: str) -> List[Path]:
+    """Files backing a cached model (hub snapshot symlinks resolved to their blobs)."""
+    files = set()
+    for model_dir in CACHE_DIR.glob(f"*faster-whisper-{model_size}"):
+        files.update(f.resolve() for f in model_dir.rglob("*") if f.is_file())
+    return sorted(files)
+
+
+def evict_page_cache(files: List[Path]) -> bool:
+    """Drop files from the page cache so the next read comes from disk."""
+    if not files or not hasattr(os, "posix_fadvise"):
+        return False
+    for path in files:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    return True
+
+
+def reset_peak_rss() -> None:
+    """Reset the kernel's peak RSS (VmHWM) counter for this process, if supported."""
+    try:
+        Path("/proc/self/clear_refs").write_text("5")
+    except OSError:
+        pass
+
+
+def get_peak_rss_mb() -> int:
+    """Peak resident set size in MB since the last reset_peak_rss()."""
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) // 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024
+
+
+def profile_cold_start(
+    model_size: str,
+    device: str,
+    compute_type: str,
+    audio_info: Dict[str, Any]
+) -> tuple:
+    """Profile the model cache check, model construction and the first transcription.
+
+    The cache check is the hub snapshot lookup (find_cached_model) every start goes
+    through; main() has already downloaded the model, so only the lookup is timed.
+    Then loads the model twice: once after evicting its files from the page cache
+    (disk load) and once with them cached. The second instance is kept, and its
+    first transcription doubles as the warm-up run. Returns (profile, model).
+    """
+    def load() -> tuple:
+        start_time = time.perf_counter()
+        loaded = WhisperModel(
+            model_size,
+            device=device,
+            compute_type=compute_type,
+            download_root=str(CACHE_DIR)
+        )
+        return loaded, (time.perf_counter() - start_time) * 1000
+
+    start_time = time.perf_counter()
+    find_cached_model(model_size)
+    cache_check_ms = (time.perf_counter() - start_time) * 1000
+
+    files = model_cache_files(model_size)
+    load_disk_ms = None
+    if evict_page_cache(files):
+        model, load_disk_ms = load()
+        del model
+
+    if device == "cpu":
+        reset_peak_rss()
+    model, load_cached_ms = load()
+
+    start_time = time.perf_counter()
+    segments, _ = model.transcribe(audio_input(audio_info), language="pl", beam_size=5)
+    next(segments, None)
+    first_segment_ms = (time.perf_counter() - start_time) * 1000
+    list(segments)  # Force execution
+    first_transcription_ms = (time.perf_counter() - start_time) * 1000
+
+    profile = {
+        "model_files_mb": round(sum(f.stat().st_size for f in files) / 1024 / 1024, 1),
+        "cache_check_ms": round(cache_check_ms, 2),
+        "load_disk_ms": round(load_disk_ms, 2) if load_disk_ms is not None else None,
+        "load_page_cache_ms": round(load_cached_ms, 2),
+        "first_segment_ms": round(first_segment_ms, 2),
+        "first_transcription_ms": round(first_transcription_ms, 2),
+        "peak_rss_mb": get_peak_rss_mb() if device == "cpu" else None
+    }
+    return profile, model
+
+
+def collect_segments(segments: Iterable[Any], clock: Callable[[], float] = time.perf_counter) -> tuple:
+    """Consume a segment generator.
+
+    Returns (text, segment_count, clock() when the first segment arrived or None).
+    """
+    texts = []
+    first_segment_at = None
+    for segment in segments:
+        if first_segment_at is None:
+            first_segment_at = clock()
+        texts.append(segment.text)
+    return " ".join(texts).strip(), len(texts), first_segment_at
+
+
+def sample_record(
+    audio_info: Dict[str, Any],
+    iteration: int,
+    latency_ms: float,
+    segment_count: int,
+    first_segment_ms: Optional[float]
+) -> Dict[str, Any]:
+    """One row of the per-sample records written to the .npz file."""
+    return {
+        "filename": audio_info["filename"],
+        "iteration": iteration,
+        "latency_ms": latency_ms,
+        "duration_sec": audio_info["duration"],
+        "segments": segment_count,
+        "first_segment_ms": first_segment_ms if first_segment_ms is not None else np.nan
+    }
+
+
+def save_samples(path: Path, samples_by_model: Dict[str, List[Dict[str, Any]]]) -> None:
+    """Write per-sample records as compact columnar arrays (one row per request)."""
+    rows = [(model, sample) for model, samples in samples_by_model.items() for sample in samples]
+    np.savez_compressed(
+        path,
+        model=np.array([model for model, _ in rows], dtype=str),
+        filename=np.array([s["filename"] for _, s in rows], dtype=str),
+        iteration=np.array([s["iteration"] for _, s in rows], dtype=np.int16),
+        latency_ms=np.array([s["latency_ms"] for _, s in rows], dtype=np.float32),
+        duration_sec=np.array([s["duration_sec"] for _, s in rows], dtype=np.float32),
+        segments=np.array([s["segments"] for _, s in rows], dtype=np.int16),
+        first_segment_ms=np.array([s["first_segment_ms"] for _, s in rows], dtype=np.float32)
+    )
+
+
+def find_cached_model(model_size: str) -> Optional[str]:
+    """Path of the model's hub snapshot in CACHE_DIR, or None if not downloaded.
+
+    Same lookup WhisperModel does on construction, without touching the network.
+    """
+    try:
+        return fetch_model(model_size, local_files_only=True, cache_dir=str(CACHE_DIR))
+    except FileNotFoundError:  # huggingface_hub's LocalEntryNotFoundError
+        return None
+
+
 def download_model(model_size: str) -> None:
     """Download and cache a Whisper model."""
     print(f"\nDownloading model: {model_size}")
-    model_path = CACHE_DIR / model_size
 
-    if model_path.exists():
+    if find_cached_model(model_size) is not None:
         print(f"Model {model_size} already cached")
         return
 
-    # Create a temporary model to trigger download
     print(f"Downloading {model_size} model (this may take a few minutes)...")
-    _ = WhisperModel(
-        model_size,
-        device="cpu",  # Use CPU for download to avoid VRAM allocation
-        compute_type="int8",
-        download_root=str(CACHE_DIR)
-    )
+    fetch_model(model_size, cache_dir=str(CACHE_DIR))
     print(f"✓ Model {model_size} downloaded and cached")
 
 
@@ -138,12 +360,8 @@ def benchmark_model(
         torch.cuda.empty_cache()
     vram_before = get_vram_usage() if device == "cuda" else 0
 
-    model = WhisperModel(
-        model_size,
-        device=device,
-        compute_type=compute_type,
-        download_root=str(CACHE_DIR)
-    )
+    # Cold start: disk vs page-cache load, then the first (warm-up) transcription
+    cold_start, model = profile_cold_start(model_size, device, compute_type, audio_files[0])
 
     vram_after = get_vram_usage() if device == "cuda" else 0
     vram_model = vram_after - vram_before
@@ -153,34 +371,34 @@ def benchmark_model(
     else:
         print(f"Model loaded (CPU mode)")
 
-    # Warm-up run
-    print("Warming up...")
-    segments, _ = model.transcribe(str(audio_files[0]["path"]), language="pl", beam_size=5)
-    list(segments)  # Force execution
-
     # Benchmark runs
     all_latencies = []
     all_transcriptions = []
+    samples = []
 
     print(f"\nRunning {iterations} iterations on {len(audio_files)} audio files...")
 
     for iteration in range(iterations):
         for audio_info in tqdm(audio_files, desc=f"Iteration {iteration + 1}/{iterations}", leave=False):
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             segments, info = model.transcribe(
-                str(audio_info["path"]),
+                audio_input(audio_info),
                 language="pl",
                 beam_size=5
             )
 
             # Force execution and collect transcription
-            transcription = " ".join(segment.text for segment in segments).strip()
+            transcription, segment_count, first_segment_at = collect_segments(segments)
 
-            end_time = time.time()
+            end_time = time.perf_counter()
             latency = (end_time - start_time) * 1000  # Convert to ms
 
             all_latencies.append(latency)
+            samples.append(sample_record(
+                audio_info, iteration, latency, segment_count,
+                (first_segment_at - start_time) * 1000 if first_segment_at is not None else None
+            ))
 
             if iteration == 0:  # Only save transcriptions from first iteration
                 all_transcriptions.append({
@@ -190,18 +408,47 @@ def benchmark_model(
                     "duration": audio_info["duration"]
                 })
 
-    # Calculate metrics
+    results = summarize_results(
+        model_size, device, compute_type, iterations, audio_files, all_latencies, all_transcriptions
+    )
+    results["vram_used_mb"] = vram_model if device == "cuda" else None
+    results["cold_start"] = cold_start
+    results["samples"] = samples
+    print_model_summary(results)
+
+    # Cleanup
+    del model
+    if device == "cuda":
+        torch.cuda.empty_cache()
+
+    return results
+
+
+def compute_wer(transcriptions: List[Dict[str, Any]]) -> Optional[float]:
+    """Corpus WER over transcriptions, or None if any ground truth is missing."""
+    if not transcriptions or not all(t["ground_truth"] for t in transcriptions):
+        return None
+    references = [t["ground_truth"] for t in transcriptions]
+    hypotheses = [t["transcription"] for t in transcriptions]
+    return wer(references, hypotheses)
+
+
+def summarize_results(
+    model_size: str,
+    device: str,
+    compute_type: str,
+    iterations: int,
+    audio_files: List[Dict[str, Any]],
+    all_latencies: List[float],
+    all_transcriptions: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Reduce per-request latencies and transcriptions to the result schema."""
     latencies = np.array(all_latencies)
     total_audio_duration = sum(a["duration"] for a in audio_files) * iterations
     total_processing_time = latencies.sum() / 1000  # Convert to seconds
     realtime_factor = total_audio_duration / total_processing_time if total_processing_time > 0 else 0
 
-    # Calculate WER if ground truth available
-    wer_score = None
-    if all(t["ground_truth"] for t in all_transcriptions):
-        references = [t["ground_truth"] for t in all_transcriptions]
-        hypotheses = [t["transcription"] for t in all_transcriptions]
-        wer_score = wer(references, hypotheses)
+    wer_score = compute_wer(all_transcriptions)
 
     results = {
         "model": model_size,
@@ -217,26 +464,615 @@ def benchmark_model(
         "p99_latency_ms": round(float(np.percentile(latencies, 99)), 2),
         "std_latency_ms": round(float(np.std(latencies)), 2),
         "realtime_factor": round(realtime_factor, 2),
-        "vram_used_mb": vram_model if device == "cuda" else None,
+        "vram_used_mb": None,
         "wer": round(wer_score, 4) if wer_score is not None else None,
+        "latencies_ms": [round(float(latency), 2) for latency in latencies],
         "transcriptions": all_transcriptions
     }
+    return results
 
-    # Print summary
+
+def print_model_summary(results: Dict[str, Any]) -> None:
+    """Print the per-model results block."""
     print(f"\nResults:")
     print(f"  Mean latency:     {results['mean_latency_ms']:.2f} ms")
     print(f"  P95 latency:      {results['p95_latency_ms']:.2f} ms")
     print(f"  Real-time factor: {results['realtime_factor']:.1f}x")
-    if device == "cuda":
+    if "throughput_rps" in results:
+        print(f"  Throughput:       {results['throughput_rps']:.2f} req/s "
+              f"({results['aggregate_realtime_factor']:.1f}x realtime aggregate, "
+              f"{results['workers']} workers)")
+    if results["vram_used_mb"] is not None:
         print(f"  VRAM used:        {results['vram_used_mb']} MB")
-    if wer_score is not None:
+    if results["wer"] is not None:
         print(f"  WER:              {results['wer']:.2%}")
+    cold_start = results.get("cold_start")
+    if cold_start:
+        disk = cold_start["load_disk_ms"]
+        print(f"  Cache check:      {cold_start['cache_check_ms']:.2f} ms")
+        print(f"  Load (disk/page cache): "
+              f"{f'{disk:.0f}' if disk is not None else 'n/a'} / {cold_start['load_page_cache_ms']:.0f} ms")
+        print(f"  First segment:    {cold_start['first_segment_ms']:.0f} ms")
+        if cold_start["peak_rss_mb"] is not None:
+            print(f"  Peak RSS:         {cold_start['peak_rss_mb']} MB")
+
+
+def load_pcm(audio_info: Dict[str, Any]) -> np.ndarray:
+    """16 kHz float32 samples for a clip, from the preload map if available."""
+    if "audio" in audio_info:
+        return np.asarray(audio_info["audio"], dtype=np.float32)
+    return decode_audio(str(audio_info["path"]), sampling_rate=SAMPLE_RATE)
+
+
+def concatenate_clips(audio_files: List[Dict[str, Any]]) -> tuple:
+    """Lay all clips end to end as one 16 kHz array with explicit clip boundaries.
+
+    BatchedInferencePipeline batches chunks of a single input, so this turns the
+    test commands into one stream whose chunks are the individual utterances, the
+    way concurrent satellite requests would be queued into one batch. Clip
+    boundaries are in seconds, as faster-whisper 1.2+ expects (1.1 took samples).
+    """
+    gap = np.zeros(int(BATCH_GAP_SEC * SAMPLE_RATE), dtype=np.float32)
+    parts = []
+    clips = []
+    position = 0.0
+    for audio_info in audio_files:
+        pcm = load_pcm(audio_info)
+        duration = len(pcm) / SAMPLE_RATE
+        clips.append({"start": position, "end": position + duration})
+        parts.extend([pcm, gap])
+        position += duration + BATCH_GAP_SEC
+    return np.concatenate(parts), clips
+
+
+def benchmark_batched(
+    model_size: str,
+    audio_files: List[Dict[str, Any]],
+    device: str,
+    compute_type: str,
+    batch_sizes: List[int],
+    iterations: int = ITERATIONS
+) -> List[Dict[str, Any]]:
+    """Sweep BatchedInferencePipeline batch sizes over all clips at once."""
+    print(f"\nBatch sweep: {model_size} (batch sizes {batch_sizes})")
+
+    model = WhisperModel(
+        model_size,
+        device=device,
+        compute_type=compute_type,
+        download_root=str(CACHE_DIR)
+    )
+    pipeline = BatchedInferencePipeline(model=model)
+    audio, clips = concatenate_clips(audio_files)
+    options = {"language": "pl", "beam_size": 5, "vad_filter": False, "clip_timestamps": clips}
+
+    # Warm-up at the largest batch so buffers are sized before timing
+    segments, _ = pipeline.transcribe(audio, batch_size=max(batch_sizes), **options)
+    list(segments)
+
+    total_audio_duration = sum(a["duration"] for a in audio_files)
+    sweep = []
+    for batch_size in batch_sizes:
+        pass_latencies = []
+        transcriptions = []
+        for iteration in tqdm(range(iterations), desc=f"batch_size={batch_size}", leave=False):
+            start_time = time.perf_counter()
+            segments, _ = pipeline.transcribe(audio, batch_size=batch_size, **options)
+            segments = list(segments)
+            pass_latencies.append((time.perf_counter() - start_time) * 1000)
+
+            if iteration == 0:
+                texts: List[List[str]] = [[] for _ in clips]
+                for segment in segments:
+                    index = next(
+                        (i for i, clip in enumerate(clips) if segment.start < clip["end"]),
+                        len(clips) - 1
+                    )
+                    texts[index].append(segment.text)
+                transcriptions = [
+                    {
+                        "filename": audio_info["filename"],
+                        "transcription": " ".join(text).strip(),
+                        "ground_truth": audio_info["ground_truth"],
+                        "duration": audio_info["duration"]
+                    }
+                    for audio_info, text in zip(audio_files, texts)
+                ]
+
+        latencies = np.array(pass_latencies)
+        processing_time = latencies.sum() / 1000
+        batches_per_pass = -(-len(clips) // batch_size)
+        wer_score = compute_wer(transcriptions)
+
+        entry = {
+            "batch_size": batch_size,
+            "mean_pass_ms": round(float(latencies.mean()), 2),
+            "p95_pass_ms": round(float(np.percentile(latencies, 95)), 2),
+            "mean_batch_latency_ms": round(float(latencies.mean()) / batches_per_pass, 2),
+            "throughput_rps": round(len(clips) * iterations / processing_time, 2),
+            "realtime_factor": round(total_audio_duration * iterations / processing_time, 2),
+            "wer": round(wer_score, 4) if wer_score is not None else None
+        }
+        sweep.append(entry)
+        wer_label = f" | WER {entry['wer']:.2%}" if entry["wer"] is not None else ""
+        print(f"  batch {batch_size:>3}: {entry['throughput_rps']:.2f} req/s, "
+              f"{entry['realtime_factor']:.1f}x realtime, "
+              f"{entry['mean_batch_latency_ms']:.0f} ms/batch{wer_label}")
+
+    del pipeline, model
+    if device == "cuda":
+        torch.cuda.empty_cache()
+
+    return sweep
+
+
+def _sweep_pass(
+    model: WhisperModel,
+    audio_files: List[Dict[str, Any]],
+    beam_size: int,
+    vad_filter: bool,
+    num_workers: int
+) -> tuple:
+    """Transcribe every file once, num_workers requests in flight at a time.
+
+    Returns (latencies_ms, texts, wall_time_sec).
+    """
+    def transcribe(audio_info: Dict[str, Any]) -> tuple:
+        start_time = time.perf_counter()
+        segments, _ = model.transcribe(
+            audio_input(audio_info), language="pl", beam_size=beam_size, vad_filter=vad_filter
+        )
+        text, _, _ = collect_segments(segments)
+        return (time.perf_counter() - start_time) * 1000, text
+
+    start_time = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        outputs = list(executor.map(transcribe, audio_files))
+    wall_time = time.perf_counter() - start_time
+    return [o[0] for o in outputs], [o[1] for o in outputs], wall_time
+
+
+def sweep_model(
+    model_size: str,
+    audio_files: List[Dict[str, Any]],
+    device: str,
+    compute_types: List[str],
+    beam_sizes: List[int],
+    cpu_threads_options: List[int],
+    num_workers_options: List[int],
+    iterations: int = SWEEP_ITERATIONS
+) -> List[Dict[str, Any]]:
+    """Measure RTF and WER for every decoding configuration of one model.
+
+    compute_type, cpu_threads and num_workers need a fresh model; beam size and
+    VAD are per-call options, so they are swept on each loaded instance.
+    num_workers only helps with concurrent calls, so each pass keeps that many
+    requests in flight and RTF is audio seconds per wall-clock second.
+    """
+    total_audio_duration = sum(a["duration"] for a in audio_files)
+    entries = []
+    grid = [
+        (compute_type, cpu_threads, num_workers)
+        for compute_type in compute_types
+        for cpu_threads in cpu_threads_options
+        for num_workers in num_workers_options
+    ]
+    for compute_type, cpu_threads, num_workers in grid:
+        try:
+            model = WhisperModel(
+                model_size,
+                device=device,
+                compute_type=compute_type,
+                cpu_threads=cpu_threads,
+                num_workers=num_workers,
+                download_root=str(CACHE_DIR)
+            )
+        except ValueError as e:
+            # Compute type not supported by this CPU/GPU
+            print(f"  Skipping {model_size}/{compute_type}: {e}")
+            continue
+
+        # Warm-up run
+        segments, _ = model.transcribe(audio_input(audio_files[0]), language="pl", beam_size=5)
+        list(segments)
+
+        for beam_size in beam_sizes:
+            for vad_filter in (False, True):
+                latencies: List[float] = []
+                wall_time = 0.0
+                texts: List[str] = []
+                for iteration in range(iterations):
+                    pass_latencies, pass_texts, pass_wall = _sweep_pass(
+                        model, audio_files, beam_size, vad_filter, num_workers
+                    )
+                    latencies.extend(pass_latencies)
+                    wall_time += pass_wall
+                    if iteration == 0:
+                        texts = pass_texts
+
+                wer_score = compute_wer([
+                    {"ground_truth": a["ground_truth"], "transcription": text}
+                    for a, text in zip(audio_files, texts)
+                ])
+                entry = {
+                    "model": model_size,
+                    "compute_type": compute_type,
+                    "beam_size": beam_size,
+                    "cpu_threads": cpu_threads,
+                    "num_workers": num_workers,
+                    "vad_filter": vad_filter,
+                    "mean_latency_ms": round(float(np.mean(latencies)), 2),
+                    "p95_latency_ms": round(float(np.percentile(latencies, 95)), 2),
+                    "realtime_factor": round(total_audio_duration * iterations / wall_time, 2),
+                    "wer": round(wer_score, 4) if wer_score is not None else None
+                }
+                entries.append(entry)
+                print(f"  {_sweep_label(entry):<48} {entry['realtime_factor']:>7.1f}x  "
+                      f"{_wer_label(entry['wer'])}")
+
+        del model
+        if device == "cuda":
+            torch.cuda.empty_cache()
+
+    return entries
+
+
+def _sweep_label(entry: Dict[str, Any]) -> str:
+    return (f"{entry['model']} {entry['compute_type']} beam={entry['beam_size']} "
+            f"threads={entry['cpu_threads']} nw={entry['num_workers']} "
+            f"vad={'on' if entry['vad_filter'] else 'off'}")
+
+
+def _wer_label(wer_score: Optional[float]) -> str:
+    return f"{wer_score:.2%}" if wer_score is not None else "n/a"
+
+
+def mark_pareto(entries: List[Dict[str, Any]]) -> None:
+    """Flag configurations no other configuration beats on both RTF and WER."""
+    for entry in entries:
+        wer_score = entry["wer"] if entry["wer"] is not None else float("inf")
+        entry["pareto"] = not any(
+            other is not entry
+            and other["realtime_factor"] >= entry["realtime_factor"]
+            and (other["wer"] if other["wer"] is not None else float("inf")) <= wer_score
+            and (other["realtime_factor"], other["wer"]) != (entry["realtime_factor"], entry["wer"])
+            for other in entries
+        )
+
+
+def print_pareto_table(entries: List[Dict[str, Any]]) -> None:
+    """Print all configurations by RTF, Pareto-optimal ones starred."""
+    print("\n" + "=" * 60)
+    print("SWEEP: RTF vs WER (* = Pareto-optimal)")
+    print("=" * 60)
+    print(f"  {'configuration':<48} {'RTF':>8}  WER")
+    for entry in sorted(entries, key=lambda e: e["realtime_factor"], reverse=True):
+        marker = "*" if entry["pareto"] else " "
+        print(f"{marker} {_sweep_label(entry):<48} {entry['realtime_factor']:>7.1f}x  "
+              f"{_wer_label(entry['wer'])}")
+
+
+def _is_speech(chunk: np.ndarray) -> bool:
+    """Energy VAD decision for one chunk."""
+    rms = float(np.sqrt(np.mean(np.square(chunk, dtype=np.float64))))
+    return rms >= 10 ** (STREAM_VAD_THRESHOLD_DBFS / 20)
+
+
+def speech_end_sec(pcm: np.ndarray, chunk_samples: int) -> float:
+    """End of the last speech chunk: when the user stopped talking, at this chunk granularity."""
+    last = None
+    for index, offset in enumerate(range(0, len(pcm), chunk_samples)):
+        if _is_speech(pcm[offset:offset + chunk_samples]):
+            last = index
+    if last is None:
+        return len(pcm) / SAMPLE_RATE
+    return min((last + 1) * chunk_samples, len(pcm)) / SAMPLE_RATE
+
+
+def _replay(audio: np.ndarray, chunk_samples: int, started: float, chunks: queue.Queue, stop: threading.Event) -> None:
+    """Feed chunks at real-time pace: chunk i is delivered once its last sample would have been captured."""
+    chunk_sec = chunk_samples / SAMPLE_RATE
+    for index, offset in enumerate(range(0, len(audio), chunk_samples)):
+        delay = started + (index + 1) * chunk_sec - time.perf_counter()
+        if stop.wait(delay if delay > 0 else 0):
+            break
+        chunks.put(audio[offset:offset + chunk_samples])
+    chunks.put(None)
+
+
+def stream_utterance(model: WhisperModel, audio: np.ndarray, chunk_samples: int) -> tuple:
+    """Replay audio in real time through a VAD-gated pipeline.
+
+    Speech chunks (plus pre-roll) are buffered until STREAM_END_SILENCE_MS of
+    silence, then the buffer is transcribed. Returns (started, text, finished)
+    using perf_counter stamps; text/finished are None if no utterance ended.
+    """
+    chunk_ms = chunk_samples / SAMPLE_RATE * 1000
+    hangover_chunks = max(1, round(STREAM_END_SILENCE_MS / chunk_ms))
+    pre_roll: Any = deque(maxlen=max(1, round(STREAM_PRE_ROLL_MS / chunk_ms)))
+    chunks: queue.Queue = queue.Queue()
+    stop = threading.Event()
+
+    started = time.perf_counter()
+    producer = threading.Thread(target=_replay, args=(audio, chunk_samples, started, chunks, stop), daemon=True)
+    producer.start()
+
+    buffered: List[np.ndarray] = []
+    silent_chunks = 0
+    text, finished = None, None
+    while (chunk := chunks.get()) is not None:
+        speech = _is_speech(chunk)
+        if not buffered:
+            pre_roll.append(chunk)
+            if speech:
+                buffered = list(pre_roll)
+            continue
+
+        buffered.append(chunk)
+        silent_chunks = 0 if speech else silent_chunks + 1
+        if silent_chunks >= hangover_chunks:
+            segments, _ = model.transcribe(np.concatenate(buffered), language="pl", beam_size=5)
+            text, _, _ = collect_segments(segments)
+            finished = time.perf_counter()
+            break
+
+    stop.set()
+    producer.join()
+    return started, text, finished
+
+
+def measure_idle_cpu(model: WhisperModel, chunk_samples: int, seconds: float = STREAM_IDLE_SEC) -> float:
+    """Process CPU use (% of one core) while listening to background noise only."""
+    noise_rms = 10 ** ((STREAM_VAD_THRESHOLD_DBFS - 20) / 20)
+    noise = np.random.default_rng(0).normal(0, noise_rms, int(seconds * SAMPLE_RATE)).astype(np.float32)
+    cpu_before, wall_before = time.process_time(), time.perf_counter()
+    stream_utterance(model, noise, chunk_samples)
+    return (time.process_time() - cpu_before) / (time.perf_counter() - wall_before) * 100
+
+
+def benchmark_streaming(
+    model_size: str,
+    audio_files: List[Dict[str, Any]],
+    device: str,
+    compute_type: str,
+    chunk_sizes_ms: List[int]
+) -> List[Dict[str, Any]]:
+    """Simulate satellites streaming each clip in real time, per chunk size.
+
+    Each clip is replayed once between STREAM_LEAD_SEC and STREAM_TAIL_SEC of
+    silence. Latency runs from the end of the last speech chunk (the moment the
+    user stopped talking) to the transcript being ready, so it includes the
+    VAD end-of-speech hangover as a real satellite would.
+    """
+    print(f"\nStreaming simulation: {model_size} (chunks {chunk_sizes_ms} ms)")
+
+    model = WhisperModel(
+        model_size,
+        device=device,
+        compute_type=compute_type,
+        download_root=str(CACHE_DIR)
+    )
+    clips = [(audio_info, load_pcm(audio_info)) for audio_info in audio_files]
+
+    # Warm-up run
+    segments, _ = model.transcribe(clips[0][1], language="pl", beam_size=5)
+    list(segments)
+
+    lead = np.zeros(int(STREAM_LEAD_SEC * SAMPLE_RATE), dtype=np.float32)
+    tail = np.zeros(int(STREAM_TAIL_SEC * SAMPLE_RATE), dtype=np.float32)
+    entries = []
+    for chunk_ms in chunk_sizes_ms:
+        chunk_samples = int(SAMPLE_RATE * chunk_ms / 1000)
+        latencies = []
+        transcriptions = []
+        for audio_info, pcm in tqdm(clips, desc=f"{chunk_ms} ms chunks", leave=False):
+            stream = np.concatenate([lead, pcm, tail])
+            utterance_end = speech_end_sec(stream, chunk_samples)
+            started, text, finished = stream_utterance(model, stream, chunk_samples)
+            if finished is not None:
+                latencies.append((finished - (started + utterance_end)) * 1000)
+            transcriptions.append({
+                "filename": audio_info["filename"],
+                "transcription": text or "",
+                "ground_truth": audio_info["ground_truth"],
+                "duration": audio_info["duration"]
+            })
+
+        wer_score = compute_wer(transcriptions)
+        entry = {
+            "model": model_size,
+            "chunk_ms": chunk_ms,
+            "utterances": len(clips),
+            "endpointed": len(latencies),
+            "mean_eou_latency_ms": round(float(np.mean(latencies)), 2) if latencies else None,
+            "p95_eou_latency_ms": round(float(np.percentile(latencies, 95)), 2) if latencies else None,
+            "max_eou_latency_ms": round(float(np.max(latencies)), 2) if latencies else None,
+            "idle_cpu_percent": round(measure_idle_cpu(model, chunk_samples), 2),
+            "wer": round(wer_score, 4) if wer_score is not None else None
+        }
+        entries.append(entry)
+        latency_label = f"{entry['mean_eou_latency_ms']:.0f} ms mean" if latencies else "n/a"
+        print(f"  {chunk_ms:>4} ms chunks: end-of-utterance -> transcript {latency_label}, "
+              f"{entry['endpointed']}/{entry['utterances']} endpointed, "
+              f"idle CPU {entry['idle_cpu_percent']:.1f}% | WER {_wer_label(entry['wer'])}")
 
-    # Cleanup
     del model
     if device == "cuda":
         torch.cuda.empty_cache()
 
+    return entries
+
+
+def plan_core_sets(workers: int) -> List[List[int]]:
+    """Split the CPUs this process may use into one contiguous set per worker."""
+    if hasattr(os, "sched_getaffinity"):
+        cores = sorted(os.sched_getaffinity(0))
+    else:
+        cores = list(range(os.cpu_count() or 1))
+    if workers > len(cores):
+        raise ValueError(f"--workers {workers} exceeds {len(cores)} available CPUs")
+    per_worker, extra = divmod(len(cores), workers)
+    core_sets = []
+    start = 0
+    for index in range(workers):
+        size = per_worker + (1 if index < extra else 0)
+        core_sets.append(cores[start:start + size])
+        start += size
+    return core_sets
+
+
+def _worker_init(core_queue: Any, warm_barrier: Any, compute_type: str, pcm_file: Optional[str]) -> None:
+    """Pin this pool process to its core set and size CTranslate2 threads to it.
+
+    With --preload the shared PCM file is memory-mapped read-only, so all workers
+    read the same page-cache copy instead of decoding their own.
+    """
+    cores = core_queue.get()
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cores)
+    _WORKER.update({
+        "cores": cores,
+        "barrier": warm_barrier,
+        "cpu_threads": len(cores),
+        "compute_type": compute_type,
+        "pcm": np.load(pcm_file, mmap_mode="r") if pcm_file else None,
+        "model_size": None,
+        "model": None,
+    })
+
+
+def _worker_model(model_size: str) -> WhisperModel:
+    """Return this worker's model, loading (and warming up) on first use."""
+    if _WORKER["model_size"] != model_size:
+        _WORKER["model"] = None  # Free the previous model first
+        model = WhisperModel(
+            model_size,
+            device="cpu",
+            compute_type=_WORKER["compute_type"],
+            cpu_threads=_WORKER["cpu_threads"],
+            download_root=str(CACHE_DIR)
+        )
+        warmup = sorted(AUDIO_DIR.glob("*.wav"))[0]
+        segments, _ = model.transcribe(str(warmup), language="pl", beam_size=5)
+        list(segments)
+        _WORKER.update({"model_size": model_size, "model": model})
+    return _WORKER["model"]
+
+
+def _worker_warm(model_size: str) -> int:
+    """Load and warm this worker's model, then wait for every other worker.
+
+    The barrier holds each warm-up job until all workers have one, so no process
+    takes two and every worker has the model loaded before timed jobs start.
+    """
+    try:
+        _worker_model(model_size)
+    except BaseException:
+        _WORKER["barrier"].abort()  # Release the others instead of hanging
+        raise
+    _WORKER["barrier"].wait()
+    return os.getpid()
+
+
+def _worker_transcribe(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one (model, file, iteration) job in a pool process."""
+    model = _worker_model(job["model"])
+    if _WORKER["pcm"] is not None:
+        start = job["pcm_offset"]
+        source = _WORKER["pcm"][start:start + job["pcm_samples"]]
+    else:
+        source = job["path"]
+
+    started = time.monotonic()
+    segments, _ = model.transcribe(source, language="pl", beam_size=5)
+    transcription, segment_count, first_segment_at = collect_segments(segments, clock=time.monotonic)
+    finished = time.monotonic()
+
+    return {
+        **job,
+        "latency_ms": (finished - started) * 1000,
+        "segments": segment_count,
+        "first_segment_ms": (first_segment_at - started) * 1000 if first_segment_at is not None else None,
+        "transcription": transcription,
+        "started": started,
+        "finished": finished,
+        "pid": os.getpid(),
+    }
+
+
+def benchmark_model_parallel(
+    model_size: str,
+    audio_files: List[Dict[str, Any]],
+    compute_type: str,
+    pool: ProcessPoolExecutor,
+    workers: int,
+    iterations: int = ITERATIONS
+) -> Dict[str, Any]:
+    """Benchmark a single model with (file, iteration) jobs sharded across a CPU pool."""
+    print(f"\n{'='*60}")
+    print(f"Benchmarking: {model_size} (device=cpu, compute_type={compute_type}, workers={workers})")
+    print(f"{'='*60}")
+
+    # Cold start is profiled once in this process, for a single model instance
+    cold_start, model = profile_cold_start(model_size, "cpu", compute_type, audio_files[0])
+    del model
+
+    jobs = [
+        {
+            "model": model_size,
+            "filename": audio_info["filename"],
+            "path": str(audio_info["path"]),
+            "pcm_offset": audio_info.get("pcm_offset"),
+            "pcm_samples": audio_info.get("pcm_samples"),
+            "iteration": iteration,
+        }
+        for iteration in range(iterations)
+        for audio_info in audio_files
+    ]
+
+    # Load the model in every worker before any timed job, so no worker is still
+    # loading while others already transcribe
+    warmed = set(pool.map(_worker_warm, [model_size] * workers))
+    print(f"Model loaded in {len(warmed)} workers")
+
+    done = list(tqdm(pool.map(_worker_transcribe, jobs), total=len(jobs), desc=model_size, leave=False))
+
+    # Wall time from the first job starting to the last one finishing, all workers warm;
+    # time.monotonic is system-wide so stamps from different workers are comparable
+    wall_time = max(d["finished"] for d in done) - min(d["started"] for d in done)
+    audio_by_name = {a["filename"]: a for a in audio_files}
+    transcriptions = [
+        {
+            "filename": d["filename"],
+            "transcription": d["transcription"],
+            "ground_truth": audio_by_name[d["filename"]]["ground_truth"],
+            "duration": audio_by_name[d["filename"]]["duration"]
+        }
+        for d in done if d["iteration"] == 0
+    ]
+
+    results = summarize_results(
+        model_size, "cpu", compute_type, iterations, audio_files,
+        [d["latency_ms"] for d in done], transcriptions
+    )
+    total_audio_duration = sum(a["duration"] for a in audio_files) * iterations
+    results.update({
+        "cold_start": cold_start,
+        "samples": [
+            sample_record(audio_by_name[d["filename"]], d["iteration"], d["latency_ms"],
+                          d["segments"], d["first_segment_ms"])
+            for d in done
+        ],
+        "workers": workers,
+        "wall_time_sec": round(wall_time, 2),
+        "throughput_rps": round(len(done) / wall_time, 2) if wall_time > 0 else None,
+        "aggregate_realtime_factor": round(total_audio_duration / wall_time, 2) if wall_time > 0 else None,
+        "jobs_per_worker": {
+            str(pid): sum(1 for d in done if d["pid"] == pid)
+            for pid in sorted({d["pid"] for d in done})
+        },
+    })
+    print_model_summary(results)
     return results
 
 
@@ -318,15 +1154,61 @@ def _get_model_size(model: str) -> str:
     return sizes.get(model, "unknown")
 
 
+def _int_list(value: str) -> List[int]:
+    """Parse a comma-separated list of integers (argparse type)."""
+    return [int(item) for item in value.split(",")]
+
+
 def main():
     """Main benchmark function."""
+    if sys.argv[1:2] == ["compare"]:
+        import compare
+        sys.exit(compare.main(sys.argv[2:]))
+    if sys.argv[1:2] == ["report"]:
+        import report
+        sys.exit(report.main(sys.argv[2:]))
+
     parser = argparse.ArgumentParser(description="Faster-Whisper Benchmark")
     parser.add_argument("--dry-run", action="store_true",
                        help="Validate setup without running benchmark")
     parser.add_argument("--cpu", action="store_true",
                        help="Run benchmark on CPU instead of GPU (for baseline comparison)")
+    parser.add_argument("--workers", type=int, default=1,
+                       help="CPU only: shard (model, file, iteration) jobs across N pinned worker processes")
+    parser.add_argument("--preload", action="store_true",
+                       help="Decode all audio to 16 kHz PCM once up front and time decoding separately")
+    parser.add_argument("--batch-sizes", type=_int_list, default=None, metavar="N[,N...]",
+                       help="Also sweep BatchedInferencePipeline over these batch sizes (e.g. 1,2,4,8)")
+    parser.add_argument("--sweep", action="store_true",
+                       help="Sweep decoding configurations instead of the standard run and print an RTF/WER Pareto table")
+    parser.add_argument("--sweep-compute-types", type=lambda v: v.split(","), default=None,
+                       metavar="TYPE[,TYPE...]",
+                       help="Compute types to sweep (default: int8,int8_float32,float32 on CPU)")
+    parser.add_argument("--sweep-beam-sizes", type=_int_list, default=SWEEP_BEAM_SIZES, metavar="N[,N...]",
+                       help=f"Beam sizes to sweep (default: {','.join(map(str, SWEEP_BEAM_SIZES))})")
+    parser.add_argument("--sweep-threads", type=_int_list, default=None, metavar="N[,N...]",
+                       help="cpu_threads values to sweep (default: half and all available cores)")
+    parser.add_argument("--sweep-num-workers", type=_int_list, default=SWEEP_NUM_WORKERS, metavar="N[,N...]",
+                       help=f"num_workers values to sweep (default: {','.join(map(str, SWEEP_NUM_WORKERS))})")
+    parser.add_argument("--stream", action="store_true",
+                       help="Simulate real-time satellite streaming through a VAD gate instead of the standard run")
+    parser.add_argument("--chunk-ms", type=_int_list, default=STREAM_CHUNK_MS, metavar="MS[,MS...]",
+                       help=f"Chunk sizes for --stream (default: {','.join(map(str, STREAM_CHUNK_MS))})")
     args = parser.parse_args()
 
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.workers > 1 and not args.cpu:
+        parser.error("--workers requires --cpu (workers would contend for one GPU)")
+    if args.batch_sizes and min(args.batch_sizes) < 1:
+        parser.error("--batch-sizes must be positive integers")
+    if args.sweep and (args.workers > 1 or args.batch_sizes):
+        parser.error("--sweep cannot be combined with --workers or --batch-sizes")
+    if args.stream and (args.sweep or args.workers > 1 or args.batch_sizes):
+        parser.error("--stream cannot be combined with --sweep, --workers or --batch-sizes")
+    if min(args.chunk_ms) < 1:
+        parser.error("--chunk-ms must be positive integers")
+
     # Determine device and compute type
     if args.cpu:
         device = "cpu"
@@ -423,20 +1305,109 @@ def main():
     total_duration = sum(a["duration"] for a in audio_files)
     print(f"Total audio duration: {total_duration:.2f} seconds")
 
+    # Preload: decode once into a memory-mapped file (tmpfs when available) shared by all workers
+    pcm_dir = None
+    decode_time_ms = None
+    if args.preload:
+        shm = Path("/dev/shm")
+        pcm_dir = Path(tempfile.mkdtemp(prefix="whisper-pcm-", dir=shm if shm.is_dir() else None))
+        decode_time_ms = preload_audio(audio_files, pcm_dir)
+        print(f"Decoded to {SAMPLE_RATE} Hz PCM in {decode_time_ms:.2f} ms "
+              f"({decode_time_ms / len(audio_files):.2f} ms/file, excluded from latencies)")
+
     # Run benchmarks
+    pool = None
+    core_sets: List[List[int]] = []
+    if args.workers > 1:
+        core_sets = plan_core_sets(args.workers)
+        # spawn: CTranslate2/OpenMP state must not be inherited through fork
+        context = multiprocessing.get_context("spawn")
+        core_queue = context.Queue()
+        for cores in core_sets:
+            core_queue.put(cores)
+        # Handed over at spawn: barriers cannot be pickled into submitted jobs
+        warm_barrier = context.Barrier(args.workers)
+        pool = ProcessPoolExecutor(
+            max_workers=args.workers,
+            mp_context=context,
+            initializer=_worker_init,
+            initargs=(core_queue, warm_barrier, compute_type,
+                      str(pcm_dir / "audio.npy") if pcm_dir else None),
+        )
+        print(f"\nWorker pool: {args.workers} processes, cores {core_sets}")
+
     all_results = []
-    for model_size in MODELS:
-        try:
-            result = benchmark_model(model_size, audio_files, device, compute_type)
-            all_results.append(result)
-        except Exception as e:
-            print(f"\nERROR benchmarking {model_size}: {e}")
-            import traceback
-            traceback.print_exc()
+    stream_entries: List[Dict[str, Any]] = []
+    sweep_entries: List[Dict[str, Any]] = []
+    sweep_config = None
+    if args.sweep:
+        cores = len(plan_core_sets(1)[0])
+        # cpu_threads is meaningless on GPU; 0 lets CTranslate2 pick
+        default_threads = sorted({max(1, cores // 2), cores}) if device == "cpu" else [0]
+        sweep_config = {
+            "compute_types": args.sweep_compute_types or SWEEP_COMPUTE_TYPES[device],
+            "beam_sizes": args.sweep_beam_sizes,
+            "cpu_threads": args.sweep_threads or default_threads,
+            "num_workers": args.sweep_num_workers,
+            "iterations": SWEEP_ITERATIONS
+        }
+        print(f"\nSweep grid: {sweep_config}")
+
+    try:
+        for model_size in MODELS:
+            try:
+                if args.sweep:
+                    print(f"\nSweeping: {model_size}")
+                    sweep_entries.extend(sweep_model(
+                        model_size, audio_files, device,
+                        sweep_config["compute_types"],
+                        sweep_config["beam_sizes"],
+                        sweep_config["cpu_threads"],
+                        sweep_config["num_workers"]
+                    ))
+                    continue
+                if args.stream:
+                    stream_entries.extend(benchmark_streaming(
+                        model_size, audio_files, device, compute_type, args.chunk_ms
+                    ))
+                    continue
+                if pool is not None:
+                    result = benchmark_model_parallel(
+                        model_size, audio_files, compute_type, pool, args.workers
+                    )
+                else:
+                    result = benchmark_model(model_size, audio_files, device, compute_type)
+                all_results.append(result)
+            except Exception as e:
+                print(f"\nERROR benchmarking {model_size}: {e}")
+                import traceback
+                traceback.print_exc()
+                continue
+
+            # A failed batch sweep must not discard the model's standard results
+            if args.batch_sizes:
+                try:
+                    result["batch_sweep"] = benchmark_batched(
+                        model_size, audio_files, device, compute_type, args.batch_sizes
+                    )
+                except Exception as e:
+                    print(f"\nERROR in batch sweep for {model_size}: {e}")
+                    import traceback
+                    traceback.print_exc()
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if pcm_dir is not None:
+            shutil.rmtree(pcm_dir, ignore_errors=True)
 
     # Save results
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_file = RESULTS_DIR / f"benchmark_{timestamp}.json"
+    samples_file = None
+    samples_by_model = {r["model"]: r.pop("samples") for r in all_results if "samples" in r}
+    if samples_by_model:
+        samples_file = RESULTS_DIR / f"benchmark_{timestamp}_samples.npz"
+        save_samples(samples_file, samples_by_model)
 
     # Build system info
     system_info = {
@@ -455,22 +1426,41 @@ def main():
             "device": device,
             "compute_type": compute_type,
             "iterations": ITERATIONS,
-            "models": MODELS
+            "models": MODELS,
+            "workers": args.workers,
+            "worker_cores": core_sets or None,
+            "preload": args.preload,
+            "batch_sizes": args.batch_sizes,
+            "sweep": sweep_config,
+            "stream": {
+                "chunk_ms": args.chunk_ms,
+                "vad_threshold_dbfs": STREAM_VAD_THRESHOLD_DBFS,
+                "end_silence_ms": STREAM_END_SILENCE_MS,
+                "pre_roll_ms": STREAM_PRE_ROLL_MS
+            } if args.stream else None
         },
         "audio": {
             "count": len(audio_files),
             "total_duration_sec": round(total_duration, 2),
+            "decode_time_ms": round(decode_time_ms, 2) if decode_time_ms is not None else None,
             "files": [
                 {
                     "filename": a["filename"],
                     "duration": round(a["duration"], 2),
-                    "sample_rate": a["sample_rate"]
+                    "sample_rate": a["sample_rate"],
+                    "decode_ms": round(a["decode_ms"], 2) if "decode_ms" in a else None
                 }
                 for a in audio_files
             ]
         },
+        "samples_file": samples_file.name if samples_file else None,
         "results": all_results
     }
+    if args.sweep:
+        mark_pareto(sweep_entries)
+        output_data["sweep"] = sweep_entries
+    if args.stream:
+        output_data["stream"] = stream_entries
 
     with open(output_file, "w", encoding="utf-8") as f:
         json.dump(output_data, f, indent=2, ensure_ascii=False)
@@ -479,15 +1469,26 @@ def main():
     print("BENCHMARK COMPLETE")
     print("=" * 60)
     print(f"\nResults saved to: {output_file}")
+    if samples_file:
+        print(f"Per-sample records: {samples_file}")
+    if sweep_entries:
+        print_pareto_table(sweep_entries)
     print("\nSummary:")
     for result in all_results:
         print(f"\n{result['model']}:")
         print(f"  Latency:      {result['mean_latency_ms']:.2f} ms (mean)")
         print(f"  Throughput:   {result['realtime_factor']:.1f}x realtime")
+        if "throughput_rps" in result:
+            print(f"  Aggregate:    {result['throughput_rps']:.2f} req/s, "
+                  f"{result['aggregate_realtime_factor']:.1f}x realtime ({result['workers']} workers)")
         if result['vram_used_mb'] is not None:
             print(f"  VRAM:         {result['vram_used_mb']} MB")
         if result['wer'] is not None:
             print(f"  WER:          {result['wer']:.2%}")
+        if "batch_sweep" in result:
+            best = max(result["batch_sweep"], key=lambda b: b["throughput_rps"])
+            print(f"  Best batch:   {best['batch_size']} "
+                  f"({best['throughput_rps']:.2f} req/s, {best['realtime_factor']:.1f}x realtime)")
 
 
 if __name__ == "__main__":
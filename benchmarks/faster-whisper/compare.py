@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Faster-Whisper Benchmark Comparison
+
+Indexes benchmark_*.json result files into a local SQLite store and compares
+two runs per model: deltas for mean/p95/p99 latency, RTF and WER, with
+bootstrap confidence intervals over the raw per-request latencies.
+
+Exits with status 1 when the candidate run is a statistically significant
+regression, so it can gate CI or a homelab upgrade.
+
+Only needs numpy, so it also runs outside the benchmark image:
+
+    python compare.py --results-dir ./results
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+RESULTS_DIR = Path("/results")
+DB_NAME = "benchmarks.sqlite"
+BOOTSTRAP_RESAMPLES = 10000
+CONFIDENCE = 0.95
+MIN_EFFECT_PCT = 5.0  # Ignore significant but negligible latency shifts
+WER_TOLERANCE = 0.02  # Absolute WER increase treated as a regression
+GATED_STATS = ("mean", "p95")  # p99 of a few dozen samples is too noisy to gate on
+# Runs only compare when these match: workers split the cores, preload drops decode time
+SETUP_COLUMNS = ("device", "compute_type", "hardware", "workers", "preload")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime REAL NOT NULL,
+    timestamp TEXT NOT NULL,
+    device TEXT,
+    compute_type TEXT,
+    workers INTEGER,
+    preload INTEGER,
+    platform TEXT,
+    hardware TEXT
+);
+CREATE TABLE IF NOT EXISTS model_results (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    model TEXT NOT NULL,
+    mean_latency_ms REAL,
+    p95_latency_ms REAL,
+    p99_latency_ms REAL,
+    realtime_factor REAL,
+    wer REAL,
+    PRIMARY KEY (run_id, model)
+);
+CREATE TABLE IF NOT EXISTS latencies (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    model TEXT NOT NULL,
+    latency_ms REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS latencies_run_model ON latencies (run_id, model);
+"""
+
+STATS = {
+    "mean": lambda samples: np.mean(samples, axis=-1),
+    "p95": lambda samples: np.percentile(samples, 95, axis=-1),
+    "p99": lambda samples: np.percentile(samples, 99, axis=-1),
+}
+
+
+def open_store(db_path: Path) -> sqlite3.Connection:
+    """Open (creating if needed) the results store."""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def index_results(conn: sqlite3.Connection, results_dir: Path) -> int:
+    """Add new or changed result files to the store. Returns how many were indexed."""
+    indexed = 0
+    for path in sorted(p.resolve() for p in results_dir.glob("benchmark_*.json")):
+        mtime = path.stat().st_mtime
+        row = conn.execute("SELECT mtime FROM runs WHERE path = ?", (str(path),)).fetchone()
+        if row is not None and row[0] == mtime:
+            continue
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Warning: Could not index {path}: {e}")
+            continue
+
+        config = data.get("config", {})
+        system = data.get("system", {})
+        with conn:
+            conn.execute("DELETE FROM runs WHERE path = ?", (str(path),))
+            run_id = conn.execute(
+                "INSERT INTO runs (path, mtime, timestamp, device, compute_type, workers, preload, platform, hardware)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    str(path),
+                    mtime,
+                    data.get("timestamp", path.stem.removeprefix("benchmark_")),
+                    config.get("device"),
+                    config.get("compute_type"),
+                    config.get("workers", 1),
+                    int(bool(config.get("preload"))),
+                    system.get("platform"),
+                    system.get("gpu_name") or system.get("cpu"),
+                ),
+            ).lastrowid
+            for result in data.get("results", []):
+                conn.execute(
+                    "INSERT INTO model_results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        run_id,
+                        result["model"],
+                        result.get("mean_latency_ms"),
+                        result.get("p95_latency_ms"),
+                        result.get("p99_latency_ms"),
+                        result.get("realtime_factor"),
+                        result.get("wer"),
+                    ),
+                )
+                conn.executemany(
+                    "INSERT INTO latencies VALUES (?, ?, ?)",
+                    [(run_id, result["model"], latency) for latency in result.get("latencies_ms", [])],
+                )
+        indexed += 1
+    return indexed
+
+
+def resolve_run(conn: sqlite3.Connection, ref: str) -> Optional[Dict[str, Any]]:
+    """Find a run by file path, file name or timestamp."""
+    row = conn.execute(
+        "SELECT * FROM runs WHERE path = ? OR path LIKE ? OR timestamp = ?"
+        " ORDER BY timestamp DESC LIMIT 1",
+        (str(Path(ref).resolve()), f"%/{Path(ref).name}", ref),
+    ).fetchone()
+    return _run_dict(conn, row)
+
+
+def latest_runs(
+    conn: sqlite3.Connection,
+    before: Optional[str] = None,
+    like: Optional[Dict[str, Any]] = None
+) -> Optional[Dict[str, Any]]:
+    """Newest run with model results, optionally older than ``before`` and on the same setup as ``like``."""
+    query = "SELECT * FROM runs WHERE id IN (SELECT run_id FROM model_results)"
+    params: List[Any] = []
+    if before is not None:
+        query += " AND timestamp < ?"
+        params.append(before)
+    if like is not None:
+        query += "".join(f" AND {column} IS ?" for column in SETUP_COLUMNS)
+        params.extend(like[column] for column in SETUP_COLUMNS)
+    row = conn.execute(query + " ORDER BY timestamp DESC LIMIT 1", params).fetchone()
+    return _run_dict(conn, row)
+
+
+def setup_mismatches(baseline: Dict[str, Any], candidate: Dict[str, Any]) -> List[str]:
+    """Setup columns two runs differ on, as "column: baseline -> candidate"."""
+    return [
+        f"{column}: {baseline[column]} -> {candidate[column]}"
+        for column in SETUP_COLUMNS
+        if baseline[column] != candidate[column]
+    ]
+
+
+def _run_dict(conn: sqlite3.Connection, row: Optional[tuple]) -> Optional[Dict[str, Any]]:
+    if row is None:
+        return None
+    columns = [c[0] for c in conn.execute("SELECT * FROM runs LIMIT 0").description]
+    return dict(zip(columns, row))
+
+
+def load_model_results(conn: sqlite3.Connection, run_id: int) -> Dict[str, Dict[str, Any]]:
+    """Summary metrics and raw latencies per model for one run."""
+    models = {}
+    for model, mean, p95, p99, rtf, wer_score in conn.execute(
+        "SELECT model, mean_latency_ms, p95_latency_ms, p99_latency_ms, realtime_factor, wer"
+        " FROM model_results WHERE run_id = ?",
+        (run_id,),
+    ):
+        latencies = np.array([
+            r[0] for r in conn.execute(
+                "SELECT latency_ms FROM latencies WHERE run_id = ? AND model = ?", (run_id, model)
+            )
+        ])
+        models[model] = {
+            "mean": mean, "p95": p95, "p99": p99,
+            "realtime_factor": rtf, "wer": wer_score, "latencies": latencies,
+        }
+    return models
+
+
+def bootstrap_delta(
+    baseline: np.ndarray,
+    candidate: np.ndarray,
+    stat: str,
+    resamples: int = BOOTSTRAP_RESAMPLES,
+    confidence: float = CONFIDENCE,
+    seed: int = 0
+) -> Tuple[float, float]:
+    """Percentile bootstrap CI for stat(candidate) - stat(baseline) in ms."""
+    rng = np.random.default_rng(seed)
+    stat_fn = STATS[stat]
+    base = stat_fn(baseline[rng.integers(0, len(baseline), (resamples, len(baseline)))])
+    cand = stat_fn(candidate[rng.integers(0, len(candidate), (resamples, len(candidate)))])
+    alpha = (1 - confidence) / 2 * 100
+    low, high = np.percentile(cand - base, [alpha, 100 - alpha])
+    return float(low), float(high)
+
+
+def compare_runs(
+    baseline: Dict[str, Dict[str, Any]],
+    candidate: Dict[str, Dict[str, Any]],
+    resamples: int = BOOTSTRAP_RESAMPLES,
+    confidence: float = CONFIDENCE,
+    min_effect_pct: float = MIN_EFFECT_PCT,
+    wer_tolerance: float = WER_TOLERANCE
+) -> List[Dict[str, Any]]:
+    """Per-model deltas; each row lists the regressions it found."""
+    rows = []
+    for model in sorted(baseline.keys() & candidate.keys()):
+        base, cand = baseline[model], candidate[model]
+        has_raw = len(base["latencies"]) > 1 and len(cand["latencies"]) > 1
+        row: Dict[str, Any] = {"model": model, "regressions": []}
+
+        for stat, stat_fn in STATS.items():
+            if has_raw:
+                # Point estimates from the same samples the CI is built from
+                base_value = float(stat_fn(base["latencies"]))
+                cand_value = float(stat_fn(cand["latencies"]))
+                ci = bootstrap_delta(base["latencies"], cand["latencies"], stat, resamples, confidence)
+            else:
+                base_value, cand_value, ci = base[stat], cand[stat], None
+            delta = _delta(base_value, cand_value)
+            row[stat] = {"baseline": base_value, "candidate": cand_value, "delta": delta, "ci": ci}
+            if (
+                stat in GATED_STATS and ci is not None and ci[0] > 0
+                and base_value and delta / base_value * 100 >= min_effect_pct
+            ):
+                row["regressions"].append(f"{stat} latency +{delta:.1f} ms")
+
+        row["realtime_factor"] = {
+            "baseline": base["realtime_factor"], "candidate": cand["realtime_factor"],
+            "delta": _delta(base["realtime_factor"], cand["realtime_factor"]),
+        }
+        wer_delta = _delta(base["wer"], cand["wer"])
+        row["wer"] = {"baseline": base["wer"], "candidate": cand["wer"], "delta": wer_delta}
+        if wer_delta is not None and wer_delta > wer_tolerance:
+            row["regressions"].append(f"WER +{wer_delta:.2%}")
+        row["bootstrap"] = has_raw
+        rows.append(row)
+    return rows
+
+
+def _delta(baseline: Optional[float], candidate: Optional[float]) -> Optional[float]:
+    if baseline is None or candidate is None:
+        return None
+    return candidate - baseline
+
+
+def _fmt_delta(value: Optional[float], fmt: str = "+.1f") -> str:
+    return "n/a" if value is None else format(value, fmt)
+
+
+def print_report(baseline_run: Dict[str, Any], candidate_run: Dict[str, Any], rows: List[Dict[str, Any]]) -> None:
+    """Print the per-model comparison."""
+    print("=" * 60)
+    print("BENCHMARK COMPARISON")
+    print("=" * 60)
+    print(f"Baseline:  {baseline_run['timestamp']} ({baseline_run['device']}/{baseline_run['compute_type']})")
+    print(f"Candidate: {candidate_run['timestamp']} ({candidate_run['device']}/{candidate_run['compute_type']})")
+
+    for row in rows:
+        print(f"\n{row['model']}:")
+        for stat in STATS:
+            entry = row[stat]
+            ci = entry["ci"]
+            ci_label = f"  CI [{ci[0]:+.1f}, {ci[1]:+.1f}]" if ci else ""
+            print(f"  {stat:<5} latency: {entry['baseline']:.2f} -> {entry['candidate']:.2f} ms "
+                  f"({_fmt_delta(entry['delta'])} ms){ci_label}")
+        rtf = row["realtime_factor"]
+        print(f"  RTF:           {rtf['baseline']:.1f}x -> {rtf['candidate']:.1f}x "
+              f"({_fmt_delta(rtf['delta'])})")
+        wer_entry = row["wer"]
+        if wer_entry["baseline"] is not None and wer_entry["candidate"] is not None:
+            print(f"  WER:           {wer_entry['baseline']:.2%} -> {wer_entry['candidate']:.2%}")
+        if not row["bootstrap"]:
+            print("  (no raw latencies in one of the runs - confidence intervals skipped)")
+        for regression in row["regressions"]:
+            print(f"  ✗ REGRESSION: {regression}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Index results and compare two runs; returns the process exit code."""
+    parser = argparse.ArgumentParser(
+        prog="benchmark.py compare",
+        description="Compare two faster-whisper benchmark runs"
+    )
+    parser.add_argument("--results-dir", type=Path, default=RESULTS_DIR,
+                       help="Directory with benchmark_*.json files (default: /results)")
+    parser.add_argument("--db", type=Path, default=None,
+                       help=f"SQLite store (default: <results-dir>/{DB_NAME})")
+    parser.add_argument("--baseline", default=None,
+                       help="Baseline run: file path, file name or timestamp (default: previous run on the same setup)")
+    parser.add_argument("--candidate", default=None,
+                       help="Candidate run: file path, file name or timestamp (default: newest run)")
+    parser.add_argument("--confidence", type=float, default=CONFIDENCE,
+                       help=f"Bootstrap confidence level (default: {CONFIDENCE})")
+    parser.add_argument("--resamples", type=int, default=BOOTSTRAP_RESAMPLES,
+                       help=f"Bootstrap resamples (default: {BOOTSTRAP_RESAMPLES})")
+    parser.add_argument("--min-effect-pct", type=float, default=MIN_EFFECT_PCT,
+                       help=f"Smallest latency increase in %% that counts as a regression (default: {MIN_EFFECT_PCT})")
+    parser.add_argument("--wer-tolerance", type=float, default=WER_TOLERANCE,
+                       help=f"Largest absolute WER increase tolerated (default: {WER_TOLERANCE})")
+    args = parser.parse_args(argv)
+
+    conn = open_store(args.db or args.results_dir / DB_NAME)
+    indexed = index_results(conn, args.results_dir)
+    total = conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+    print(f"Indexed {indexed} new result file(s), {total} run(s) in store\n")
+
+    candidate = resolve_run(conn, args.candidate) if args.candidate else latest_runs(conn)
+    if candidate is None:
+        print("ERROR: No candidate run found")
+        return 2
+    if args.baseline:
+        baseline = resolve_run(conn, args.baseline)
+    else:
+        baseline = latest_runs(conn, before=candidate["timestamp"], like=candidate)
+    if baseline is None:
+        print(f"ERROR: No baseline run found for {candidate['timestamp']}")
+        return 2
+
+    rows = compare_runs(
+        load_model_results(conn, baseline["id"]),
+        load_model_results(conn, candidate["id"]),
+        resamples=args.resamples,
+        confidence=args.confidence,
+        min_effect_pct=args.min_effect_pct,
+        wer_tolerance=args.wer_tolerance,
+    )
+    if not rows:
+        print("ERROR: Runs have no models in common")
+        return 2
+
+    mismatches = setup_mismatches(baseline, candidate)
+    if mismatches:
+        print("WARNING: Runs differ in setup, latency deltas may not be comparable:")
+        for mismatch in mismatches:
+            print(f"  {mismatch}")
+        print()
+
+    print_report(baseline, candidate, rows)
+
+    regressed = [row["model"] for row in rows if row["regressions"]]
+    print("\n" + "=" * 60)
+    if regressed:
+        print(f"REGRESSION in: {', '.join(regressed)}")
+        print("=" * 60)
+        return 1
+    print("NO SIGNIFICANT REGRESSION")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Faster-Whisper Benchmark Report
+
+Reads the per-sample records (benchmark_*_samples.npz) written next to each
+result file and summarises how latency scales with audio duration:
+fixed overhead and ms per audio second from a linear fit, plus time to first
+segment. With matplotlib installed it also plots latency and time to first
+segment against duration for every model.
+
+    python report.py --results-dir ./results
+    python report.py ./results/benchmark_20260107_143022_samples.npz
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+RESULTS_DIR = Path("/results")
+
+
+def load_samples(path: Path) -> Dict[str, Dict[str, np.ndarray]]:
+    """Per-model columns from a samples file."""
+    with np.load(path) as data:
+        columns = {name: data[name] for name in data.files}
+    return {
+        model: {name: values[columns["model"] == model] for name, values in columns.items()}
+        for model in dict.fromkeys(columns["model"].tolist())
+    }
+
+
+def latest_samples_file(results_dir: Path) -> Optional[Path]:
+    """Newest samples file in the results directory."""
+    files = sorted(results_dir.glob("benchmark_*_samples.npz"))
+    return files[-1] if files else None
+
+
+def summarize(samples: Dict[str, np.ndarray]) -> Dict[str, float]:
+    """Linear latency-vs-duration fit and first-segment stats for one model."""
+    duration = samples["duration_sec"].astype(np.float64)
+    latency = samples["latency_ms"].astype(np.float64)
+    if np.ptp(duration) > 0:
+        ms_per_sec, overhead_ms = np.polyfit(duration, latency, 1)
+    else:
+        ms_per_sec, overhead_ms = np.nan, float(np.mean(latency))
+    first_segment = samples["first_segment_ms"][~np.isnan(samples["first_segment_ms"])]
+    return {
+        "samples": len(latency),
+        "overhead_ms": float(overhead_ms),
+        "ms_per_audio_sec": float(ms_per_sec),
+        "p95_latency_ms": float(np.percentile(latency, 95)),
+        "median_first_segment_ms": float(np.median(first_segment)) if len(first_segment) else np.nan,
+        "mean_segments": float(np.mean(samples["segments"]))
+    }
+
+
+def plot(models: Dict[str, Dict[str, np.ndarray]], output: Path, title: str) -> bool:
+    """Scatter latency and time to first segment against duration; False without matplotlib."""
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        return False
+
+    fig, (latency_ax, first_ax) = plt.subplots(1, 2, figsize=(12, 5), sharex=True)
+    for model, samples in models.items():
+        duration = samples["duration_sec"]
+        points = latency_ax.scatter(duration, samples["latency_ms"], s=12, alpha=0.6, label=model)
+        stats = summarize(samples)
+        if not np.isnan(stats["ms_per_audio_sec"]):
+            xs = np.linspace(0, duration.max(), 2)
+            latency_ax.plot(xs, stats["overhead_ms"] + stats["ms_per_audio_sec"] * xs,
+                            color=points.get_facecolor()[0], linewidth=1)
+        first_ax.scatter(duration, samples["first_segment_ms"], s=12, alpha=0.6, label=model)
+
+    latency_ax.set(xlabel="Audio duration (s)", ylabel="Latency (ms)", title="Latency vs duration")
+    first_ax.set(xlabel="Audio duration (s)", ylabel="Time to first segment (ms)",
+                 title="First segment vs duration")
+    latency_ax.legend()
+    fig.suptitle(title)
+    fig.tight_layout()
+    fig.savefig(output, dpi=120)
+    plt.close(fig)
+    return True
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Print the per-model summary and write the plot; returns the exit code."""
+    parser = argparse.ArgumentParser(
+        prog="benchmark.py report",
+        description="Latency-vs-duration report from per-sample benchmark records"
+    )
+    parser.add_argument("samples", nargs="?", type=Path, default=None,
+                       help="Samples file (default: newest in --results-dir)")
+    parser.add_argument("--results-dir", type=Path, default=RESULTS_DIR,
+                       help="Directory with benchmark_*_samples.npz files (default: /results)")
+    parser.add_argument("--output", type=Path, default=None,
+                       help="Plot file (default: samples file with .png suffix)")
+    args = parser.parse_args(argv)
+
+    path = args.samples or latest_samples_file(args.results_dir)
+    if path is None or not path.exists():
+        print(f"ERROR: No samples file found in {args.results_dir}")
+        return 1
+
+    models = load_samples(path)
+    print("=" * 60)
+    print(f"LATENCY REPORT: {path.name}")
+    print("=" * 60)
+    print(f"{'model':<10} {'n':>5} {'overhead':>10} {'ms/audio s':>11} {'p95':>10} {'1st seg':>9} {'segs':>5}")
+    for model, samples in models.items():
+        stats = summarize(samples)
+        print(f"{model:<10} {stats['samples']:>5} {stats['overhead_ms']:>8.0f}ms "
+              f"{stats['ms_per_audio_sec']:>11.1f} {stats['p95_latency_ms']:>8.0f}ms "
+              f"{stats['median_first_segment_ms']:>7.0f}ms {stats['mean_segments']:>5.1f}")
+
+    output = args.output or path.with_suffix(".png")
+    if plot(models, output, path.stem):
+        print(f"\nPlot saved to: {output}")
+    else:
+        print("\nmatplotlib not installed - skipping plot (pip install matplotlib)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
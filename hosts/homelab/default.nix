@@ -462,6 +462,13 @@ in {
         metrics_path = "/api/prometheus";
         bearer_token_file = config.sops.secrets."home-assistant-prometheus-token".path;
       }
+      {
+        # claude_brain per-phase latency histograms (custom component view)
+        job_name = "claude_brain";
+        static_configs = [{targets = ["localhost:8123"];}];
+        metrics_path = "/api/claude_brain/metrics";
+        bearer_token_file = config.sops.secrets."home-assistant-prometheus-token".path;
+      }
       {
         job_name = "postgresql";
         static_configs = [{targets = ["localhost:9187"];}];
@@ -20,6 +20,12 @@ in {
         max = 255;
         initial = "";
       };
+      # Answer so far while streaming, cleared once claude_response is set
+      claude_response_partial = {
+        name = "Claude Partial Response";
+        max = 255;
+        initial = "";
+      };
       claude_pending_action = {
         name = "Claude Pending Action Description";
         max = 255;
@@ -35,7 +41,17 @@ in {
     # ===========================================
     # Claude Brain Component
     # ===========================================
-    claude_brain = {};
+    claude_brain = {
+      # Ask for NDJSON/SSE so long answers are not cut off by the per-request
+      # timeout. Partial text fires claude_brain_response_delta events and
+      # fills claude_response_partial (shown by the conversation state
+      # sensor); intents still speak the final claude_response. Servers
+      # answering plain JSON are handled transparently
+      stream = true;
+      # Response cache is off (cache_ttl = 0). When enabled, only answers the
+      # server marks "cacheable": true are stored, so it must set that on
+      # read-only answers and never on anything that ran an action
+    };
 
     # ===========================================
     # Command Line Sensor - Server Health
@@ -63,6 +79,8 @@ in {
             state = ''
               {% if is_state('input_boolean.claude_awaiting_confirmation', 'on') %}
                 awaiting_confirmation
+              {% elif states('input_text.claude_response_partial') | length > 0 %}
+                responding
               {% elif states('input_text.claude_session') | length > 0 %}
                 active_session
               {% else %}
@@ -72,6 +90,7 @@ in {
             attributes = {
               session_id = "{{ states('input_text.claude_session') }}";
               last_response = "{{ states('input_text.claude_response') }}";
+              partial_response = "{{ states('input_text.claude_response_partial') }}";
               pending_action = "{{ states('input_text.claude_pending_action') }}";
               server_status = "{{ states('sensor.claude_server_status') }}";
             };
@@ -1,213 +1,475 @@
 """Claude Brain integration for Home Assistant."""
 import logging
 import asyncio
-from typing import Final
+import time
+from datetime import timedelta
+from typing import Any, Final
 import aiohttp
 import voluptuous as vol
 
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_CLOSE,
+    EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
+    Platform,
+)
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers import discovery
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util.ssl import client_context
 
+from .breaker import BreakerState, CircuitBreaker
+from .cache import ResponseCache, normalize_query
+from .client import (
+    ClaudeBrainClient,
+    ClaudeBrainServerError,
+    ClaudeBrainUnavailableError,
+)
 from .const import (
     DOMAIN,
+    ATTR_SATELLITE_ID,
+    CONF_BREAKER_RESET,
+    CONF_BREAKER_THRESHOLD,
+    CONF_CACHE_SIZE,
+    CONF_CACHE_TTL,
+    CONF_KEEPALIVE,
+    CONF_POOL_SIZE,
+    CONF_PREFETCH,
+    CONF_STREAM,
+    CONF_URL,
+    DEFAULT_BREAKER_RESET,
+    DEFAULT_BREAKER_THRESHOLD,
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_KEEPALIVE,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_SESSION_KEY,
+    DNS_CACHE_TTL,
+    POOL_WARM_CONNECTIONS,
+    SATELLITE_DOMAIN,
+    SATELLITE_LISTENING,
     SERVER_URL,
-    TIMEOUT,
+    SESSION_IDLE_TIMEOUT,
+    SIGNAL_STATE_UPDATED,
+    STREAM_UPDATE_INTERVAL,
+    EVENT_RESPONSE,
+    EVENT_RESPONSE_DELTA,
+    WARMUP_MIN_INTERVAL,
+    INPUT_TEXT_MAX_LENGTH,
     INPUT_TEXT_SESSION,
     INPUT_TEXT_RESPONSE,
+    INPUT_TEXT_RESPONSE_PARTIAL,
     INPUT_TEXT_PENDING_ACTION,
     INPUT_BOOLEAN_AWAITING,
 )
+from .metrics import ClaudeBrainMetricsView, Metrics, PhaseTimer
+from .pool import ConnectionPool
+from .sessions import ConversationSession, SessionTable
+from .singleflight import SingleFlight
+from .state import StatePublisher
 
 _LOGGER = logging.getLogger(__name__)
 
 SERVICE_ASK = "ask"
 SERVICE_CONFIRM = "confirm"
 SERVICE_CANCEL = "cancel"
+# Metrics label for wake-word warm-ups (not a registered service)
+METRIC_WARMUP = "warmup"
+
+CONFIG_SCHEMA = vol.Schema({
+    DOMAIN: vol.Schema({
+        vol.Optional(CONF_URL, default=SERVER_URL): cv.url,
+        vol.Optional(CONF_STREAM, default=False): cv.boolean,
+        vol.Optional(CONF_PREFETCH, default=True): cv.boolean,
+        vol.Optional(CONF_POOL_SIZE, default=DEFAULT_POOL_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=32)
+        ),
+        vol.Optional(CONF_KEEPALIVE, default=DEFAULT_KEEPALIVE): vol.All(
+            vol.Coerce(int), vol.Range(min=10, max=600)
+        ),
+        vol.Optional(CONF_CACHE_TTL, default=DEFAULT_CACHE_TTL): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=3600)
+        ),
+        vol.Optional(CONF_CACHE_SIZE, default=DEFAULT_CACHE_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=1024)
+        ),
+        vol.Optional(CONF_BREAKER_THRESHOLD, default=DEFAULT_BREAKER_THRESHOLD): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=20)
+        ),
+        vol.Optional(CONF_BREAKER_RESET, default=DEFAULT_BREAKER_RESET): vol.All(
+            vol.Coerce(int), vol.Range(min=5, max=600)
+        ),
+    }),
+}, extra=vol.ALLOW_EXTRA)
 
 ASK_SCHEMA = vol.Schema({
     vol.Required("query"): cv.string,
+    vol.Optional(ATTR_SATELLITE_ID): cv.string,
 })
 
+SESSION_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_SATELLITE_ID): cv.string,
+})
+
+def _error_kind(err: Exception) -> str:
+    """Classify an error for the errors_total counter."""
+    if isinstance(err, ClaudeBrainUnavailableError):
+        return "unavailable"
+    if isinstance(err, asyncio.TimeoutError):
+        return "timeout"
+    return "other"
+
+
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up Claude Brain component."""
+    conf = config.get(DOMAIN, {})
+    keepalive = conf.get(CONF_KEEPALIVE, DEFAULT_KEEPALIVE)
+    pool = ConnectionPool(
+        size=conf.get(CONF_POOL_SIZE, DEFAULT_POOL_SIZE),
+        keepalive=keepalive,
+        dns_ttl=DNS_CACHE_TTL,
+        ssl_context=client_context(),
+        headers={aiohttp.hdrs.USER_AGENT: SERVER_SOFTWARE},
+    )
+    breaker = CircuitBreaker(
+        failure_threshold=conf.get(CONF_BREAKER_THRESHOLD, DEFAULT_BREAKER_THRESHOLD),
+        reset_timeout=conf.get(CONF_BREAKER_RESET, DEFAULT_BREAKER_RESET),
+        on_change=lambda: async_dispatcher_send(hass, SIGNAL_STATE_UPDATED),
+    )
+    client = ClaudeBrainClient(
+        pool.session,
+        breaker,
+        url=conf.get(CONF_URL, SERVER_URL),
+        stream=conf.get(CONF_STREAM, False),
+    )
+    cache = ResponseCache(
+        max_size=conf.get(CONF_CACHE_SIZE, DEFAULT_CACHE_SIZE),
+        ttl=conf.get(CONF_CACHE_TTL, DEFAULT_CACHE_TTL),
+    )
+    inflight = SingleFlight()
+    metrics = Metrics()
+    sessions = SessionTable(idle_timeout=SESSION_IDLE_TIMEOUT)
+    hass.data[DOMAIN] = {
+        "pool": pool,
+        "breaker": breaker,
+        "client": client,
+        "cache": cache,
+        "inflight": inflight,
+        "sessions": sessions,
+        "metrics": metrics,
+    }
+    hass.http.register_view(ClaudeBrainMetricsView(metrics))
+
+    async def _async_warm_pool() -> None:
+        """Open connections up front so the first voice command skips TCP setup."""
+        await asyncio.gather(*(client.async_health() for _ in range(POOL_WARM_CONNECTIONS)))
+
+    async def _async_keepalive(_now) -> None:
+        """Ping before idle pooled connections hit the keep-alive timeout."""
+        await client.async_health()
+
+    hass.async_create_background_task(_async_warm_pool(), f"{DOMAIN}_warm_pool")
+    cancel_keepalive = async_track_time_interval(
+        hass, _async_keepalive, timedelta(seconds=keepalive / 2)
+    )
+
+    @callback
+    def _async_stop(_event: Event) -> None:
+        cancel_keepalive()
+
+    async def _async_close(_event: Event) -> None:
+        # Same stage as HA's own sessions, so calls made while stopping still work
+        await pool.async_close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close)
+
+    last_warmup: dict[str, float] = {}
+
+    async def _async_warmup(session_id: str) -> None:
+        """Warm the server session while STT is still running."""
+        timer = PhaseTimer()
+        warmed = await client.async_warmup(session_id, timer=timer)
+        metrics.record(METRIC_WARMUP, timer, None if warmed else "other")
+
+    @callback
+    def _is_satellite_wake(event_data: EventStateChangedData) -> bool:
+        """Match a satellite entering 'listening' (wake word just fired)."""
+        new_state = event_data["new_state"]
+        old_state = event_data["old_state"]
+        return (
+            event_data["entity_id"].startswith(f"{SATELLITE_DOMAIN}.")
+            and new_state is not None
+            and new_state.state == SATELLITE_LISTENING
+            and (old_state is None or old_state.state != SATELLITE_LISTENING)
+        )
+
+    @callback
+    def _async_satellite_woke(event: Event[EventStateChangedData]) -> None:
+        """Start a warm-up so the LLM round-trip overlaps speech recognition."""
+        if breaker.state is not BreakerState.CLOSED:
+            return
+
+        entry = er.async_get(hass).async_get(event.data["entity_id"])
+        key = entry.device_id if entry is not None and entry.device_id else DEFAULT_SESSION_KEY
+        if (session := sessions.peek(key)) is not None:
+            session_id = session.session_id
+        else:
+            # Satellites without their own session ask through the shared helpers
+            key = DEFAULT_SESSION_KEY
+            session_state = hass.states.get(INPUT_TEXT_SESSION)
+            session_id = session_state.state if session_state else ""
+
+        now = hass.loop.time()
+        if now - last_warmup.get(key, 0.0) < WARMUP_MIN_INTERVAL:
+            return
+        last_warmup[key] = now
+
+        hass.async_create_background_task(_async_warmup(session_id), f"{DOMAIN}_warmup")
+
+    if conf.get(CONF_PREFETCH, True):
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED, _async_satellite_woke, event_filter=_is_satellite_wake
+        )
+
+    async def _async_set_response(value: str) -> None:
+        """Write the response helper immediately (validation errors)."""
+        await hass.services.async_call(
+            "input_text", "set_value",
+            {"entity_id": INPUT_TEXT_RESPONSE, "value": value},
+            blocking=True,
+        )
+
+    def _get_session(call: ServiceCall) -> tuple[str, ConversationSession]:
+        """Return the session key and state for the calling satellite."""
+        key = call.data.get(ATTR_SATELLITE_ID, DEFAULT_SESSION_KEY)
+        return key, sessions.get(key)
+
+    def _load_shared_session(session: ConversationSession) -> None:
+        """Refresh the shared session from its helpers (automations may reset them)."""
+        session_state = hass.states.get(INPUT_TEXT_SESSION)
+        pending_state = hass.states.get(INPUT_TEXT_PENDING_ACTION)
+        session.session_id = session_state.state if session_state else ""
+        session.pending_action = pending_state.state if pending_state else ""
+        session.awaiting_confirmation = hass.states.is_state(INPUT_BOOLEAN_AWAITING, "on")
+
+    async def _async_publish(key: str, session: ConversationSession) -> None:
+        """Mirror the shared session into its helpers.
 
-    async def async_ask_claude(call: ServiceCall) -> None:
+        Satellite sessions are only returned as service responses, so
+        parallel rooms never touch the global helpers.
+        """
+        if key != DEFAULT_SESSION_KEY:
+            return
+
+        publisher = StatePublisher(hass)
+        publisher.set_text(INPUT_TEXT_SESSION, session.session_id)
+        # input_text rejects longer values; the service response keeps the full text
+        publisher.set_text(INPUT_TEXT_RESPONSE, session.response[:INPUT_TEXT_MAX_LENGTH])
+        publisher.set_text(INPUT_TEXT_RESPONSE_PARTIAL, "")
+        publisher.set_text(INPUT_TEXT_PENDING_ACTION, session.pending_action[:INPUT_TEXT_MAX_LENGTH])
+        publisher.set_flag(INPUT_BOOLEAN_AWAITING, session.awaiting_confirmation)
+        await publisher.async_flush()
+
+    async def async_ask_claude(call: ServiceCall) -> ServiceResponse:
         """Ask Claude a question."""
         query = str(call.data.get("query", "")).strip()
+        key, session = _get_session(call)
 
         # Validate query
         if not query:
             _LOGGER.warning("Empty query for Claude Brain 'ask'")
-            await hass.services.async_call(
-                "input_text", "set_value",
-                {"entity_id": INPUT_TEXT_RESPONSE, "value": "Przepraszam, nie zrozumiałem pytania"},
-                blocking=True,
-            )
-            return
+            message = "Przepraszam, nie zrozumiałem pytania"
+            if key == DEFAULT_SESSION_KEY:
+                await _async_set_response(message)
+            return {"text": message} if call.return_response else None
 
         if len(query) > 500:
             _LOGGER.warning("Truncating query (len=%d)", len(query))
             query = query[:500]
 
-        session_state = hass.states.get(INPUT_TEXT_SESSION)
-        session_id = session_state.state if session_state else ""
-
-        session = async_get_clientsession(hass)
-
-        try:
-            async with asyncio.timeout(TIMEOUT):
-                async with session.post(
-                    f"{SERVER_URL}/ask",
-                    json={"query": query, "session_id": session_id},
-                ) as resp:
-                    if resp.status != 200:
-                        _LOGGER.error("Claude server returned status %d: %s", resp.status, await resp.text())
-                        await hass.services.async_call(
-                            "input_text", "set_value",
-                            {"entity_id": INPUT_TEXT_RESPONSE, "value": "Przepraszam, wystąpił błąd serwera"},
-                            blocking=True,
-                        )
-                        return
-
-                    data = await resp.json()
-
-                    # Update HA state
-                    await hass.services.async_call(
-                        "input_text", "set_value",
-                        {"entity_id": INPUT_TEXT_SESSION, "value": data.get("session_id", "")},
-                        blocking=True,
-                    )
-                    await hass.services.async_call(
-                        "input_text", "set_value",
-                        {"entity_id": INPUT_TEXT_RESPONSE, "value": data.get("text", "")},
-                        blocking=True,
+        # Identical concurrent queries from one caller share a request;
+        # anything else queues on that caller's session lock.
+        response = await inflight.async_do(
+            (key, normalize_query(query)),
+            lambda: _async_process_ask(key, session, query),
+        )
+        return response if call.return_response else None
+
+    async def _async_process_ask(
+        key: str, session: ConversationSession, query: str
+    ) -> dict[str, Any]:
+        """Send one query and publish its answer."""
+        timer = PhaseTimer()
+        error: str | None = None
+
+        async with session.lock:
+            timer.add("queue", timer.total_ms())
+            if key == DEFAULT_SESSION_KEY:
+                _load_shared_session(session)
+
+            last_partial = 0.0
+
+            async def _on_delta(delta: str, text: str) -> None:
+                """Fire partial text as an event and mirror it into the partial helper.
+
+                claude_response only gets the final answer, since intents gate
+                on it being non-empty. The partial helper is throttled and
+                cleared again when the final answer is published.
+                """
+                nonlocal last_partial
+                hass.bus.async_fire(
+                    EVENT_RESPONSE_DELTA,
+                    {"delta": delta, "text": text, ATTR_SATELLITE_ID: key},
+                )
+                now = time.monotonic()
+                if key != DEFAULT_SESSION_KEY or now - last_partial < STREAM_UPDATE_INTERVAL:
+                    return
+                last_partial = now
+                publisher = StatePublisher(hass)
+                publisher.set_text(INPUT_TEXT_RESPONSE_PARTIAL, text[:INPUT_TEXT_MAX_LENGTH])
+                await publisher.async_flush()
+
+            try:
+                cache_key = cache.key(query, session.session_id)
+                data = cache.get(cache_key) if cache.enabled else None
+                if data is None:
+                    data = await client.async_ask(
+                        {"query": query, "session_id": session.session_id},
+                        on_delta=_on_delta,
+                        timer=timer,
                     )
+                    if cache.enabled:
+                        # Follow-ups are asked in the session the server returned
+                        cache.put(cache.key(query, data.get("session_id", "")), data)
+
+                session.session_id = data.get("session_id", "")
+                session.response = data.get("text", "")
+
+                # Handle permission request
+                if data.get("requires_permission"):
+                    session.pending_action = data.get("action_description", "")
+                    session.awaiting_confirmation = True
 
-                    # Handle permission request
-                    if data.get("requires_permission"):
-                        await hass.services.async_call(
-                            "input_text", "set_value",
-                            {"entity_id": INPUT_TEXT_PENDING_ACTION, "value": data.get("action_description", "")},
-                            blocking=True,
-                        )
-                        await hass.services.async_call(
-                            "input_boolean", "turn_on",
-                            {"entity_id": INPUT_BOOLEAN_AWAITING},
-                            blocking=True,
-                        )
-        except asyncio.TimeoutError:
-            _LOGGER.error("Timeout calling Claude server")
-            await hass.services.async_call(
-                "input_text", "set_value",
-                {"entity_id": INPUT_TEXT_RESPONSE, "value": "Przepraszam, nie mogę teraz odpowiedzieć"},
-                blocking=True,
-            )
-        except Exception as err:
-            _LOGGER.error("Error calling Claude server: %s", err)
-            await hass.services.async_call(
-                "input_text", "set_value",
-                {"entity_id": INPUT_TEXT_RESPONSE, "value": "Przepraszam, wystąpił błąd"},
-                blocking=True,
-            )
-
-    async def async_confirm_claude(call: ServiceCall) -> None:
+                hass.bus.async_fire(EVENT_RESPONSE, {
+                    "text": session.response,
+                    "session_id": session.session_id,
+                    "requires_permission": bool(data.get("requires_permission")),
+                    ATTR_SATELLITE_ID: key,
+                })
+            except ClaudeBrainServerError as err:
+                _LOGGER.error("%s", err)
+                error = "server"
+                session.response = "Przepraszam, wystąpił błąd serwera"
+            except ClaudeBrainUnavailableError:
+                _LOGGER.warning("Claude server unavailable, answering without calling it")
+                error = "unavailable"
+                session.response = "Przepraszam, nie mogę teraz odpowiedzieć"
+            except asyncio.TimeoutError:
+                _LOGGER.error("Timeout calling Claude server")
+                error = "timeout"
+                session.response = "Przepraszam, nie mogę teraz odpowiedzieć"
+            except Exception as err:
+                _LOGGER.error("Error calling Claude server: %s", err)
+                error = "other"
+                session.response = "Przepraszam, wystąpił błąd"
+            finally:
+                with timer.phase("publish"):
+                    await _async_publish(key, session)
+                metrics.record(SERVICE_ASK, timer, error)
+
+            return session.as_response()
+
+    async def async_confirm_claude(call: ServiceCall) -> ServiceResponse:
         """Confirm pending action."""
-        session_state = hass.states.get(INPUT_TEXT_SESSION)
-        session_id = session_state.state if session_state else ""
-        session = async_get_clientsession(hass)
-
-        try:
-            async with asyncio.timeout(TIMEOUT):
-                async with session.post(
-                    f"{SERVER_URL}/ask",
-                    json={"query": "wykonaj", "session_id": session_id, "confirm_action": True},
-                ) as resp:
-                    if resp.status != 200:
-                        _LOGGER.error("Claude server returned status %d: %s", resp.status, await resp.text())
-                        await hass.services.async_call(
-                            "input_text", "set_value",
-                            {"entity_id": INPUT_TEXT_RESPONSE, "value": "Przepraszam, wystąpił błąd serwera"},
-                            blocking=True,
-                        )
-                        return
-
-                    data = await resp.json()
-                    await hass.services.async_call(
-                        "input_text", "set_value",
-                        {"entity_id": INPUT_TEXT_RESPONSE, "value": data.get("text", "")},
-                        blocking=True,
-                    )
-        except Exception as err:
-            _LOGGER.error("Error confirming action: %s", err)
-            await hass.services.async_call(
-                "input_text", "set_value",
-                {"entity_id": INPUT_TEXT_RESPONSE, "value": "Przepraszam, nie mogę potwierdzić akcji"},
-                blocking=True,
-            )
-        finally:
-            # Clear confirmation state
-            await hass.services.async_call(
-                "input_boolean", "turn_off",
-                {"entity_id": INPUT_BOOLEAN_AWAITING},
-                blocking=True,
-            )
-            await hass.services.async_call(
-                "input_text", "set_value",
-                {"entity_id": INPUT_TEXT_PENDING_ACTION, "value": ""},
-                blocking=True,
-            )
-
-    async def async_cancel_claude(call: ServiceCall) -> None:
+        key, session = _get_session(call)
+        timer = PhaseTimer()
+        error: str | None = None
+
+        async with session.lock:
+            timer.add("queue", timer.total_ms())
+            if key == DEFAULT_SESSION_KEY:
+                _load_shared_session(session)
+
+            try:
+                data = await client.async_confirm(session.session_id, timer=timer)
+                session.response = data.get("text", "")
+            except ClaudeBrainServerError as err:
+                _LOGGER.error("%s", err)
+                error = "server"
+                session.response = "Przepraszam, wystąpił błąd serwera"
+            except Exception as err:
+                _LOGGER.error("Error confirming action: %s", err)
+                error = _error_kind(err)
+                session.response = "Przepraszam, nie mogę potwierdzić akcji"
+            finally:
+                # Clear confirmation state
+                session.clear_pending()
+                with timer.phase("publish"):
+                    await _async_publish(key, session)
+                metrics.record(SERVICE_CONFIRM, timer, error)
+
+        return session.as_response() if call.return_response else None
+
+    async def async_cancel_claude(call: ServiceCall) -> ServiceResponse:
         """Cancel pending action."""
-        session_state = hass.states.get(INPUT_TEXT_SESSION)
-        session_id = session_state.state if session_state else ""
-        session = async_get_clientsession(hass)
-
-        try:
-            async with asyncio.timeout(TIMEOUT):
-                async with session.post(
-                    f"{SERVER_URL}/cancel",
-                    json={"session_id": session_id},
-                ) as resp:
-                    if resp.status != 200:
-                        _LOGGER.error("Claude server returned status %d: %s", resp.status, await resp.text())
-                        await hass.services.async_call(
-                            "input_text", "set_value",
-                            {"entity_id": INPUT_TEXT_RESPONSE, "value": "Przepraszam, wystąpił błąd serwera"},
-                            blocking=True,
-                        )
-                        return
-
-                    data = await resp.json()
-                    await hass.services.async_call(
-                        "input_text", "set_value",
-                        {"entity_id": INPUT_TEXT_RESPONSE, "value": data.get("text", "")},
-                        blocking=True,
-                    )
-        except Exception as err:
-            _LOGGER.error("Error canceling action: %s", err)
-            await hass.services.async_call(
-                "input_text", "set_value",
-                {"entity_id": INPUT_TEXT_RESPONSE, "value": "Przepraszam, nie udało się anulować akcji"},
-                blocking=True,
-            )
-        finally:
-            # Clear confirmation state
-            await hass.services.async_call(
-                "input_boolean", "turn_off",
-                {"entity_id": INPUT_BOOLEAN_AWAITING},
-                blocking=True,
-            )
-            await hass.services.async_call(
-                "input_text", "set_value",
-                {"entity_id": INPUT_TEXT_PENDING_ACTION, "value": ""},
-                blocking=True,
-            )
+        key, session = _get_session(call)
+        timer = PhaseTimer()
+        error: str | None = None
+
+        async with session.lock:
+            timer.add("queue", timer.total_ms())
+            if key == DEFAULT_SESSION_KEY:
+                _load_shared_session(session)
+
+            try:
+                data = await client.async_cancel(session.session_id, timer=timer)
+                session.response = data.get("text", "")
+            except ClaudeBrainServerError as err:
+                _LOGGER.error("%s", err)
+                error = "server"
+                session.response = "Przepraszam, wystąpił błąd serwera"
+            except Exception as err:
+                _LOGGER.error("Error canceling action: %s", err)
+                error = _error_kind(err)
+                session.response = "Przepraszam, nie udało się anulować akcji"
+            finally:
+                # Clear confirmation state
+                session.clear_pending()
+                with timer.phase("publish"):
+                    await _async_publish(key, session)
+                metrics.record(SERVICE_CANCEL, timer, error)
+
+        return session.as_response() if call.return_response else None
 
     # Register services
-    hass.services.async_register(DOMAIN, SERVICE_ASK, async_ask_claude, schema=ASK_SCHEMA)
-    hass.services.async_register(DOMAIN, SERVICE_CONFIRM, async_confirm_claude)
-    hass.services.async_register(DOMAIN, SERVICE_CANCEL, async_cancel_claude)
+    hass.services.async_register(
+        DOMAIN, SERVICE_ASK, async_ask_claude,
+        schema=ASK_SCHEMA, supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_CONFIRM, async_confirm_claude,
+        schema=SESSION_SCHEMA, supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_CANCEL, async_cancel_claude,
+        schema=SESSION_SCHEMA, supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.async_create_task(
+        discovery.async_load_platform(hass, Platform.SENSOR, DOMAIN, {}, config)
+    )
 
     return True
@@ -0,0 +1,97 @@
+"""Circuit breaker guarding calls to the Claude Brain server."""
+import logging
+import time
+from collections.abc import Callable
+from enum import StrEnum
+
+_LOGGER = logging.getLogger(__name__)
+
+# Weight of the newest sample in the latency moving average
+LATENCY_EWMA_ALPHA = 0.2
+
+
+class BreakerState(StrEnum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Fail fast while the server is unhealthy.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    rejects calls immediately. Once ``reset_timeout`` has passed a single
+    half-open probe is let through; its outcome closes or re-opens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout: float,
+        on_change: Callable[[], None] | None = None,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._on_change = on_change
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.state = BreakerState.CLOSED
+        self.consecutive_failures = 0
+        self.total_failures = 0
+        self.rejected = 0
+        self.latency_ms: float | None = None
+
+    def allow_request(self) -> bool:
+        """Return True if a call may go to the server."""
+        if self.state is BreakerState.CLOSED:
+            return True
+
+        if (
+            self.state is BreakerState.OPEN
+            and time.monotonic() - self._opened_at >= self._reset_timeout
+        ):
+            self._set_state(BreakerState.HALF_OPEN)
+
+        if self.state is BreakerState.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+
+        self.rejected += 1
+        return False
+
+    def record_success(self, latency_ms: float | None = None) -> None:
+        """Record a successful call (health pings pass no latency)."""
+        self._probe_in_flight = False
+        self.consecutive_failures = 0
+        if latency_ms is not None:
+            self.latency_ms = (
+                latency_ms if self.latency_ms is None
+                else LATENCY_EWMA_ALPHA * latency_ms + (1 - LATENCY_EWMA_ALPHA) * self.latency_ms
+            )
+        if self.state is not BreakerState.CLOSED:
+            self._set_state(BreakerState.CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the breaker if needed."""
+        self._probe_in_flight = False
+        self.consecutive_failures += 1
+        self.total_failures += 1
+        if (
+            self.state is BreakerState.HALF_OPEN
+            or self.consecutive_failures >= self._failure_threshold
+        ):
+            self._opened_at = time.monotonic()
+            if self.state is not BreakerState.OPEN:
+                self._set_state(BreakerState.OPEN)
+
+    def abandon(self) -> None:
+        """Release a half-open probe that ended without a verdict (cancelled)."""
+        self._probe_in_flight = False
+
+    def _set_state(self, state: BreakerState) -> None:
+        _LOGGER.info("Claude server circuit breaker %s -> %s", self.state, state)
+        self.state = state
+        if self._on_change is not None:
+            self._on_change()
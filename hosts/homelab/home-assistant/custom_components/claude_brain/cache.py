@@ -0,0 +1,70 @@
+"""TTL + LRU response cache for Claude Brain queries."""
+import re
+import time
+from collections import OrderedDict
+from typing import Any
+
+from .const import CACHE_SKIP_WORDS
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase, drop punctuation and Polish filler words."""
+    return " ".join(
+        word for word in _WORD_RE.findall(query.lower())
+        if word not in CACHE_SKIP_WORDS
+    )
+
+
+class ResponseCache:
+    """Bounded LRU of server answers with a per-entry TTL.
+
+    Caching is opt-in per answer: only answers the server marks with
+    ``"cacheable": true`` (read-only questions) are stored. Anything else,
+    including every answer that ran an action or needs confirmation, always
+    goes to the server, so a repeated command is never skipped.
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[tuple[str, str], tuple[float, dict[str, Any]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if caching is switched on."""
+        return self._ttl > 0 and self._max_size > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(query: str, session_id: str) -> tuple[str, str]:
+        """Build the cache key for a query in a session context."""
+        return normalize_query(query), session_id
+
+    def get(self, key: tuple[str, str]) -> dict[str, Any] | None:
+        """Return a fresh cached answer, counting hits and misses."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        if entry is not None:
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key: tuple[str, str], data: dict[str, Any]) -> None:
+        """Store an answer if the server marked it cacheable."""
+        if data.get("requires_permission") or data.get("cacheable") is not True:
+            return
+
+        self._entries[key] = (time.monotonic() + self._ttl, data)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
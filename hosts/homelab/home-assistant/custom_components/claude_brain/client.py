@@ -0,0 +1,266 @@
+"""HTTP client for the Claude Brain server."""
+import asyncio
+import json
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import nullcontext
+from typing import Any, TypeVar
+
+import aiohttp
+
+from .breaker import CircuitBreaker
+from .const import (
+    HEALTH_TIMEOUT,
+    STREAM_CONTENT_TYPES,
+    STREAM_TOTAL_TIMEOUT,
+    TIMEOUT,
+)
+from .metrics import PhaseTimer
+
+_LOGGER = logging.getLogger(__name__)
+
+DeltaCallback = Callable[[str, str], Awaitable[None]]
+_T = TypeVar("_T")
+
+
+class ClaudeBrainError(Exception):
+    """Error talking to the Claude Brain server."""
+
+
+class ClaudeBrainServerError(ClaudeBrainError):
+    """Claude Brain server returned a non-200 status."""
+
+    def __init__(self, status: int, body: str) -> None:
+        super().__init__(f"Claude server returned status {status}: {body}")
+        self.status = status
+
+
+class ClaudeBrainUnavailableError(ClaudeBrainError):
+    """Circuit breaker is open; the server was not contacted."""
+
+
+class ClaudeBrainClient:
+    """Thin wrapper around the Claude Brain HTTP API."""
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        breaker: CircuitBreaker,
+        url: str,
+        stream: bool = False,
+    ) -> None:
+        self._session = session
+        self._url = url.rstrip("/")
+        self._breaker = breaker
+        self._stream = stream
+        self._warmup_supported = True
+
+    async def async_ask(
+        self,
+        payload: dict[str, Any],
+        on_delta: DeltaCallback | None = None,
+        timer: PhaseTimer | None = None,
+    ) -> dict[str, Any]:
+        """POST to /ask and return the final response body.
+
+        When streaming is enabled the server is asked for NDJSON/SSE output and
+        ``on_delta(delta, text_so_far)`` is awaited for every partial chunk.
+        Servers that ignore the ``stream`` flag and answer with plain JSON are
+        handled transparently.
+        """
+        return await self._async_guarded(
+            lambda: self._async_ask(payload, on_delta, timer)
+        )
+
+    async def _async_ask(
+        self,
+        payload: dict[str, Any],
+        on_delta: DeltaCallback | None,
+        timer: PhaseTimer | None,
+    ) -> dict[str, Any]:
+        if not self._stream or on_delta is None:
+            return await self._async_post("/ask", payload, timer)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + STREAM_TOTAL_TIMEOUT
+
+        # First byte and every following chunk must arrive within TIMEOUT,
+        # but the whole stream may run up to STREAM_TOTAL_TIMEOUT.
+        async with asyncio.timeout(TIMEOUT) as timeout:
+            async with self._session.post(
+                f"{self._url}/ask",
+                json={**payload, "stream": True},
+                headers={"Accept": ", ".join(STREAM_CONTENT_TYPES)},
+                trace_request_ctx=timer,
+            ) as resp:
+                if resp.status != 200:
+                    raise ClaudeBrainServerError(resp.status, await resp.text())
+
+                if resp.content_type not in STREAM_CONTENT_TYPES:
+                    with _phase(timer, "decode"):
+                        return await resp.json()
+
+                text = ""
+                # SSE "[DONE]" finals carry no body; keep the last session id seen
+                session_id = payload.get("session_id", "")
+                final: dict[str, Any] | None = None
+                async for raw_line in resp.content:
+                    timeout.reschedule(min(loop.time() + TIMEOUT, deadline))
+
+                    event = _parse_stream_line(raw_line)
+                    if event is None:
+                        continue
+
+                    session_id = event.get("session_id") or session_id
+                    event_type = event.get("type", "delta")
+                    if event_type == "delta":
+                        delta = str(event.get("text", ""))
+                        if delta:
+                            if not text and timer is not None:
+                                timer.add("first_token", timer.total_ms())
+                            text += delta
+                            await on_delta(delta, text)
+                    elif event_type == "done":
+                        final = event
+                        break
+                    elif event_type == "error":
+                        raise ClaudeBrainError(event.get("message", "stream error"))
+
+        if final is None:
+            raise ClaudeBrainError("Stream ended without final message")
+
+        final.setdefault("text", text.strip())
+        if not final.get("session_id"):
+            final["session_id"] = session_id
+        return final
+
+    async def async_confirm(
+        self, session_id: str, timer: PhaseTimer | None = None
+    ) -> dict[str, Any]:
+        """Confirm the pending action for a session."""
+        return await self._async_guarded(lambda: self._async_post(
+            "/ask",
+            {"query": "wykonaj", "session_id": session_id, "confirm_action": True},
+            timer,
+        ))
+
+    async def async_cancel(
+        self, session_id: str, timer: PhaseTimer | None = None
+    ) -> dict[str, Any]:
+        """Cancel the pending action for a session."""
+        return await self._async_guarded(
+            lambda: self._async_post("/cancel", {"session_id": session_id}, timer)
+        )
+
+    async def async_warmup(
+        self, session_id: str, timer: PhaseTimer | None = None
+    ) -> bool:
+        """Ask the server to load a session ahead of the real query.
+
+        Servers without /warmup get a health ping instead, which still makes
+        sure a pooled connection is open when the transcript arrives.
+        """
+        if not self._warmup_supported:
+            return await self.async_health()
+
+        try:
+            async with asyncio.timeout(HEALTH_TIMEOUT):
+                async with self._session.post(
+                    f"{self._url}/warmup",
+                    json={"session_id": session_id},
+                    trace_request_ctx=timer,
+                ) as resp:
+                    await resp.read()
+                    if resp.status == 404:
+                        _LOGGER.info("Claude server has no /warmup, falling back to health pings")
+                        self._warmup_supported = False
+                    return resp.status == 200
+        except (aiohttp.ClientError, TimeoutError) as err:
+            _LOGGER.debug("Claude server warm-up failed: %s", err)
+            return False
+
+    async def async_health(self) -> bool:
+        """GET /health; also used to pre-warm and keep pooled connections alive.
+
+        Health pings bypass the breaker but feed it, so a recovered server
+        closes an open breaker without waiting for a user request.
+        """
+        try:
+            async with asyncio.timeout(HEALTH_TIMEOUT):
+                async with self._session.get(f"{self._url}/health") as resp:
+                    await resp.read()
+                    healthy = resp.status == 200
+        except (aiohttp.ClientError, TimeoutError) as err:
+            _LOGGER.debug("Claude server health check failed: %s", err)
+            healthy = False
+
+        if healthy:
+            self._breaker.record_success()
+        else:
+            self._breaker.record_failure()
+        return healthy
+
+    async def _async_guarded(self, call: Callable[[], Awaitable[_T]]) -> _T:
+        """Run a server call through the circuit breaker."""
+        if not self._breaker.allow_request():
+            raise ClaudeBrainUnavailableError("Claude server circuit breaker is open")
+
+        start = time.monotonic()
+        try:
+            result = await call()
+        except ClaudeBrainServerError as err:
+            if err.status >= 500:
+                self._breaker.record_failure()
+            else:
+                self._breaker.record_success()
+            raise
+        except (ClaudeBrainError, aiohttp.ClientError, TimeoutError, ValueError):
+            self._breaker.record_failure()
+            raise
+        except BaseException:
+            self._breaker.abandon()
+            raise
+
+        self._breaker.record_success((time.monotonic() - start) * 1000)
+        return result
+
+    async def _async_post(
+        self,
+        path: str,
+        payload: dict[str, Any],
+        timer: PhaseTimer | None = None,
+    ) -> dict[str, Any]:
+        """POST JSON and return the decoded JSON body."""
+        async with asyncio.timeout(TIMEOUT):
+            async with self._session.post(
+                f"{self._url}{path}", json=payload, trace_request_ctx=timer
+            ) as resp:
+                if resp.status != 200:
+                    raise ClaudeBrainServerError(resp.status, await resp.text())
+                with _phase(timer, "decode"):
+                    return await resp.json()
+
+
+def _phase(timer: PhaseTimer | None, name: str):
+    """Time a block on ``timer`` if one was given."""
+    return nullcontext() if timer is None else timer.phase(name)
+
+
+def _parse_stream_line(raw_line: bytes) -> dict[str, Any] | None:
+    """Decode a single NDJSON or SSE line, skipping keep-alives and comments."""
+    line = raw_line.decode("utf-8").strip()
+    if not line or line.startswith(":") or line.startswith("event:"):
+        return None
+    if line.startswith("data:"):
+        line = line[5:].strip()
+        if line == "[DONE]":
+            return {"type": "done"}
+
+    try:
+        event = json.loads(line)
+    except ValueError:
+        _LOGGER.debug("Ignoring malformed stream line: %s", line)
+        return None
+
+    return event if isinstance(event, dict) else None
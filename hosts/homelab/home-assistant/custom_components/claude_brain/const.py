@@ -8,4 +8,58 @@ TIMEOUT: Final = 10
 INPUT_TEXT_SESSION: Final = "input_text.claude_session"
 INPUT_TEXT_RESPONSE: Final = "input_text.claude_response"
 INPUT_TEXT_PENDING_ACTION: Final = "input_text.claude_pending_action"
+# Answer so far while streaming; separate so claude_response stays a "done" gate
+INPUT_TEXT_RESPONSE_PARTIAL: Final = "input_text.claude_response_partial"
 INPUT_BOOLEAN_AWAITING: Final = "input_boolean.claude_awaiting_confirmation"
+# input_text max for the response/pending helpers (claude-brain.nix)
+INPUT_TEXT_MAX_LENGTH: Final = 255
+
+CONF_URL: Final = "url"
+CONF_STREAM: Final = "stream"
+
+# Streaming: TIMEOUT applies per chunk, the whole answer may take longer
+STREAM_TOTAL_TIMEOUT: Final = 60
+STREAM_CONTENT_TYPES: Final = ("application/x-ndjson", "text/event-stream")
+# Minimum seconds between partial helper writes while streaming
+STREAM_UPDATE_INTERVAL: Final = 0.3
+
+EVENT_RESPONSE: Final = "claude_brain_response"
+EVENT_RESPONSE_DELTA: Final = "claude_brain_response_delta"
+
+# Dedicated connection pool
+CONF_POOL_SIZE: Final = "pool_size"
+CONF_KEEPALIVE: Final = "keepalive"
+DEFAULT_POOL_SIZE: Final = 4
+DEFAULT_KEEPALIVE: Final = 60
+DNS_CACHE_TTL: Final = 300
+POOL_WARM_CONNECTIONS: Final = 2
+HEALTH_TIMEOUT: Final = 3
+
+# Opt-in response cache (cache_ttl 0 = disabled); stores only answers the
+# server marks "cacheable": true
+CONF_CACHE_TTL: Final = "cache_ttl"
+CONF_CACHE_SIZE: Final = "cache_size"
+DEFAULT_CACHE_TTL: Final = 0
+DEFAULT_CACHE_SIZE: Final = 64
+# Same skip words as custom_sentences/pl/intents.yaml
+CACHE_SKIP_WORDS: Final = frozenset({"proszę", "może", "czy", "możesz", "mi", "to", "no"})
+
+# Per-satellite sessions; calls without satellite_id use the shared helpers above.
+# Not "device_id": that name is reserved for service call targets
+ATTR_SATELLITE_ID: Final = "satellite_id"
+DEFAULT_SESSION_KEY: Final = ""
+SESSION_IDLE_TIMEOUT: Final = 300
+
+# Circuit breaker
+CONF_BREAKER_THRESHOLD: Final = "breaker_threshold"
+CONF_BREAKER_RESET: Final = "breaker_reset"
+DEFAULT_BREAKER_THRESHOLD: Final = 3
+DEFAULT_BREAKER_RESET: Final = 30
+
+SIGNAL_STATE_UPDATED: Final = f"{DOMAIN}_state_updated"
+
+# Speculative warm-up when a satellite wakes (assist_satellite -> listening)
+CONF_PREFETCH: Final = "prefetch"
+SATELLITE_DOMAIN: Final = "assist_satellite"
+SATELLITE_LISTENING: Final = "listening"
+WARMUP_MIN_INTERVAL: Final = 5
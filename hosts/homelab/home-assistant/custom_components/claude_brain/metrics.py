@@ -0,0 +1,143 @@
+"""Per-phase latency histograms and error counters for Claude Brain."""
+import time
+from collections import Counter, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+
+from .const import DOMAIN
+
+# Upper bounds (ms) of the Prometheus histogram buckets
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+# Recent samples kept per series for the percentile sensors
+RECENT_SAMPLES = 500
+
+PHASE_TOTAL = "total"
+
+
+class PhaseTimer:
+    """Collect phase durations for one service call."""
+
+    def __init__(self) -> None:
+        self.started = time.monotonic()
+        self.phases: dict[str, float] = {}
+        # Filled in by the connection pool's aiohttp trace hooks
+        self.request_started: float | None = None
+        self.connect_started: float | None = None
+
+    def add(self, phase: str, ms: float) -> None:
+        """Add time to a phase."""
+        self.phases[phase] = self.phases.get(phase, 0.0) + ms
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the wrapped block as ``name``."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.add(name, (time.monotonic() - start) * 1000)
+
+    def total_ms(self) -> float:
+        """Return milliseconds since the timer was created."""
+        return (time.monotonic() - self.started) * 1000
+
+
+class Histogram:
+    """Cumulative Prometheus-style histogram plus a window of raw samples."""
+
+    def __init__(self) -> None:
+        self.buckets = [0] * len(LATENCY_BUCKETS_MS)
+        self.count = 0
+        self.sum = 0.0
+        self.recent: deque[float] = deque(maxlen=RECENT_SAMPLES)
+
+    def observe(self, ms: float) -> None:
+        """Record one sample."""
+        self.count += 1
+        self.sum += ms
+        self.recent.append(ms)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if ms <= bound:
+                self.buckets[i] += 1
+
+    def percentile(self, q: float) -> float | None:
+        """Return the q-th percentile (0-100) of recent samples."""
+        if not self.recent:
+            return None
+        ordered = sorted(self.recent)
+        index = min(len(ordered) - 1, round(q / 100 * (len(ordered) - 1)))
+        return ordered[index]
+
+
+class Metrics:
+    """Latency and error metrics keyed by service and phase."""
+
+    def __init__(self) -> None:
+        self.histograms: dict[tuple[str, str], Histogram] = {}
+        self.requests: Counter[str] = Counter()
+        self.errors: Counter[tuple[str, str]] = Counter()
+
+    def record(self, service: str, timer: PhaseTimer, error: str | None = None) -> None:
+        """Record a finished service call."""
+        self.requests[service] += 1
+        if error is not None:
+            self.errors[(service, error)] += 1
+
+        for phase, ms in (*timer.phases.items(), (PHASE_TOTAL, timer.total_ms())):
+            self.histograms.setdefault((service, phase), Histogram()).observe(ms)
+
+    def percentile(self, service: str, phase: str, q: float) -> float | None:
+        """Return a recent-window percentile for one series."""
+        histogram = self.histograms.get((service, phase))
+        return None if histogram is None else histogram.percentile(q)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines = [
+            f"# HELP {DOMAIN}_latency_ms Claude Brain service call latency by phase",
+            f"# TYPE {DOMAIN}_latency_ms histogram",
+        ]
+        for (service, phase), histogram in sorted(self.histograms.items()):
+            labels = f'service="{service}",phase="{phase}"'
+            for bound, count in zip(LATENCY_BUCKETS_MS, histogram.buckets):
+                lines.append(f'{DOMAIN}_latency_ms_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'{DOMAIN}_latency_ms_bucket{{{labels},le="+Inf"}} {histogram.count}')
+            lines.append(f"{DOMAIN}_latency_ms_sum{{{labels}}} {histogram.sum:.3f}")
+            lines.append(f"{DOMAIN}_latency_ms_count{{{labels}}} {histogram.count}")
+
+        lines += [
+            f"# HELP {DOMAIN}_requests_total Claude Brain service calls",
+            f"# TYPE {DOMAIN}_requests_total counter",
+        ]
+        lines += [
+            f'{DOMAIN}_requests_total{{service="{service}"}} {count}'
+            for service, count in sorted(self.requests.items())
+        ]
+
+        lines += [
+            f"# HELP {DOMAIN}_errors_total Claude Brain failed service calls",
+            f"# TYPE {DOMAIN}_errors_total counter",
+        ]
+        lines += [
+            f'{DOMAIN}_errors_total{{service="{service}",kind="{kind}"}} {count}'
+            for (service, kind), count in sorted(self.errors.items())
+        ]
+        return "\n".join(lines) + "\n"
+
+
+class ClaudeBrainMetricsView(HomeAssistantView):
+    """Prometheus scrape endpoint (uses the same token as /api/prometheus)."""
+
+    url = f"/api/{DOMAIN}/metrics"
+    name = f"api:{DOMAIN}:metrics"
+
+    def __init__(self, metrics: Metrics) -> None:
+        self._metrics = metrics
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return current metrics."""
+        return web.Response(text=self._metrics.render(), content_type="text/plain")
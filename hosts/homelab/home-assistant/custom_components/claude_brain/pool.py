@@ -0,0 +1,120 @@
+"""Dedicated keep-alive connection pool for the Claude Brain server."""
+import logging
+import ssl
+import time
+from collections.abc import Mapping
+from types import SimpleNamespace
+
+import aiohttp
+
+from .metrics import PhaseTimer
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ConnectionPool:
+    """aiohttp session with its own tuned connector and reuse counters.
+
+    The shared HA session has no per-host limits or DNS caching, so voice
+    requests regularly paid for a cold TCP setup. This pool keeps a few
+    connections to the server alive and counts how often they are reused.
+    HA's client helpers cannot take a custom connector, so the caller passes
+    in HA's SSL context and default headers and owns closing the pool.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        keepalive: float,
+        dns_ttl: int,
+        ssl_context: ssl.SSLContext | bool = True,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        self.new_connections = 0
+        self.reused_connections = 0
+
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(self._on_request_start)
+        trace.on_connection_create_start.append(self._on_create_start)
+        trace.on_connection_create_end.append(self._on_create)
+        trace.on_connection_reuseconn.append(self._on_reuse)
+        trace.on_request_end.append(self._on_request_end)
+
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit_per_host=size,
+                keepalive_timeout=keepalive,
+                use_dns_cache=True,
+                ttl_dns_cache=dns_ttl,
+                ssl=ssl_context,
+            ),
+            headers=headers,
+            trace_configs=[trace],
+        )
+
+    @property
+    def reuse_ratio(self) -> float | None:
+        """Fraction of requests served over an already open connection."""
+        total = self.new_connections + self.reused_connections
+        return self.reused_connections / total if total else None
+
+    async def async_close(self) -> None:
+        """Close the session and all pooled connections."""
+        await self.session.close()
+
+    # Requests made with trace_request_ctx=PhaseTimer get connect/server
+    # phases filled in from these hooks.
+
+    async def _on_request_start(
+        self,
+        session: aiohttp.ClientSession,
+        ctx: SimpleNamespace,
+        params: aiohttp.TraceRequestStartParams,
+    ) -> None:
+        if isinstance(timer := ctx.trace_request_ctx, PhaseTimer):
+            timer.request_started = time.monotonic()
+
+    async def _on_create_start(
+        self,
+        session: aiohttp.ClientSession,
+        ctx: SimpleNamespace,
+        params: aiohttp.TraceConnectionCreateStartParams,
+    ) -> None:
+        if isinstance(timer := ctx.trace_request_ctx, PhaseTimer):
+            timer.connect_started = time.monotonic()
+
+    async def _on_create(
+        self,
+        session: aiohttp.ClientSession,
+        ctx: SimpleNamespace,
+        params: aiohttp.TraceConnectionCreateEndParams,
+    ) -> None:
+        self.new_connections += 1
+        _LOGGER.debug("Opened new connection to Claude server")
+        if (
+            isinstance(timer := ctx.trace_request_ctx, PhaseTimer)
+            and timer.connect_started is not None
+        ):
+            timer.add("connect", (time.monotonic() - timer.connect_started) * 1000)
+
+    async def _on_reuse(
+        self,
+        session: aiohttp.ClientSession,
+        ctx: SimpleNamespace,
+        params: aiohttp.TraceConnectionReuseconnParams,
+    ) -> None:
+        self.reused_connections += 1
+
+    async def _on_request_end(
+        self,
+        session: aiohttp.ClientSession,
+        ctx: SimpleNamespace,
+        params: aiohttp.TraceRequestEndParams,
+    ) -> None:
+        if (
+            isinstance(timer := ctx.trace_request_ctx, PhaseTimer)
+            and timer.request_started is not None
+        ):
+            # Request start to response headers, minus any TCP setup
+            elapsed = (time.monotonic() - timer.request_started) * 1000
+            timer.add("server", elapsed - timer.phases.get("connect", 0.0))
@@ -0,0 +1,188 @@
+"""Diagnostic sensors for Claude Brain."""
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import PERCENTAGE, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+
+from .breaker import BreakerState
+from .const import DOMAIN, SIGNAL_STATE_UPDATED
+from .metrics import PHASE_TOTAL
+
+
+@dataclass(frozen=True, kw_only=True)
+class ClaudeBrainSensorDescription(SensorEntityDescription):
+    """Sensor description reading a value from hass.data[DOMAIN]."""
+
+    value_fn: Callable[[dict[str, Any]], Any]
+    attrs_fn: Callable[[dict[str, Any]], dict[str, Any]] | None = None
+
+
+SENSORS: tuple[ClaudeBrainSensorDescription, ...] = (
+    ClaudeBrainSensorDescription(
+        key="circuit_breaker",
+        name="Claude Brain circuit breaker",
+        icon="mdi:electric-switch",
+        device_class=SensorDeviceClass.ENUM,
+        options=[state.value for state in BreakerState],
+        value_fn=lambda data: data["breaker"].state.value,
+        attrs_fn=lambda data: {
+            "consecutive_failures": data["breaker"].consecutive_failures,
+            "total_failures": data["breaker"].total_failures,
+            "rejected_requests": data["breaker"].rejected,
+            "latency_ms": (
+                None if data["breaker"].latency_ms is None
+                else round(data["breaker"].latency_ms, 1)
+            ),
+        },
+    ),
+    ClaudeBrainSensorDescription(
+        key="connections_new",
+        name="Claude Brain new connections",
+        icon="mdi:lan-connect",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda data: data["pool"].new_connections,
+    ),
+    ClaudeBrainSensorDescription(
+        key="connections_reused",
+        name="Claude Brain reused connections",
+        icon="mdi:lan-check",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda data: data["pool"].reused_connections,
+    ),
+    ClaudeBrainSensorDescription(
+        key="connection_reuse_ratio",
+        name="Claude Brain connection reuse ratio",
+        icon="mdi:percent",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: (
+            None if data["pool"].reuse_ratio is None
+            else round(data["pool"].reuse_ratio * 100, 1)
+        ),
+    ),
+    ClaudeBrainSensorDescription(
+        key="cache_hits",
+        name="Claude Brain cache hits",
+        icon="mdi:cached",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda data: data["cache"].hits,
+    ),
+    ClaudeBrainSensorDescription(
+        key="cache_misses",
+        name="Claude Brain cache misses",
+        icon="mdi:cloud-search-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda data: data["cache"].misses,
+    ),
+    ClaudeBrainSensorDescription(
+        key="cache_size",
+        name="Claude Brain cache size",
+        icon="mdi:database-outline",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: len(data["cache"]),
+    ),
+    ClaudeBrainSensorDescription(
+        key="coalesced_requests",
+        name="Claude Brain coalesced requests",
+        icon="mdi:call-merge",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda data: data["inflight"].coalesced,
+    ),
+    ClaudeBrainSensorDescription(
+        key="active_sessions",
+        name="Claude Brain active sessions",
+        icon="mdi:account-voice",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: len(data["sessions"]),
+    ),
+    *(
+        ClaudeBrainSensorDescription(
+            key=f"ask_latency_p{q}",
+            name=f"Claude Brain ask latency p{q}",
+            icon="mdi:timer-outline",
+            device_class=SensorDeviceClass.DURATION,
+            native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=0,
+            value_fn=lambda data, q=q: data["metrics"].percentile("ask", PHASE_TOTAL, q),
+        )
+        for q in (50, 95, 99)
+    ),
+    ClaudeBrainSensorDescription(
+        key="errors",
+        name="Claude Brain errors",
+        icon="mdi:alert-circle-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda data: data["metrics"].errors.total(),
+        attrs_fn=lambda data: {
+            f"{service}_{kind}": count
+            for (service, kind), count in data["metrics"].errors.items()
+        },
+    ),
+)
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up Claude Brain sensors (discovered from async_setup)."""
+    if discovery_info is None:
+        return
+
+    data = hass.data[DOMAIN]
+    async_add_entities(ClaudeBrainSensor(data, description) for description in SENSORS)
+
+
+class ClaudeBrainSensor(SensorEntity):
+    """Diagnostic sensor backed by in-memory integration counters.
+
+    Counters are polled; state changes such as the breaker opening are also
+    pushed through SIGNAL_STATE_UPDATED.
+    """
+
+    entity_description: ClaudeBrainSensorDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        data: dict[str, Any],
+        description: ClaudeBrainSensorDescription,
+    ) -> None:
+        self.entity_description = description
+        self._data = data
+        self._attr_unique_id = f"{DOMAIN}_{description.key}"
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to pushed updates."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_STATE_UPDATED, self.async_write_ha_state
+            )
+        )
+
+    @property
+    def native_value(self) -> Any:
+        """Return the current counter value."""
+        return self.entity_description.value_fn(self._data)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return extra attributes, if the description defines them."""
+        if self.entity_description.attrs_fn is None:
+            return None
+        return self.entity_description.attrs_fn(self._data)
@@ -0,0 +1,64 @@
+"""Per-satellite conversation sessions for Claude Brain."""
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class ConversationSession:
+    """Conversation state for one satellite (or the shared default)."""
+
+    session_id: str = ""
+    response: str = ""
+    pending_action: str = ""
+    awaiting_confirmation: bool = False
+    last_used: float = field(default_factory=time.monotonic)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+
+    def as_response(self) -> dict[str, Any]:
+        """Return the service response payload."""
+        return {
+            "text": self.response,
+            "session_id": self.session_id,
+            "requires_permission": self.awaiting_confirmation,
+            "action_description": self.pending_action,
+        }
+
+    def clear_pending(self) -> None:
+        """Drop any action waiting for confirmation."""
+        self.pending_action = ""
+        self.awaiting_confirmation = False
+
+
+class SessionTable:
+    """In-memory sessions keyed by device id with idle expiry."""
+
+    def __init__(self, idle_timeout: float) -> None:
+        self._idle_timeout = idle_timeout
+        self._sessions: dict[str, ConversationSession] = {}
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(self, key: str) -> ConversationSession:
+        """Return the session for ``key``, starting a new one if expired."""
+        self.prune()
+        session = self._sessions.get(key)
+        if session is None:
+            session = self._sessions[key] = ConversationSession()
+        session.last_used = time.monotonic()
+        return session
+
+    def peek(self, key: str) -> ConversationSession | None:
+        """Return an existing session without creating or touching it."""
+        return self._sessions.get(key)
+
+    def prune(self) -> None:
+        """Forget idle sessions that are not in use."""
+        cutoff = time.monotonic() - self._idle_timeout
+        for key in [
+            key for key, session in self._sessions.items()
+            if session.last_used < cutoff and not session.lock.locked()
+        ]:
+            del self._sessions[key]
@@ -0,0 +1,43 @@
+"""In-flight request coalescing for Claude Brain."""
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from .client import ClaudeBrainError
+
+
+class SingleFlight:
+    """Let concurrent callers with the same key share one in-flight call."""
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Future[Any]] = {}
+        self.coalesced = 0
+
+    async def async_do(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Run ``factory`` once per key; later callers await the same result."""
+        if (future := self._calls.get(key)) is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await factory()
+        except asyncio.CancelledError:
+            future.set_exception(ClaudeBrainError("Coalesced request was cancelled"))
+            raise
+        except Exception as err:
+            future.set_exception(err)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+            if future.done() and not future.cancelled():
+                # Mark as retrieved so callerless failures are not logged twice
+                future.exception()
@@ -0,0 +1,79 @@
+"""Batched helper-entity updates for Claude Brain."""
+import asyncio
+import logging
+import time
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class StatePublisher:
+    """Collect helper writes for one request and apply them in one batch.
+
+    Values equal to the current entity state are dropped, the remaining
+    input_text writes run concurrently, and input_boolean flags are applied
+    afterwards because intents use them as wait_template gates for the text.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._texts: dict[str, str] = {}
+        self._flags: dict[str, bool] = {}
+        self.last_flush_ms: float = 0.0
+
+    def set_text(self, entity_id: str, value: str) -> None:
+        """Queue an input_text value (last write wins)."""
+        self._texts[entity_id] = value
+
+    def set_flag(self, entity_id: str, on: bool) -> None:
+        """Queue an input_boolean value (last write wins)."""
+        self._flags[entity_id] = on
+
+    async def async_flush(self) -> None:
+        """Apply all queued updates."""
+        texts = {
+            entity_id: value
+            for entity_id, value in self._texts.items()
+            if not self._is_current(entity_id, value)
+        }
+        flags = {
+            entity_id: on
+            for entity_id, on in self._flags.items()
+            if not self._is_current(entity_id, "on" if on else "off")
+        }
+        self._texts.clear()
+        self._flags.clear()
+
+        if not texts and not flags:
+            return
+
+        start = time.monotonic()
+        await asyncio.gather(*(
+            self._hass.services.async_call(
+                "input_text", "set_value",
+                {"entity_id": entity_id, "value": value},
+                blocking=True,
+            )
+            for entity_id, value in texts.items()
+        ))
+        await asyncio.gather(*(
+            self._hass.services.async_call(
+                "input_boolean", "turn_on" if on else "turn_off",
+                {"entity_id": entity_id},
+                blocking=True,
+            )
+            for entity_id, on in flags.items()
+        ))
+        self.last_flush_ms = (time.monotonic() - start) * 1000
+
+        _LOGGER.debug(
+            "Published %d helper updates in %.1f ms",
+            len(texts) + len(flags),
+            self.last_flush_ms,
+        )
+
+    def _is_current(self, entity_id: str, value: str) -> bool:
+        """Return True if the entity already has this state."""
+        state = self._hass.states.get(entity_id)
+        return state is not None and state.state == value
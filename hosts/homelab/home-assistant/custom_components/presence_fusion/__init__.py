@@ -0,0 +1,202 @@
+"""Presence Fusion: one debounced occupancy entity per room.
+
+Combines FP2 zone binary sensors and FP300 presence + target distance into
+an incremental per-room score. Each room is published as a single
+binary_sensor that only writes state when occupancy actually flips, so
+automations and templates no longer re-render on every raw sensor update.
+"""
+import logging
+from collections import defaultdict
+from functools import partial
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.const import CONF_ENTITY_ID, CONF_NAME, STATE_ON, Platform
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import discovery
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
+
+from .const import (
+    DOMAIN,
+    CONF_BINS,
+    CONF_DISTANCE_ENTITY,
+    CONF_OFF_DELAY,
+    CONF_OFF_THRESHOLD,
+    CONF_ON_THRESHOLD,
+    CONF_ROOMS,
+    CONF_SOURCES,
+    CONF_WEIGHT,
+    DEFAULT_OFF_DELAY,
+    DEFAULT_OFF_THRESHOLD,
+    DEFAULT_ON_THRESHOLD,
+    DEFAULT_WEIGHT,
+    FP300_RANGE_BINS,
+    SIGNAL_ROOM_UPDATED,
+)
+from .engine import RoomOccupancy, Source
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _validate_thresholds(room: dict[str, Any]) -> dict[str, Any]:
+    """Hysteresis needs the off threshold at or below the on threshold."""
+    if room[CONF_OFF_THRESHOLD] > room[CONF_ON_THRESHOLD]:
+        raise vol.Invalid(f"{CONF_OFF_THRESHOLD} must not exceed {CONF_ON_THRESHOLD}")
+    return room
+
+
+SOURCE_SCHEMA = vol.Schema({
+    vol.Required(CONF_ENTITY_ID): cv.entity_id,
+    vol.Optional(CONF_WEIGHT, default=DEFAULT_WEIGHT): vol.All(
+        vol.Coerce(float), vol.Range(min=0)
+    ),
+    vol.Inclusive(CONF_DISTANCE_ENTITY, "fp300"): cv.entity_id,
+    vol.Inclusive(CONF_BINS, "fp300"): vol.All(
+        cv.ensure_list,
+        [vol.All(vol.Coerce(int), vol.Range(min=0, max=FP300_RANGE_BINS - 1))],
+    ),
+})
+
+ROOM_SCHEMA = vol.All(
+    vol.Schema({
+        vol.Optional(CONF_NAME): cv.string,
+        vol.Required(CONF_SOURCES): vol.All(cv.ensure_list, [SOURCE_SCHEMA]),
+        vol.Optional(CONF_ON_THRESHOLD, default=DEFAULT_ON_THRESHOLD): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+        vol.Optional(CONF_OFF_THRESHOLD, default=DEFAULT_OFF_THRESHOLD): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+        vol.Optional(CONF_OFF_DELAY, default=DEFAULT_OFF_DELAY): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=3600)
+        ),
+    }),
+    _validate_thresholds,
+)
+
+CONFIG_SCHEMA = vol.Schema({
+    DOMAIN: vol.Schema({
+        vol.Required(CONF_ROOMS): {cv.slug: ROOM_SCHEMA},
+    }),
+}, extra=vol.ALLOW_EXTRA)
+
+
+def _is_on(state: State | None) -> bool:
+    return state is not None and state.state == STATE_ON
+
+
+def _distance(state: State | None) -> float | None:
+    """Target distance in metres, or None when unknown/unavailable."""
+    if state is None:
+        return None
+    try:
+        return float(state.state)
+    except ValueError:
+        return None
+
+
+async def async_setup(hass: HomeAssistant, config: dict) -> bool:
+    """Set up Presence Fusion component."""
+    conf = config.get(DOMAIN, {})
+
+    rooms: dict[str, RoomOccupancy] = {}
+    names: dict[str, str] = {}
+    # entity id -> (room, source index) pairs it feeds
+    subscribers: dict[str, list[tuple[RoomOccupancy, int]]] = defaultdict(list)
+    # room id -> (off deadline, timer cancel)
+    timers: dict[str, tuple[float, CALLBACK_TYPE]] = {}
+
+    for room_id, room_conf in conf.get(CONF_ROOMS, {}).items():
+        sources = tuple(
+            Source(
+                entity_id=source[CONF_ENTITY_ID],
+                weight=source[CONF_WEIGHT],
+                distance_entity_id=source.get(CONF_DISTANCE_ENTITY),
+                bins=frozenset(source[CONF_BINS]) if CONF_BINS in source else None,
+            )
+            for source in room_conf[CONF_SOURCES]
+        )
+        room = rooms[room_id] = RoomOccupancy(
+            room_id=room_id,
+            sources=sources,
+            on_threshold=room_conf[CONF_ON_THRESHOLD],
+            off_threshold=room_conf[CONF_OFF_THRESHOLD],
+            off_delay=room_conf[CONF_OFF_DELAY],
+        )
+        names[room_id] = room_conf.get(
+            CONF_NAME, f"{room_id.replace('_', ' ').capitalize()} occupancy"
+        )
+        for index, source in enumerate(sources):
+            for entity_id in source.entity_ids:
+                subscribers[entity_id].append((room, index))
+
+    hass.data[DOMAIN] = {"rooms": rooms, "names": names}
+
+    @callback
+    def _async_schedule(room: RoomOccupancy) -> None:
+        """Keep one timer per room aligned with its pending off deadline."""
+        deadline = room.off_deadline()
+        scheduled = timers.get(room.room_id)
+        if scheduled is not None and scheduled[0] == deadline:
+            return
+        if scheduled is not None:
+            scheduled[1]()
+            del timers[room.room_id]
+        if deadline is not None:
+            delay = max(0.0, deadline - hass.loop.time())
+            timers[room.room_id] = (
+                deadline,
+                async_call_later(hass, delay, partial(_async_expire, room)),
+            )
+
+    @callback
+    def _async_expire(room: RoomOccupancy, _now: Any) -> None:
+        timers.pop(room.room_id, None)
+        if room.expire(hass.loop.time()):
+            _LOGGER.debug("Room %s is now unoccupied", room.room_id)
+            async_dispatcher_send(hass, SIGNAL_ROOM_UPDATED.format(room.room_id))
+        _async_schedule(room)
+
+    @callback
+    def _async_refresh(room: RoomOccupancy, index: int) -> None:
+        """Recompute one source's contribution and publish on a flip."""
+        source = room.sources[index]
+        contribution = source.contribution(
+            _is_on(hass.states.get(source.entity_id)),
+            _distance(
+                hass.states.get(source.distance_entity_id)
+                if source.distance_entity_id else None
+            ),
+        )
+        if room.update(index, contribution, hass.loop.time()):
+            _LOGGER.debug("Room %s occupied: %s", room.room_id, room.occupied)
+            async_dispatcher_send(hass, SIGNAL_ROOM_UPDATED.format(room.room_id))
+        _async_schedule(room)
+
+    @callback
+    def _async_source_changed(event: Event[EventStateChangedData]) -> None:
+        for room, index in subscribers[event.data["entity_id"]]:
+            _async_refresh(room, index)
+
+    for room in rooms.values():
+        for index in range(len(room.sources)):
+            _async_refresh(room, index)
+
+    if subscribers:
+        async_track_state_change_event(hass, list(subscribers), _async_source_changed)
+
+    hass.async_create_task(
+        discovery.async_load_platform(hass, Platform.BINARY_SENSOR, DOMAIN, {}, config)
+    )
+
+    return True
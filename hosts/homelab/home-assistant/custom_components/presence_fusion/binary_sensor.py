@@ -0,0 +1,70 @@
+"""Per-room occupancy binary sensors for Presence Fusion."""
+from typing import Any
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+
+from .const import DOMAIN, SIGNAL_ROOM_UPDATED
+from .engine import RoomOccupancy
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up one occupancy sensor per configured room."""
+    if discovery_info is None:
+        return
+
+    data = hass.data[DOMAIN]
+    async_add_entities(
+        PresenceFusionBinarySensor(room, data["names"][room_id])
+        for room_id, room in data["rooms"].items()
+    )
+
+
+class PresenceFusionBinarySensor(BinarySensorEntity):
+    """Debounced room occupancy.
+
+    State is pushed only when the fused occupancy flips; score and
+    active_sources are a snapshot taken at that moment.
+    """
+
+    _attr_device_class = BinarySensorDeviceClass.OCCUPANCY
+    _attr_should_poll = False
+
+    def __init__(self, room: RoomOccupancy, name: str) -> None:
+        self._room = room
+        self._attr_name = name
+        self._attr_unique_id = f"{DOMAIN}_{room.room_id}"
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to occupancy flips for this room."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_ROOM_UPDATED.format(self._room.room_id),
+                self.async_write_ha_state,
+            )
+        )
+
+    @property
+    def is_on(self) -> bool:
+        """Return whether the room is occupied."""
+        return self._room.occupied
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the fused score and contributing sources."""
+        return {
+            "score": round(self._room.score, 2),
+            "active_sources": self._room.active_sources,
+        }
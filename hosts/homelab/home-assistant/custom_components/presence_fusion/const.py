@@ -0,0 +1,24 @@
+"""Constants for Presence Fusion."""
+from typing import Final
+
+DOMAIN: Final = "presence_fusion"
+
+CONF_ROOMS: Final = "rooms"
+CONF_SOURCES: Final = "sources"
+CONF_DISTANCE_ENTITY: Final = "distance_entity_id"
+CONF_BINS: Final = "bins"
+CONF_WEIGHT: Final = "weight"
+CONF_ON_THRESHOLD: Final = "on_threshold"
+CONF_OFF_THRESHOLD: Final = "off_threshold"
+CONF_OFF_DELAY: Final = "off_delay"
+
+DEFAULT_WEIGHT: Final = 1.0
+DEFAULT_ON_THRESHOLD: Final = 1.0
+DEFAULT_OFF_THRESHOLD: Final = 0.5
+DEFAULT_OFF_DELAY: Final = 30
+
+# FP300 exposes six 1 m detection range bins (0-1 m ... 5-6 m)
+FP300_RANGE_BINS: Final = 6
+
+# Dispatcher signal, formatted with the room id
+SIGNAL_ROOM_UPDATED: Final = f"{DOMAIN}_room_updated_{{}}"
@@ -0,0 +1,111 @@
+"""Incremental per-room occupancy estimation with hysteresis.
+
+Kept free of Home Assistant imports so it can be reasoned about (and
+tested) on its own; __init__.py feeds it state changes and timers.
+"""
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class Source:
+    """One evidence stream for a room.
+
+    A plain binary sensor (e.g. an FP2 zone) counts while it is on. With
+    ``distance_entity_id`` and ``bins`` set it is treated as an FP300: it
+    only counts while presence is on and the target distance falls into
+    one of the given 1 m bins. An unknown distance falls back to presence.
+    """
+
+    entity_id: str
+    weight: float = 1.0
+    distance_entity_id: str | None = None
+    bins: frozenset[int] | None = None
+
+    @property
+    def entity_ids(self) -> tuple[str, ...]:
+        """Entities whose state changes affect this source."""
+        if self.distance_entity_id is None:
+            return (self.entity_id,)
+        return (self.entity_id, self.distance_entity_id)
+
+    def contribution(self, present: bool, distance_m: float | None) -> float:
+        """Weight this source adds to the room score."""
+        if not present:
+            return 0.0
+        if self.bins is None or distance_m is None:
+            return self.weight
+        return self.weight if int(distance_m) in self.bins else 0.0
+
+
+@dataclass
+class RoomOccupancy:
+    """Hysteresis state machine over the summed source contributions.
+
+    The room turns occupied as soon as the score reaches ``on_threshold``.
+    It only turns unoccupied once the score has stayed below
+    ``off_threshold`` for ``off_delay`` seconds, which absorbs the brief
+    drop-outs mmWave sensors produce when someone sits still.
+    """
+
+    room_id: str
+    sources: tuple[Source, ...]
+    on_threshold: float = 1.0
+    off_threshold: float = 0.5
+    off_delay: float = 30.0
+    occupied: bool = False
+    score: float = 0.0
+    off_pending_since: float | None = None
+    _contributions: dict[int, float] = field(default_factory=dict, repr=False)
+
+    @property
+    def active_sources(self) -> list[str]:
+        """Entity ids of the sources currently contributing."""
+        return [
+            self.sources[index].entity_id
+            for index, value in self._contributions.items()
+            if value > 0
+        ]
+
+    def off_deadline(self) -> float | None:
+        """Event loop time at which a pending off takes effect."""
+        if self.off_pending_since is None:
+            return None
+        return self.off_pending_since + self.off_delay
+
+    def update(self, index: int, contribution: float, now: float) -> bool:
+        """Replace one source's contribution; return True if occupancy flipped."""
+        previous = self._contributions.get(index, 0.0)
+        if contribution == previous:
+            return False
+        self._contributions[index] = contribution
+        # Re-sum rather than add the delta so float error cannot accumulate
+        self.score = sum(self._contributions.values())
+        return self._evaluate(now)
+
+    def expire(self, now: float) -> bool:
+        """Apply a pending off if its delay has passed; return True if flipped."""
+        return self._evaluate(now)
+
+    def _evaluate(self, now: float) -> bool:
+        if self.score >= self.on_threshold:
+            self.off_pending_since = None
+            if not self.occupied:
+                self.occupied = True
+                return True
+            return False
+
+        if not self.occupied:
+            return False
+
+        if self.score >= self.off_threshold:
+            self.off_pending_since = None
+            return False
+
+        if self.off_pending_since is None:
+            self.off_pending_since = now
+        if now - self.off_pending_since >= self.off_delay:
+            self.occupied = False
+            self.off_pending_since = None
+            return True
+        return False
+
@@ -1,14 +1,17 @@
 """Quirk for LUMI lumi.sensor_occupy.agl8."""
 
+import struct
+import time
 from typing import Any, Final
 
 from zigpy import types as t
+from zigpy.exceptions import ZigbeeException
 from zigpy.quirks.v2 import QuirkBuilder, ReportingConfig
 from zigpy.quirks.v2.homeassistant import EntityType, UnitOfTime
 from zigpy.quirks.v2.homeassistant.binary_sensor import BinarySensorDeviceClass
 from zigpy.quirks.v2.homeassistant.number import NumberDeviceClass
 from zigpy.quirks.v2.homeassistant.sensor import SensorDeviceClass, SensorStateClass
-from zigpy.zcl.foundation import BaseAttributeDefs, DataTypeId, ZCLAttributeDef
+from zigpy.zcl.foundation import BaseAttributeDefs, DataTypeId, Status, ZCLAttributeDef
 
 from zhaquirks import LocalDataCluster
 from zhaquirks.xiaomi import (
@@ -21,6 +24,43 @@ from zhaquirks.xiaomi import (
 # Manufacturer-specific attribute keys present in the non-standard AQARA payloads
 MANU_ATTR_BATTERY_VOLTAGE: Final = "0xff01-23"
 MANU_ATTR_BATTERY_PERCENT: Final = "0xff01-24"
+MANU_TAG_BATTERY_VOLTAGE: Final = 0x17
+MANU_TAG_BATTERY_PERCENT: Final = 0x18
+# Periodic heartbeat attribute carrying the TLV payload (battery, device temp)
+HEARTBEAT_ATTR_ID: Final = 0x00F7
+
+# Heartbeat (0x00F7) TLV value types decoded by the fast path: type -> (size, signed)
+HEARTBEAT_INT_TYPES: Final = {
+    DataTypeId.bool_: (1, False),
+    DataTypeId.uint8: (1, False),
+    DataTypeId.uint16: (2, False),
+    DataTypeId.uint24: (3, False),
+    DataTypeId.uint32: (4, False),
+    DataTypeId.uint40: (5, False),
+    DataTypeId.uint48: (6, False),
+    DataTypeId.uint64: (8, False),
+    DataTypeId.int8: (1, True),
+    DataTypeId.int16: (2, True),
+    DataTypeId.int24: (3, True),
+    DataTypeId.int32: (4, True),
+}
+HEARTBEAT_FLOAT = struct.Struct("<f")
+
+# 0x019A detection range buffer: uint16 prefix + 24-bit mask, 4 bits per 1 m bin
+DETECTION_RANGE_PREFIX: Final = 0x0300
+DETECTION_RANGE_MASK_ALL: Final = 0xFFFFFF
+DETECTION_RANGE_BUFFER_LEN: Final = 5
+
+# Report storm suppression for presence / target_distance (see ReportFilter):
+# defaults, tunable at runtime through FP300ReportFilterCluster
+TARGET_DISTANCE_DEADBAND: Final = 10  # raw units, cm
+REPORT_HEARTBEAT_INTERVAL: Final = 5  # seconds
+
+# Adaptive sampling (see SamplingController), opt-in through FP300SamplingCluster:
+# minimum time between profile switches
+SAMPLING_MIN_INTERVAL: Final = 600.0  # seconds
+SAMPLING_ACTIVE: Final = "active"
+SAMPLING_IDLE: Final = "idle"
 
 
 #
@@ -70,12 +110,151 @@ class LightSampling(t.enum8):
     CUSTOM = 4
 
 
+class ReportFilter:
+    """Deadband and rate limiter for one noisy reported attribute.
+
+    A value is forwarded when it differs from the last forwarded value by
+    more than ``deadband``, or when ``heartbeat`` seconds have passed since
+    the last forwarded report. Everything else is dropped.
+    """
+
+    def __init__(self, deadband: float, heartbeat: float) -> None:
+        self.deadband = deadband
+        self.heartbeat = heartbeat
+        self.forwarded = 0
+        self.dropped = 0
+        self._last_value: Any = None
+        self._last_time = 0.0
+
+    def accept(self, value: Any, now: float | None = None) -> bool:
+        """Return whether ``value`` should be forwarded, updating counters."""
+        if now is None:
+            now = time.monotonic()
+
+        if (
+            self._last_value is None
+            or abs(value - self._last_value) > self.deadband
+            or now - self._last_time >= self.heartbeat
+        ):
+            self._last_value = value
+            self._last_time = now
+            self.forwarded += 1
+            return True
+
+        self.dropped += 1
+        return False
+
+
+# Sampling profiles for write_profile; active while presence is detected
+SAMPLING_PROFILES: Final[dict[str, dict[str, Any]]] = {
+    SAMPLING_ACTIVE: {
+        "temp_humidity_sampling": TempHumiditySampling.HIGH,
+        "light_sampling": LightSampling.HIGH,
+        "light_reporting_mode": ReportMode.THRESHOLD_AND_INTERVAL,
+    },
+    SAMPLING_IDLE: {
+        "temp_humidity_sampling": TempHumiditySampling.LOW,
+        "light_sampling": LightSampling.LOW,
+        "light_reporting_mode": ReportMode.INTERVAL,
+    },
+}
+
+
+class BatteryDrain:
+    """Battery voltage drop accumulated while one sampling profile was active."""
+
+    def __init__(self) -> None:
+        self.seconds = 0.0
+        self.millivolts = 0
+
+    @property
+    def mv_per_day(self) -> float | None:
+        """Average drain, or None until enough time has been observed."""
+        if self.seconds < 3600:
+            return None
+        return self.millivolts * 86400 / self.seconds
+
+
+class SamplingController:
+    """Pick the FP300 sampling profile from presence, rate limiting switches.
+
+    The first profile is applied straight away; after that a switch is
+    deferred until ``min_interval`` has passed since the previous one. The
+    cluster re-asks on every heartbeat, so deferred switches are applied as
+    soon as they are allowed. Battery voltage samples are attributed to the
+    profile active between them to compare drain per profile.
+    """
+
+    def __init__(self, min_interval: float) -> None:
+        self.min_interval = min_interval
+        self.profile: str | None = None
+        self.in_flight = False
+        self.changes = 0
+        self.deferred = 0
+        self.drain: dict[str, BatteryDrain] = {
+            SAMPLING_ACTIVE: BatteryDrain(),
+            SAMPLING_IDLE: BatteryDrain(),
+        }
+        self._last_change = 0.0
+        self._last_voltage: tuple[float, int] | None = None
+
+    def target(self, present: bool, now: float) -> str | None:
+        """Return the profile to apply now, or None to leave things as they are."""
+        wanted = SAMPLING_ACTIVE if present else SAMPLING_IDLE
+        if wanted == self.profile or self.in_flight:
+            return None
+        if self.profile is not None and now - self._last_change < self.min_interval:
+            self.deferred += 1
+            return None
+        self.in_flight = True
+        return wanted
+
+    def applied(self, profile: str, now: float) -> None:
+        """Record a successful profile write."""
+        self.profile = profile
+        self.in_flight = False
+        self.changes += 1
+        self._last_change = now
+
+    def failed(self) -> None:
+        """Allow the next heartbeat to retry after a failed write."""
+        self.in_flight = False
+
+    def reset(self) -> None:
+        """Forget the applied profile so re-enabling writes one again."""
+        self.profile = None
+
+    def record_battery(self, millivolts: int, now: float) -> None:
+        """Attribute the drop since the last sample to the current profile."""
+        if self._last_voltage is not None and self.profile is not None:
+            last_time, last_mv = self._last_voltage
+            drain = self.drain[self.profile]
+            drain.seconds += now - last_time
+            # Ignore recoveries (temperature, battery swap)
+            drain.millivolts += max(0, last_mv - millivolts)
+        self._last_voltage = (now, millivolts)
+
+
 #
 # Manufacturer specific cluster (0xFCC0)
 #
 class AqaraFP300ManuCluster(XiaomiAqaraE1Cluster):
     """Aqara FP300 manufacturer specific cluster (0xFCC0)."""
 
+    # Latency of the most recent write_attributes round-trip, in ms
+    last_write_latency_ms: float | None = None
+
+    # Final attribute key per heartbeat tag (None: leave to the generic parser)
+    _heartbeat_keys: tuple[str | None, ...] | None = None
+
+    # Report filter defaults; a quirk subclass may override them, and the
+    # FP300ReportFilterCluster config entities change them at runtime
+    target_distance_deadband: int = TARGET_DISTANCE_DEADBAND
+    report_heartbeat_interval: int = REPORT_HEARTBEAT_INTERVAL
+
+    # Whether report_filters picked up FP300ReportFilterCluster's settings yet
+    _report_filters_configured: bool = False
+
     class AttributeDefs(BaseAttributeDefs):
         """Attribute definitions for Aqara FP300 manu cluster."""
 
@@ -305,34 +484,220 @@ class AqaraFP300ManuCluster(XiaomiAqaraE1Cluster):
             is_manufacturer_specific=True,
         )
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Init, setting up report filters for the chatty mmWave attributes."""
+        super().__init__(*args, **kwargs)
+        # presence is a bool: deadband 0 forwards every change, drops repeats
+        self.report_filters: dict[int, ReportFilter] = {
+            self.AttributeDefs.target_distance.id: ReportFilter(
+                self.target_distance_deadband, self.report_heartbeat_interval
+            ),
+            self.AttributeDefs.presence.id: ReportFilter(0, self.report_heartbeat_interval),
+        }
+        # Only drives the sampling settings while FP300SamplingCluster enables it
+        self.sampling = SamplingController(SAMPLING_MIN_INTERVAL)
+        self.last_heartbeat: dict[str, Any] = {}
+
+    async def write_attributes(
+        self,
+        attributes: dict[int | str, Any],
+        manufacturer: int | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Write attributes, recording the radio round-trip latency."""
+
+        start = time.monotonic()
+        res = await super().write_attributes(
+            attributes, manufacturer=manufacturer, **kwargs
+        )
+        self.last_write_latency_ms = (time.monotonic() - start) * 1000
+        self.debug(
+            "Wrote %d attribute(s) in %.0f ms",
+            len(attributes),
+            self.last_write_latency_ms,
+        )
+        return res
+
+    async def write_profile(
+        self,
+        profile: dict[str, Any],
+        manufacturer: int | None = None,
+    ) -> Any:
+        """Write several settings in a single write_attributes frame.
+
+        ``profile`` maps attribute names to values. Settings already holding
+        the requested value are left out, so re-applying a profile is free.
+        Returns None when there was nothing to write.
+        """
+
+        attributes: dict[int | str, Any] = {}
+        for name, value in profile.items():
+            attr_id = self.find_attribute(name).id
+            if self._attr_cache.get(attr_id) != value:
+                attributes[attr_id] = value
+
+        if not attributes:
+            return None
+
+        return await self.write_attributes(attributes, manufacturer=manufacturer)
+
+    def _build_heartbeat_keys(self) -> tuple[str | None, ...]:
+        """Map every heartbeat tag to the key the generic parser would end up with.
+
+        The parent parser is probed once with a uint8 per tag (value == tag),
+        so naming stays in step with zha-quirks. Tags it folds together are
+        left to the generic parser, and the battery tags get their renamed keys.
+        """
+        probe = b"".join(bytes((tag, DataTypeId.uint8, tag)) for tag in range(1, 256))
+        keys: list[str | None] = [None] * 256
+        for key, tag in super()._parse_aqara_attributes(probe).items():
+            if isinstance(tag, int) and 0 < tag < 256:
+                keys[tag] = key
+        keys[MANU_TAG_BATTERY_VOLTAGE] = BATTERY_VOLTAGE_MV
+        keys[MANU_TAG_BATTERY_PERCENT] = BATTERY_PERCENTAGE_REMAINING_ATTRIBUTE
+        return tuple(keys)
+
+    def _parse_heartbeat(self, value: bytes | bytearray) -> dict[str, Any] | None:
+        """Decode an agl8 heartbeat straight into final attribute keys.
+
+        Returns None if the payload holds a tag or value type the fast path
+        does not handle, or is truncated.
+        """
+        keys = self._heartbeat_keys
+        if keys is None:
+            keys = self._heartbeat_keys = self._build_heartbeat_keys()
+
+        attributes: dict[str, Any] = {}
+        pos, end = 0, len(value)
+        # Some attribute reports end with a stray null byte
+        while pos < end and not (pos == end - 1 and value[pos] == 0):
+            if pos + 2 > end:
+                return None
+            key = keys[value[pos]]
+            type_id = value[pos + 1]
+            pos += 2
+            if key is None:
+                return None
+
+            if type_id == DataTypeId.single:
+                if pos + 4 > end:
+                    return None
+                attributes[key] = HEARTBEAT_FLOAT.unpack_from(value, pos)[0]
+                pos += 4
+                continue
+
+            spec = HEARTBEAT_INT_TYPES.get(type_id)
+            if spec is None or pos + spec[0] > end:
+                return None
+            size, signed = spec
+            decoded = int.from_bytes(value[pos : pos + size], "little", signed=signed)
+            attributes[key] = bool(decoded) if type_id == DataTypeId.bool_ else decoded
+            pos += size
+
+        return attributes
+
     def _parse_aqara_attributes(self, value: Any) -> dict[str, Any]:
         """Parse non-standard and fp300 specific attributes.
 
-        Returns a mapping of attribute keys to values as extracted by the
-        parent implementation, with a couple of manufacturer-specific keys
-        renamed to common battery attribute names used in this project.
+        Heartbeats go through the _parse_heartbeat fast path. Anything it
+        cannot handle falls back to the parent implementation, with a couple
+        of manufacturer-specific keys renamed to common battery attribute
+        names used in this project.
         """
-        attributes = super()._parse_aqara_attributes(value)
+        attributes = None
+        if isinstance(value, (bytes, bytearray)):
+            attributes = self._parse_heartbeat(value)
 
-        if MANU_ATTR_BATTERY_VOLTAGE in attributes:
-            attributes[BATTERY_VOLTAGE_MV] = attributes.pop(MANU_ATTR_BATTERY_VOLTAGE)
+        if attributes is None:
+            attributes = super()._parse_aqara_attributes(value)
 
-        if MANU_ATTR_BATTERY_PERCENT in attributes:
-            attributes[BATTERY_PERCENTAGE_REMAINING_ATTRIBUTE] = attributes.pop(
-                MANU_ATTR_BATTERY_PERCENT
-            )
+            if MANU_ATTR_BATTERY_VOLTAGE in attributes:
+                attributes[BATTERY_VOLTAGE_MV] = attributes.pop(MANU_ATTR_BATTERY_VOLTAGE)
+
+            if MANU_ATTR_BATTERY_PERCENT in attributes:
+                attributes[BATTERY_PERCENTAGE_REMAINING_ATTRIBUTE] = attributes.pop(
+                    MANU_ATTR_BATTERY_PERCENT
+                )
 
+        self.last_heartbeat = attributes
         return attributes
 
+    def _update_sampling(self, present: bool) -> None:
+        """Switch the sampling profile to follow presence, if enabled and allowed."""
+        sampling_cluster = self.endpoint.in_clusters.get(FP300SamplingCluster.cluster_id)
+        if sampling_cluster is None or not sampling_cluster.enabled:
+            return
+        profile = self.sampling.target(present, time.monotonic())
+        if profile is not None:
+            self.create_catching_task(self._async_apply_sampling(profile))
+
+    async def _async_apply_sampling(self, profile: str) -> None:
+        """Write a sampling profile, letting the next heartbeat retry on failure.
+
+        The profile only counts as applied when the device accepted every
+        attribute; rejected writes, radio errors and cancellation all release
+        the controller so a later heartbeat can try again.
+        """
+        accepted = False
+        try:
+            res = await self.write_profile(SAMPLING_PROFILES[profile])
+            # None: every setting already held the profile's value
+            accepted = res is None or all(
+                record.status == Status.SUCCESS for record in res[0]
+            )
+            if not accepted:
+                self.debug("Device rejected %s sampling profile: %s", profile, res[0])
+        except (ZigbeeException, TimeoutError) as exc:
+            self.debug("Failed to apply %s sampling profile: %s", profile, exc)
+        finally:
+            if accepted:
+                self.sampling.applied(profile, time.monotonic())
+            else:
+                self.sampling.failed()
+
+    def configure_report_filters(self) -> None:
+        """Load deadband and heartbeat from FP300ReportFilterCluster, if attached.
+
+        Settings the user never changed fall back to this class's defaults.
+        """
+        self._report_filters_configured = True
+        config = self.endpoint.in_clusters.get(FP300ReportFilterCluster.cluster_id)
+        if config is None:
+            return
+
+        heartbeat = config._attr_cache.get(
+            config.AttributeDefs.report_heartbeat_interval.id,
+            self.report_heartbeat_interval,
+        )
+        for report_filter in self.report_filters.values():
+            report_filter.heartbeat = heartbeat
+        self.report_filters[self.AttributeDefs.target_distance.id].deadband = (
+            config._attr_cache.get(
+                config.AttributeDefs.target_distance_deadband.id,
+                self.target_distance_deadband,
+            )
+        )
+
     def _update_attribute(self, attrid: int, value: Any) -> Any:
-        """Only delegate 0x019A to the FP300DetectionRangeCluster.
+        """Filter report storms and delegate 0x019A to the FP300DetectionRangeCluster.
 
+        presence and target_distance reports pass through their ReportFilter
+        first; dropped reports never reach the attribute cache or entities.
+        Forwarded presence changes and heartbeats drive the sampling controller.
         If the attribute id corresponds to the raw detection-range payload we
         forward that to the local detection-range cluster which decodes the
         buffer into separate boolean range attributes. The result of the
         parent implementation is returned to the caller.
         """
 
+        report_filter = self.report_filters.get(attrid)
+        if report_filter is not None:
+            # Settings restored from the database bypass _update_attribute
+            if not self._report_filters_configured:
+                self.configure_report_filters()
+            if not report_filter.accept(value):
+                return None
+
         if attrid == self.AttributeDefs.detection_range_raw.id:
             dr_cluster = self.endpoint.in_clusters.get(
                 FP300DetectionRangeCluster.cluster_id
@@ -340,7 +705,25 @@ class AqaraFP300ManuCluster(XiaomiAqaraE1Cluster):
             if dr_cluster is not None:
                 dr_cluster._update_from_raw(value)
 
-        return super()._update_attribute(attrid, value)
+        result = super()._update_attribute(attrid, value)
+
+        if attrid == self.AttributeDefs.presence.id:
+            self._update_sampling(bool(value))
+        elif attrid == HEARTBEAT_ATTR_ID:
+            # The device is awake right after a heartbeat: retry deferred switches
+            millivolts = self.last_heartbeat.get(BATTERY_VOLTAGE_MV)
+            if millivolts is not None:
+                self.sampling.record_battery(int(millivolts), time.monotonic())
+                sampling_cluster = self.endpoint.in_clusters.get(
+                    FP300SamplingCluster.cluster_id
+                )
+                if sampling_cluster is not None:
+                    sampling_cluster._update_drain(self.sampling.drain)
+            present = self._attr_cache.get(self.AttributeDefs.presence.id)
+            if present is not None:
+                self._update_sampling(bool(present))
+
+        return result
 
 
 class FP300DetectionRangeCluster(LocalDataCluster):
@@ -395,62 +778,74 @@ class FP300DetectionRangeCluster(LocalDataCluster):
             access="rwp",
         )
 
+    # (attribute id, segment mask) per 1 m bin, in mask bit order
+    RANGE_SEGMENTS: Final = tuple(
+        (attr.id, 0xF << (4 * index))
+        for index, attr in enumerate(
+            (
+                AttributeDefs.range_0_1m,
+                AttributeDefs.range_1_2m,
+                AttributeDefs.range_2_3m,
+                AttributeDefs.range_3_4m,
+                AttributeDefs.range_4_5m,
+                AttributeDefs.range_5_6m,
+            )
+        )
+    )
+
+    # Mask last decoded from (or encoded into) 0x019A; None until first update
+    _range_mask: int | None = None
+
+    @staticmethod
+    def decode_raw(raw: t.LVBytes | bytes | bytearray | None) -> tuple[int, int]:
+        """Split a raw 0x019A buffer into (prefix, mask).
+
+        Short or missing buffers decode to the default prefix with every
+        range enabled.
+        """
+        if not isinstance(raw, (bytes, bytearray)) or len(raw) < DETECTION_RANGE_BUFFER_LEN:
+            return DETECTION_RANGE_PREFIX, DETECTION_RANGE_MASK_ALL
+
+        value = int.from_bytes(raw[:DETECTION_RANGE_BUFFER_LEN], "little")
+        return value & 0xFFFF, value >> 16
+
     def _update_from_raw(self, raw: t.LVBytes | bytes | bytearray | None) -> None:
-        """Update local detection range from raw 0x019A buffer."""
-
-        if isinstance(raw, t.LVBytes) or isinstance(raw, (bytes, bytearray)):
-            data = bytes(raw)
-        else:
-            data = b""
-
-        if len(data) >= 5:
-            prefix = int.from_bytes(data[0:2], "little")
-            mask = int.from_bytes(data[2:5], "little") & ((1 << 24) - 1)
-        else:
-            prefix = 0x0300
-            mask = (1 << 24) - 1  # 0xFFFFFF
-
-        super()._update_attribute(self.AttributeDefs.prefix.id, prefix)
-
-        seg_defs = [
-            (self.AttributeDefs.range_0_1m.id, 0),
-            (self.AttributeDefs.range_1_2m.id, 4),
-            (self.AttributeDefs.range_2_3m.id, 8),
-            (self.AttributeDefs.range_3_4m.id, 12),
-            (self.AttributeDefs.range_4_5m.id, 16),
-            (self.AttributeDefs.range_5_6m.id, 20),
-        ]
-
-        for attr_id, start_bit in seg_defs:
-            seg_mask = ((1 << 4) - 1) << start_bit
-            enabled = (mask & seg_mask) != 0
-            super()._update_attribute(attr_id, bool(enabled))
+        """Update local detection range from raw 0x019A buffer.
+
+        Only attributes whose value actually changed are updated, so a
+        repeated buffer does not cause any entity state writes.
+        """
+
+        prefix, mask = self.decode_raw(raw)
+
+        if self._attr_cache.get(self.AttributeDefs.prefix.id) != prefix:
+            super()._update_attribute(self.AttributeDefs.prefix.id, prefix)
+
+        previous = self._range_mask
+        if mask == previous:
+            return
+        self._range_mask = mask
+
+        for attr_id, seg_mask in self.RANGE_SEGMENTS:
+            enabled = bool(mask & seg_mask)
+            if previous is None or enabled != bool(previous & seg_mask):
+                super()._update_attribute(attr_id, enabled)
 
     def _build_raw(self) -> t.LVBytes:
         """Build raw 0x019A buffer for the manufacturer cluster from local range switches."""
 
-        prefix = self._attr_cache.get(self.AttributeDefs.prefix.id, 0x0300)
+        prefix = self._attr_cache.get(self.AttributeDefs.prefix.id, DETECTION_RANGE_PREFIX)
         try:
             prefix_int = int(prefix) & 0xFFFF
         except (TypeError, ValueError):
-            prefix_int = 0x0300
-
-        seg_defs = [
-            (self.AttributeDefs.range_0_1m.id, 0),
-            (self.AttributeDefs.range_1_2m.id, 4),
-            (self.AttributeDefs.range_2_3m.id, 8),
-            (self.AttributeDefs.range_3_4m.id, 12),
-            (self.AttributeDefs.range_4_5m.id, 16),
-            (self.AttributeDefs.range_5_6m.id, 20),
-        ]
+            prefix_int = DETECTION_RANGE_PREFIX
 
         mask = 0
-        for attr_id, start_bit in seg_defs:
-            enabled = bool(self._attr_cache.get(attr_id, True))
-            if enabled:
-                mask |= ((1 << 4) - 1) << start_bit
+        for attr_id, seg_mask in self.RANGE_SEGMENTS:
+            if self._attr_cache.get(attr_id, True):
+                mask |= seg_mask
 
-        buf = prefix_int.to_bytes(2, "little") + mask.to_bytes(3, "little")
+        buf = (prefix_int | mask << 16).to_bytes(DETECTION_RANGE_BUFFER_LEN, "little")
         return t.LVBytes(buf)
 
     async def write_attributes(
@@ -459,24 +854,137 @@ class FP300DetectionRangeCluster(LocalDataCluster):
         manufacturer: int | None = None,
         **kwargs: Any,
     ) -> Any:
-        """Override write_attributes to also update manu cluster."""
+        """Override write_attributes to also update manu cluster if the buffer changed."""
 
         res = await super().write_attributes(
             attributes, manufacturer=manufacturer, **kwargs
         )
+        # Switches changed locally, so the next device report must be fully diffed
+        self._range_mask = None
 
         raw = self._build_raw()
+        raw_id = AqaraFP300ManuCluster.AttributeDefs.detection_range_raw.id
 
         manu = self.endpoint.in_clusters.get(AqaraFP300ManuCluster.cluster_id)
-        if manu is not None:
+        # Skip the radio round-trip when the device already has this buffer
+        if manu is not None and manu._attr_cache.get(raw_id) != raw:
             await manu.write_attributes(
-                {AqaraFP300ManuCluster.AttributeDefs.detection_range_raw.id: raw},
+                {raw_id: raw},
                 manufacturer=manufacturer,
             )
 
         return res
 
 
+class FP300SamplingCluster(LocalDataCluster):
+    """Local cluster for the adaptive sampling switch and its battery drain."""
+
+    cluster_id = 0xFC31
+
+    class AttributeDefs(BaseAttributeDefs):
+        """Attribute definitions for FP300 sampling cluster."""
+
+        adaptive_sampling: Final = ZCLAttributeDef(
+            id=0x0000,
+            type=t.Bool,
+            zcl_type=DataTypeId.bool_,
+            access="rw",
+        )
+        # Battery drain per sampling profile, mV/day (see BatteryDrain)
+        active_drain: Final = ZCLAttributeDef(
+            id=0x0001,
+            type=t.Single,
+            zcl_type=DataTypeId.single,
+            access="rp",
+        )
+        idle_drain: Final = ZCLAttributeDef(
+            id=0x0002,
+            type=t.Single,
+            zcl_type=DataTypeId.single,
+            access="rp",
+        )
+
+    # Manual sampling settings are left alone until the user opts in
+    _DEFAULT_VALUES = {AttributeDefs.adaptive_sampling.id: False}
+
+    DRAIN_ATTRIBUTES: Final = {
+        SAMPLING_ACTIVE: AttributeDefs.active_drain.id,
+        SAMPLING_IDLE: AttributeDefs.idle_drain.id,
+    }
+
+    @property
+    def enabled(self) -> bool:
+        """Whether presence should drive the sampling profile."""
+        return bool(self.get(self.AttributeDefs.adaptive_sampling.id))
+
+    def _update_drain(self, drain: dict[str, BatteryDrain]) -> None:
+        """Publish per-profile drain once enough time has been observed."""
+        for profile, attr_id in self.DRAIN_ATTRIBUTES.items():
+            mv_per_day = drain[profile].mv_per_day
+            if mv_per_day is None:
+                continue
+            mv_per_day = round(mv_per_day, 1)
+            if self._attr_cache.get(attr_id) != mv_per_day:
+                super()._update_attribute(attr_id, mv_per_day)
+
+    async def write_attributes(
+        self,
+        attributes: dict[int | str, Any],
+        manufacturer: int | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Override write_attributes to release the sampling profile when disabled."""
+
+        res = await super().write_attributes(
+            attributes, manufacturer=manufacturer, **kwargs
+        )
+
+        manu = self.endpoint.in_clusters.get(AqaraFP300ManuCluster.cluster_id)
+        if manu is not None and not self.enabled:
+            manu.sampling.reset()
+
+        return res
+
+
+class FP300ReportFilterCluster(LocalDataCluster):
+    """Local cluster for tuning the presence/target_distance report filters."""
+
+    cluster_id = 0xFC32
+
+    class AttributeDefs(BaseAttributeDefs):
+        """Attribute definitions for FP300 report filter cluster."""
+
+        target_distance_deadband: Final = ZCLAttributeDef(
+            id=0x0000,
+            type=t.uint16_t,
+            zcl_type=DataTypeId.uint16,
+            access="rw",
+        )
+        report_heartbeat_interval: Final = ZCLAttributeDef(
+            id=0x0001,
+            type=t.uint16_t,
+            zcl_type=DataTypeId.uint16,
+            access="rw",
+        )
+
+    _DEFAULT_VALUES = {
+        AttributeDefs.target_distance_deadband.id: (
+            AqaraFP300ManuCluster.target_distance_deadband
+        ),
+        AttributeDefs.report_heartbeat_interval.id: (
+            AqaraFP300ManuCluster.report_heartbeat_interval
+        ),
+    }
+
+    def _update_attribute(self, attrid: int, value: Any) -> Any:
+        """Store a setting and push it to the manufacturer cluster's filters."""
+        result = super()._update_attribute(attrid, value)
+        manu = self.endpoint.in_clusters.get(AqaraFP300ManuCluster.cluster_id)
+        if manu is not None:
+            manu.configure_report_filters()
+        return result
+
+
 #
 # QuirkBuilder definition
 #
@@ -486,6 +994,8 @@ FP300_QUIRK = (
     .replaces(AqaraFP300ManuCluster)
     .adds(XiaomiPowerConfigurationPercent)
     .adds(FP300DetectionRangeCluster)
+    .adds(FP300SamplingCluster)
+    .adds(FP300ReportFilterCluster)
     # Main presence entity (mmWave)
     .binary_sensor(
         attribute_name=AqaraFP300ManuCluster.AttributeDefs.presence.name,
@@ -761,6 +1271,62 @@ FP300_QUIRK = (
         translation_key="light_reporting_mode",
         fallback_name="Light reporting mode",
     )
+    # Report storm suppression tuning
+    .number(
+        attribute_name=FP300ReportFilterCluster.AttributeDefs.target_distance_deadband.name,
+        cluster_id=FP300ReportFilterCluster.cluster_id,
+        endpoint_id=1,
+        device_class=NumberDeviceClass.DISTANCE,
+        entity_type=EntityType.CONFIG,
+        min_value=0,
+        max_value=100,
+        step=1,
+        unit="cm",
+        translation_key="target_distance_deadband",
+        fallback_name="Target distance deadband",
+    )
+    .number(
+        attribute_name=FP300ReportFilterCluster.AttributeDefs.report_heartbeat_interval.name,
+        cluster_id=FP300ReportFilterCluster.cluster_id,
+        endpoint_id=1,
+        device_class=NumberDeviceClass.DURATION,
+        entity_type=EntityType.CONFIG,
+        min_value=1,
+        max_value=60,
+        step=1,
+        unit=UnitOfTime.SECONDS,
+        translation_key="report_heartbeat_interval",
+        fallback_name="Report heartbeat interval",
+    )
+    # Adaptive sampling (opt-in) and the battery drain it is judged by
+    .switch(
+        attribute_name=FP300SamplingCluster.AttributeDefs.adaptive_sampling.name,
+        cluster_id=FP300SamplingCluster.cluster_id,
+        endpoint_id=1,
+        entity_type=EntityType.CONFIG,
+        translation_key="adaptive_sampling",
+        fallback_name="Adaptive sampling",
+    )
+    .sensor(
+        attribute_name=FP300SamplingCluster.AttributeDefs.active_drain.name,
+        cluster_id=FP300SamplingCluster.cluster_id,
+        endpoint_id=1,
+        state_class=SensorStateClass.MEASUREMENT,
+        unit="mV/d",
+        entity_type=EntityType.DIAGNOSTIC,
+        translation_key="active_sampling_battery_drain",
+        fallback_name="Battery drain (active sampling)",
+    )
+    .sensor(
+        attribute_name=FP300SamplingCluster.AttributeDefs.idle_drain.name,
+        cluster_id=FP300SamplingCluster.cluster_id,
+        endpoint_id=1,
+        state_class=SensorStateClass.MEASUREMENT,
+        unit="mV/d",
+        entity_type=EntityType.DIAGNOSTIC,
+        translation_key="idle_sampling_battery_drain",
+        fallback_name="Battery drain (idle sampling)",
+    )
     # Maintenance buttons
     .write_attr_button(
         attribute_name=AqaraFP300ManuCluster.AttributeDefs.spatial_learning.name,
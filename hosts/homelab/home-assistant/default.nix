@@ -287,6 +287,7 @@ in {
     ./monitoring.nix
     ./kettle.nix
     ./claude-brain.nix
+    ./presence-fusion.nix
   ];
 
   # ===========================================
@@ -581,6 +582,9 @@ in {
       # Create Claude Brain component symlink
       ln -sfn ${./custom_components/claude_brain} /var/lib/hass/custom_components/claude_brain
 
+      # Create Presence Fusion component symlink
+      ln -sfn ${./custom_components/presence_fusion} /var/lib/hass/custom_components/presence_fusion
+
       # Create Bermuda BLE Trilateration symlink
       ln -sfn ${bermudaSource}/custom_components/bermuda /var/lib/hass/custom_components/bermuda
 
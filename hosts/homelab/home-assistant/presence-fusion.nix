@@ -0,0 +1,45 @@
+{...}: {
+  services.home-assistant.config = {
+    # ===========================================
+    # Presence Fusion - one debounced occupancy entity per room
+    # ===========================================
+    # Publishes binary_sensor.<room>_occupancy; state is written only when
+    # fused occupancy flips, so templates/automations reading these instead
+    # of raw FP2 zones / FP300 distance do not re-render on every report.
+    presence_fusion.rooms = {
+      kitchen = {
+        name = "Kitchen occupancy";
+        sources = [
+          {entity_id = "binary_sensor.presence_sensor_fp2_b63f_presence_sensor_2";}
+        ];
+      };
+      living_room = {
+        name = "Living room occupancy";
+        sources = [
+          {entity_id = "binary_sensor.presence_sensor_fp2_fac2_presence_sensor_1";}
+        ];
+      };
+      hallway = {
+        name = "Hallway occupancy";
+        # Two FP2 zones cover the hallway; either one is enough
+        sources = [
+          {entity_id = "binary_sensor.presence_sensor_fp2_fac2_presence_sensor_2";}
+          {entity_id = "binary_sensor.presence_sensor_fp2_fac2_presence_sensor_3";}
+        ];
+        off_delay = 15;
+      };
+      bathroom = {
+        name = "Bathroom occupancy";
+        # FP300: presence only counts while the target is within 0-3 m
+        sources = [
+          {
+            entity_id = "binary_sensor.presence_sensor_presence";
+            distance_entity_id = "sensor.presence_sensor_target_distance";
+            bins = [0 1 2];
+          }
+        ];
+        off_delay = 60;
+      };
+    };
+  };
+}
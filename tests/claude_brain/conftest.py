@@ -0,0 +1,98 @@
+"""Fixtures for claude_brain tests.
+
+Needs pytest-homeassistant-custom-component; the whole directory is skipped
+when it is not installed.
+"""
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from aiohttp.test_utils import TestServer  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.setup import async_setup_component  # noqa: E402
+
+from stub_server import StubConfig, StubStats, create_app  # noqa: E402
+
+# Bind the custom_components namespace to this repo before the hass fixture
+# puts the plugin's testing_config/custom_components on the path
+import custom_components.claude_brain  # noqa: E402,F401
+
+# Same helpers as hosts/homelab/home-assistant/claude-brain.nix
+INPUT_TEXT_CONFIG = {
+    "claude_session": {"name": "Claude Session ID", "max": 100, "initial": ""},
+    "claude_response": {"name": "Claude Last Response", "max": 255, "initial": ""},
+    "claude_response_partial": {
+        "name": "Claude Partial Response",
+        "max": 255,
+        "initial": "",
+    },
+    "claude_pending_action": {
+        "name": "Claude Pending Action Description",
+        "max": 255,
+        "initial": "",
+    },
+}
+INPUT_BOOLEAN_CONFIG = {
+    "claude_awaiting_confirmation": {
+        "name": "Claude Awaiting Confirmation",
+        "initial": False,
+    },
+}
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Allow loading custom_components.claude_brain."""
+    yield
+
+
+@pytest.fixture
+async def stub(socket_enabled: None) -> TestServer:
+    """Run the stub Claude server on a random local port.
+
+    pytest-homeassistant-custom-component blocks sockets by default; the stub
+    only listens on localhost, so they are re-enabled for its tests.
+    """
+    server = TestServer(create_app(StubConfig()))
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+@pytest.fixture
+def stub_config(stub: TestServer) -> StubConfig:
+    """Mutable stub behaviour."""
+    return stub.app["config"]
+
+
+@pytest.fixture
+def stub_stats(stub: TestServer) -> StubStats:
+    """Stub request counters."""
+    return stub.app["stats"]
+
+
+@pytest.fixture
+def setup_brain(
+    hass: HomeAssistant, stub: TestServer
+) -> Callable[..., Awaitable[None]]:
+    """Return a coroutine setting up helpers and claude_brain against the stub."""
+
+    async def _setup(**options: Any) -> None:
+        assert await async_setup_component(
+            hass, "input_text", {"input_text": INPUT_TEXT_CONFIG}
+        )
+        assert await async_setup_component(
+            hass, "input_boolean", {"input_boolean": INPUT_BOOLEAN_CONFIG}
+        )
+        assert await async_setup_component(
+            hass,
+            "claude_brain",
+            {"claude_brain": {"url": str(stub.make_url("")), **options}},
+        )
+        await hass.async_block_till_done()
+
+    return _setup
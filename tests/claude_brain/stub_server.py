@@ -0,0 +1,190 @@
+"""Local stand-in for the Claude Brain server.
+
+Implements /ask, /cancel, /warmup and /health with configurable latency, error rate
+and NDJSON or SSE streaming. Used by the claude_brain tests, and can be run on its
+own to point a dev HA instance at it:
+
+    python tests/claude_brain/stub_server.py --port 8742 --latency 0.5 --stream
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import uuid
+from dataclasses import dataclass, field
+
+from aiohttp import web
+
+# Queries containing these words get requires_permission, like the real server
+DANGEROUS_WORDS = ("usuń", "wyłącz wszystko", "otwórz drzwi")
+# Queries starting with these words are read-only questions and marked cacheable
+QUESTION_WORDS = ("jaka", "jaki", "jakie", "ile", "czy", "kiedy", "gdzie")
+
+
+@dataclass
+class StubConfig:
+    """Behaviour knobs; tests mutate these between calls."""
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    stream: bool = False
+    sse: bool = False
+    chunk_delay: float = 0.0
+    healthy: bool = True
+
+
+@dataclass
+class StubStats:
+    """Request counters for assertions."""
+
+    ask: int = 0
+    cancel: int = 0
+    warmup: int = 0
+    health: int = 0
+    queries: list[str] = field(default_factory=list)
+
+
+def answer_for(query: str) -> str:
+    """Deterministic answer text for a query."""
+    return f"Odpowiedź na: {query}"
+
+
+def create_app(config: StubConfig | None = None) -> web.Application:
+    """Build the stub aiohttp application."""
+    app = web.Application()
+    app["config"] = config or StubConfig()
+    app["stats"] = StubStats()
+    app.router.add_post("/ask", _handle_ask)
+    app.router.add_post("/cancel", _handle_cancel)
+    app.router.add_post("/warmup", _handle_warmup)
+    app.router.add_get("/health", _handle_health)
+    return app
+
+
+async def _simulate(config: StubConfig) -> web.Response | None:
+    """Apply latency and injected errors."""
+    delay = config.latency + random.uniform(0, config.jitter)
+    if delay:
+        await asyncio.sleep(delay)
+    if config.error_rate and random.random() < config.error_rate:
+        return web.json_response({"error": "injected failure"}, status=500)
+    return None
+
+
+async def _handle_ask(request: web.Request) -> web.StreamResponse:
+    config: StubConfig = request.app["config"]
+    stats: StubStats = request.app["stats"]
+    body = await request.json()
+    query = body.get("query", "")
+    stats.ask += 1
+    stats.queries.append(query)
+
+    if (error := await _simulate(config)) is not None:
+        return error
+
+    if body.get("confirm_action"):
+        text = "Wykonano"
+        requires_permission = False
+    else:
+        text = answer_for(query)
+        requires_permission = any(word in query for word in DANGEROUS_WORDS)
+
+    final = {
+        "type": "done",
+        "text": text,
+        "session_id": body.get("session_id") or uuid.uuid4().hex,
+        "requires_permission": requires_permission,
+        "action_description": query if requires_permission else "",
+        "cacheable": not requires_permission and query.lower().startswith(QUESTION_WORDS),
+    }
+
+    if not (config.stream and body.get("stream")):
+        return web.json_response(final)
+
+    if config.sse:
+        return await _stream_sse(request, config, text, final)
+
+    response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+    await response.prepare(request)
+    for word in text.split(" "):
+        await response.write(
+            json.dumps({"type": "delta", "text": word + " "}).encode() + b"\n"
+        )
+        if config.chunk_delay:
+            await asyncio.sleep(config.chunk_delay)
+    await response.write(json.dumps(final).encode() + b"\n")
+    await response.write_eof()
+    return response
+
+
+async def _stream_sse(
+    request: web.Request, config: StubConfig, text: str, final: dict
+) -> web.StreamResponse:
+    """SSE flavour: session id rides on the deltas, the stream ends with [DONE]."""
+    response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+    await response.prepare(request)
+    for word in text.split(" "):
+        event = {"type": "delta", "text": word + " ", "session_id": final["session_id"]}
+        await response.write(f"data: {json.dumps(event)}\n\n".encode())
+        if config.chunk_delay:
+            await asyncio.sleep(config.chunk_delay)
+    await response.write(b"data: [DONE]\n\n")
+    await response.write_eof()
+    return response
+
+
+async def _handle_cancel(request: web.Request) -> web.Response:
+    config: StubConfig = request.app["config"]
+    request.app["stats"].cancel += 1
+    if (error := await _simulate(config)) is not None:
+        return error
+    return web.json_response({"text": "Anulowano"})
+
+
+async def _handle_warmup(request: web.Request) -> web.Response:
+    request.app["stats"].warmup += 1
+    return web.json_response({"status": "warm"})
+
+
+async def _handle_health(request: web.Request) -> web.Response:
+    config: StubConfig = request.app["config"]
+    request.app["stats"].health += 1
+    if not config.healthy:
+        return web.json_response({"status": "offline"}, status=503)
+    return web.json_response({"status": "online"})
+
+
+def main() -> None:
+    """Run the stub standalone."""
+    parser = argparse.ArgumentParser(description="Claude Brain stub server")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8742)
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Base response latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0,
+                        help="Uniform random extra latency in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Fraction of requests answered with HTTP 500")
+    parser.add_argument("--stream", action="store_true",
+                        help="Answer stream=true requests with NDJSON")
+    parser.add_argument("--sse", action="store_true",
+                        help="Stream as SSE ending in data: [DONE] instead of NDJSON")
+    parser.add_argument("--chunk-delay", type=float, default=0.05,
+                        help="Delay between streamed chunks in seconds")
+    args = parser.parse_args()
+
+    config = StubConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        stream=args.stream,
+        sse=args.sse,
+        chunk_delay=args.chunk_delay,
+    )
+    web.run_app(create_app(config), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""Behaviour tests for the claude_brain integration against the stub server."""
+
+import asyncio
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import async_capture_events
+
+from stub_server import StubConfig, StubStats, answer_for
+
+DOMAIN = "claude_brain"
+RESPONSE = "input_text.claude_response"
+SESSION = "input_text.claude_session"
+PENDING = "input_text.claude_pending_action"
+PARTIAL = "input_text.claude_response_partial"
+AWAITING = "input_boolean.claude_awaiting_confirmation"
+
+pytestmark = pytest.mark.integration
+
+
+async def _ask(hass: HomeAssistant, query: str, **data) -> dict | None:
+    return await hass.services.async_call(
+        DOMAIN, "ask", {"query": query, **data},
+        blocking=True, return_response="satellite_id" in data,
+    )
+
+
+async def test_ask_publishes_helpers(hass: HomeAssistant, setup_brain) -> None:
+    """Answer and session id land in the shared helpers."""
+    await setup_brain()
+
+    await _ask(hass, "jaka jest pogoda")
+
+    assert hass.states.get(RESPONSE).state == answer_for("jaka jest pogoda")
+    assert hass.states.get(SESSION).state != ""
+    assert hass.states.get(AWAITING).state == "off"
+
+
+async def test_empty_query(hass: HomeAssistant, setup_brain, stub_stats: StubStats) -> None:
+    """Blank queries are answered locally."""
+    await setup_brain()
+
+    await _ask(hass, "   ")
+
+    assert hass.states.get(RESPONSE).state == "Przepraszam, nie zrozumiałem pytania"
+    assert stub_stats.ask == 0
+
+
+async def test_permission_flow(hass: HomeAssistant, setup_brain) -> None:
+    """Dangerous actions wait for confirm, which clears the pending state."""
+    await setup_brain()
+
+    await _ask(hass, "usuń listę zakupów")
+    assert hass.states.get(AWAITING).state == "on"
+    assert hass.states.get(PENDING).state == "usuń listę zakupów"
+
+    await hass.services.async_call(DOMAIN, "confirm", blocking=True)
+    assert hass.states.get(RESPONSE).state == "Wykonano"
+    assert hass.states.get(AWAITING).state == "off"
+    assert hass.states.get(PENDING).state == ""
+
+
+async def test_streaming_fires_deltas(
+    hass: HomeAssistant, setup_brain, stub_config: StubConfig
+) -> None:
+    """Streamed answers fire delta events before the final response."""
+    stub_config.stream = True
+    await setup_brain(stream=True)
+    deltas = async_capture_events(hass, "claude_brain_response_delta")
+    finals = async_capture_events(hass, "claude_brain_response")
+
+    await _ask(hass, "ile jest stopni w salonie")
+
+    expected = answer_for("ile jest stopni w salonie")
+    assert len(deltas) == len(expected.split(" "))
+    assert deltas[-1].data["text"].strip() == expected
+    assert finals[0].data["text"] == expected
+    assert hass.states.get(RESPONSE).state == expected
+
+
+async def test_streaming_updates_partial_helper(
+    hass: HomeAssistant, setup_brain, stub_config: StubConfig
+) -> None:
+    """Partial text goes to its own helper while streaming, then is cleared."""
+    stub_config.stream = True
+    await setup_brain(stream=True)
+    changes = async_capture_events(hass, "state_changed")
+
+    await _ask(hass, "ile jest stopni w salonie")
+
+    partials = [
+        event.data["new_state"].state for event in changes
+        if event.data["entity_id"] == PARTIAL
+    ]
+    responses = [
+        event.data["new_state"].state for event in changes
+        if event.data["entity_id"] == RESPONSE
+    ]
+    assert partials[0] == "Odpowiedź "
+    assert partials[-1] == ""
+    assert responses == [answer_for("ile jest stopni w salonie")]
+
+
+async def test_sse_done_keeps_session(
+    hass: HomeAssistant, setup_brain, stub_config: StubConfig, stub_stats: StubStats
+) -> None:
+    """A bare [DONE] final keeps the session id streamed with the deltas."""
+    stub_config.stream = True
+    stub_config.sse = True
+    await setup_brain(stream=True)
+
+    await _ask(hass, "jaka jest pogoda")
+    session_id = hass.states.get(SESSION).state
+    await _ask(hass, "a jutro")
+
+    assert session_id != ""
+    assert hass.states.get(SESSION).state == session_id
+    assert hass.states.get(RESPONSE).state == answer_for("a jutro")
+
+
+async def test_long_answer_truncated_for_helper(hass: HomeAssistant, setup_brain) -> None:
+    """Answers over the input_text max are cut for the helper, not for the caller."""
+    await setup_brain()
+    query = "opowiedz " + "bardzo " * 50
+
+    await _ask(hass, query)
+    response = await _ask(hass, query, satellite_id="kitchen")
+
+    assert hass.states.get(RESPONSE).state == answer_for(query.strip())[:255]
+    assert response["text"] == answer_for(query.strip())
+
+
+async def test_identical_queries_coalesced(
+    hass: HomeAssistant, setup_brain, stub_config: StubConfig, stub_stats: StubStats
+) -> None:
+    """Concurrent identical asks share one server request."""
+    stub_config.latency = 0.2
+    await setup_brain()
+
+    await asyncio.gather(*(_ask(hass, "która jest godzina") for _ in range(5)))
+
+    assert stub_stats.ask == 1
+    assert hass.data[DOMAIN]["inflight"].coalesced == 4
+
+
+async def test_device_sessions_are_independent(
+    hass: HomeAssistant, setup_brain
+) -> None:
+    """Satellite sessions answer via service response, not shared helpers."""
+    await setup_brain()
+
+    kitchen, bedroom = await asyncio.gather(
+        _ask(hass, "włącz radio", satellite_id="kitchen"),
+        _ask(hass, "jaka jest data", satellite_id="bedroom"),
+    )
+
+    assert kitchen["text"] == answer_for("włącz radio")
+    assert bedroom["text"] == answer_for("jaka jest data")
+    assert kitchen["session_id"] != bedroom["session_id"]
+    assert hass.states.get(RESPONSE).state == ""
+
+
+async def test_cache_hit_skips_server(
+    hass: HomeAssistant, setup_brain, stub_stats: StubStats
+) -> None:
+    """Repeated queries within the TTL are served from the cache."""
+    await setup_brain(cache_ttl=60)
+
+    await _ask(hass, "Jaka jest pogoda?")
+    await _ask(hass, "proszę, jaka jest pogoda")
+
+    assert stub_stats.ask == 1
+    assert hass.data[DOMAIN]["cache"].hits == 1
+
+
+async def test_action_answer_not_cached(
+    hass: HomeAssistant, setup_brain, stub_stats: StubStats
+) -> None:
+    """Answers not marked cacheable always reach the server, so actions rerun."""
+    await setup_brain(cache_ttl=60)
+
+    await _ask(hass, "włącz światło w salonie")
+    await _ask(hass, "włącz światło w salonie")
+
+    assert stub_stats.ask == 2
+    assert len(hass.data[DOMAIN]["cache"]) == 0
+
+
+async def test_breaker_fails_fast(
+    hass: HomeAssistant, setup_brain, stub_config: StubConfig, stub_stats: StubStats
+) -> None:
+    """After the threshold the server is no longer contacted."""
+    await setup_brain(breaker_threshold=2)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    stub_config.error_rate = 1.0
+
+    await _ask(hass, "pierwsze pytanie")
+    await _ask(hass, "drugie pytanie")
+    calls = stub_stats.ask
+
+    await _ask(hass, "trzecie pytanie")
+
+    assert stub_stats.ask == calls
+    assert hass.data[DOMAIN]["breaker"].state == "open"
+    assert hass.states.get(RESPONSE).state == "Przepraszam, nie mogę teraz odpowiedzieć"
+
+
+async def test_wake_word_warms_session(
+    hass: HomeAssistant, setup_brain, stub_stats: StubStats
+) -> None:
+    """A satellite starting to listen triggers one throttled warm-up."""
+    await setup_brain()
+
+    hass.states.async_set("assist_satellite.kuchnia", "idle")
+    hass.states.async_set("assist_satellite.kuchnia", "listening")
+    hass.states.async_set("assist_satellite.kuchnia", "processing")
+    hass.states.async_set("assist_satellite.kuchnia", "listening")
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert stub_stats.warmup == 1
+
+
+async def test_pool_identifies_as_home_assistant(
+    hass: HomeAssistant, setup_brain
+) -> None:
+    """The pool sends HA's user agent and closes with Home Assistant."""
+    await setup_brain()
+    session = hass.data[DOMAIN]["pool"].session
+
+    assert session.headers["User-Agent"].startswith("HomeAssistant/")
+
+    await hass.async_stop()
+    assert session.closed
+
+
+async def test_metrics_endpoint(hass: HomeAssistant, setup_brain, hass_client) -> None:
+    """Latency histograms are exposed in Prometheus format."""
+    await setup_brain()
+    await _ask(hass, "jaka jest pogoda")
+
+    client = await hass_client()
+    resp = await client.get("/api/claude_brain/metrics")
+    body = await resp.text()
+
+    assert resp.status == 200
+    assert 'claude_brain_latency_ms_count{service="ask",phase="total"} 1' in body
+    assert 'claude_brain_requests_total{service="ask"} 1' in body
@@ -0,0 +1,90 @@
+"""Load harness: hundreds of concurrent claude_brain calls against the stub.
+
+Prints throughput and tail latency; run with ``-s`` to see the report:
+
+    pytest tests/claude_brain/test_claude_brain_load.py -m benchmark -s
+"""
+
+import asyncio
+import time
+
+import numpy as np
+import pytest
+from homeassistant.core import HomeAssistant
+
+from stub_server import StubConfig, StubStats, answer_for
+
+DOMAIN = "claude_brain"
+CONCURRENT_CALLS = 300
+SATELLITES = 8
+
+pytestmark = pytest.mark.benchmark
+
+
+def _report(name: str, latencies_ms: list[float], elapsed_s: float) -> str:
+    latencies = np.array(latencies_ms)
+    return (
+        f"\n{name}: {len(latencies)} calls in {elapsed_s:.2f}s "
+        f"({len(latencies) / elapsed_s:.1f} calls/s) | "
+        f"p50 {np.percentile(latencies, 50):.1f} ms, "
+        f"p95 {np.percentile(latencies, 95):.1f} ms, "
+        f"p99 {np.percentile(latencies, 99):.1f} ms, "
+        f"max {latencies.max():.1f} ms"
+    )
+
+
+async def _timed_ask(hass: HomeAssistant, data: dict) -> tuple[float, dict | None]:
+    start = time.perf_counter()
+    response = await hass.services.async_call(
+        DOMAIN, "ask", data, blocking=True, return_response="satellite_id" in data
+    )
+    return (time.perf_counter() - start) * 1000, response
+
+
+@pytest.mark.parametrize("pool_size", [4, 16])
+async def test_satellite_load(
+    hass: HomeAssistant,
+    setup_brain,
+    stub_config: StubConfig,
+    stub_stats: StubStats,
+    pool_size: int,
+) -> None:
+    """Distinct queries spread over several satellites."""
+    stub_config.latency = 0.02
+    stub_config.jitter = 0.03
+    await setup_brain(pool_size=pool_size)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(
+        _timed_ask(hass, {"query": f"pytanie {i}", "satellite_id": f"sat{i % SATELLITES}"})
+        for i in range(CONCURRENT_CALLS)
+    ))
+    elapsed = time.perf_counter() - start
+
+    print(_report(f"satellites pool_size={pool_size}", [r[0] for r in results], elapsed))
+    assert [r[1]["text"] for r in results] == [
+        answer_for(f"pytanie {i}") for i in range(CONCURRENT_CALLS)
+    ]
+    assert stub_stats.ask == CONCURRENT_CALLS
+
+
+async def test_identical_burst_load(
+    hass: HomeAssistant,
+    setup_brain,
+    stub_config: StubConfig,
+    stub_stats: StubStats,
+) -> None:
+    """A burst of the same shared-session query collapses to few requests."""
+    stub_config.latency = 0.05
+    await setup_brain()
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(
+        _timed_ask(hass, {"query": "która jest godzina"})
+        for _ in range(CONCURRENT_CALLS)
+    ))
+    elapsed = time.perf_counter() - start
+
+    print(_report("identical burst", [r[0] for r in results], elapsed))
+    print(f"  server requests: {stub_stats.ask}")
+    assert stub_stats.ask < CONCURRENT_CALLS // 10
@@ -7,7 +7,7 @@ import pytest
 
 # Add custom_components to Python path for imports
 project_root = Path(__file__).parent.parent
-custom_components_path = project_root / "custom_components"
+custom_components_path = project_root / "hosts" / "homelab" / "home-assistant" / "custom_components"
 sys.path.insert(0, str(custom_components_path.parent))
 
 
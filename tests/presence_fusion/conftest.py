@@ -0,0 +1,15 @@
+"""Fixtures for presence_fusion tests.
+
+Needs pytest-homeassistant-custom-component; the whole directory is skipped
+when it is not installed.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Allow loading custom_components.presence_fusion."""
+    yield
@@ -0,0 +1,123 @@
+"""Occupancy fusion engine and per-room entities."""
+
+from datetime import timedelta
+
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.presence_fusion.engine import RoomOccupancy, Source
+
+DOMAIN = "presence_fusion"
+FP2_ZONE = "binary_sensor.presence_sensor_fp2_b63f_presence_sensor_2"
+FP300 = "binary_sensor.presence_sensor_presence"
+FP300_DISTANCE = "sensor.presence_sensor_target_distance"
+
+CONFIG = {
+    DOMAIN: {
+        "rooms": {
+            "kitchen": {"sources": [{"entity_id": FP2_ZONE}], "off_delay": 30},
+            "bathroom": {
+                "sources": [{
+                    "entity_id": FP300,
+                    "distance_entity_id": FP300_DISTANCE,
+                    "bins": [0, 1, 2],
+                }],
+                "off_delay": 0,
+            },
+        }
+    }
+}
+
+pytestmark = pytest.mark.integration
+
+
+def test_hysteresis() -> None:
+    """On is immediate; off waits for the delay and is cancelled by new evidence."""
+    room = RoomOccupancy(
+        room_id="hallway",
+        sources=(Source("binary_sensor.a"), Source("binary_sensor.b", weight=0.5)),
+        on_threshold=1.0,
+        off_threshold=0.5,
+        off_delay=10,
+    )
+
+    assert room.update(0, 1.0, now=0)
+    assert room.occupied
+    assert not room.update(1, 0.5, now=1)
+    assert not room.update(0, 0.0, now=2)  # 0.5 sits between thresholds: hold
+    assert not room.update(1, 0.0, now=3)
+    assert room.off_deadline() == 13
+    assert not room.update(1, 0.5, now=5)  # back above off threshold
+    assert room.off_deadline() is None
+    assert not room.update(1, 0.0, now=6)
+    assert not room.expire(now=15)
+    assert room.expire(now=16)
+    assert not room.occupied
+
+
+def test_fp300_bins() -> None:
+    """FP300 presence only counts inside the configured range bins."""
+    source = Source(FP300, distance_entity_id=FP300_DISTANCE, bins=frozenset({0, 1}))
+
+    assert source.contribution(True, 1.4) == 1.0
+    assert source.contribution(True, 2.0) == 0.0
+    assert source.contribution(True, None) == 1.0
+    assert source.contribution(False, 0.5) == 0.0
+
+
+async def test_room_entity_debounces_off(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """A short FP2 drop-out does not flip the room entity off."""
+    hass.states.async_set(FP2_ZONE, "off")
+    assert await async_setup_component(hass, DOMAIN, CONFIG)
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.kitchen_occupancy").state == "off"
+
+    hass.states.async_set(FP2_ZONE, "on")
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.kitchen_occupancy").state == "on"
+
+    hass.states.async_set(FP2_ZONE, "off")
+    await hass.async_block_till_done()
+    freezer.tick(timedelta(seconds=10))
+    async_fire_time_changed(hass)
+    hass.states.async_set(FP2_ZONE, "on")
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.kitchen_occupancy").state == "on"
+
+    hass.states.async_set(FP2_ZONE, "off")
+    await hass.async_block_till_done()
+    freezer.tick(timedelta(seconds=31))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    state = hass.states.get("binary_sensor.kitchen_occupancy")
+    assert state.state == "off"
+    assert state.attributes["active_sources"] == []
+
+
+async def test_fp300_distance_gates_room(hass: HomeAssistant) -> None:
+    """Someone beyond the room's bins is not counted, and distance jitter is silent."""
+    assert await async_setup_component(hass, DOMAIN, CONFIG)
+    await hass.async_block_till_done()
+    writes = []
+    hass.bus.async_listen(
+        "state_changed",
+        lambda event: writes.append(event)
+        if event.data["entity_id"] == "binary_sensor.bathroom_occupancy" else None,
+    )
+
+    hass.states.async_set(FP300_DISTANCE, "4.2")
+    hass.states.async_set(FP300, "on")
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.bathroom_occupancy").state == "off"
+
+    for distance in ("2.4", "2.3", "1.9", "2.1"):
+        hass.states.async_set(FP300_DISTANCE, distance)
+    await hass.async_block_till_done()
+
+    assert hass.states.get("binary_sensor.bathroom_occupancy").state == "on"
+    assert len(writes) == 1
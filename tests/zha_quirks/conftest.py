@@ -0,0 +1,31 @@
+"""Fixtures for custom ZHA quirk tests.
+
+Needs zigpy and zha-quirks; the whole directory is skipped when they are not
+installed.
+"""
+
+import pytest
+
+pytest.importorskip("zhaquirks")
+
+import zigpy.endpoint  # noqa: E402
+
+from quirk_harness import aqara_fp300, make_fp300_endpoint  # noqa: E402
+
+
+@pytest.fixture
+def fp300_endpoint() -> zigpy.endpoint.Endpoint:
+    """Endpoint 1 of an FP300 with the quirk's clusters attached."""
+    return make_fp300_endpoint()
+
+
+@pytest.fixture
+def detection_range(fp300_endpoint) -> aqara_fp300.FP300DetectionRangeCluster:
+    """The local detection range cluster."""
+    return fp300_endpoint.in_clusters[aqara_fp300.FP300DetectionRangeCluster.cluster_id]
+
+
+@pytest.fixture
+def manu_cluster(fp300_endpoint) -> aqara_fp300.AqaraFP300ManuCluster:
+    """The 0xFCC0 manufacturer cluster."""
+    return fp300_endpoint.in_clusters[aqara_fp300.AqaraFP300ManuCluster.cluster_id]
@@ -0,0 +1,160 @@
+"""Fake zigpy device plumbing for exercising custom quirk clusters offline.
+
+Also replays ZCL frames from ``fixtures/*.json`` through the quirk clusters.
+The fixtures are synthetic: hand-built frames shaped like FP300 reports, not
+captures from a real device. A fixture looks like::
+
+    {
+      "description": "...",
+      "frames": [{"t": 0.0, "cluster": "0xfcc0", "data": "<ZCL frame hex>"}],
+      "expected": {"0xfcc0": {"0x0142": true}},
+      "expected_filters": {"0x015f": {"forwarded": 3, "dropped": 2}}
+    }
+
+``t`` is the frame time in seconds; the quirk's clock follows it during
+replay so rate limiting sees the intended spacing between reports.
+"""
+
+import json
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import zigpy.device
+import zigpy.endpoint
+from zigpy import types as t
+
+QUIRKS_PATH = (
+    Path(__file__).parent.parent.parent / "hosts" / "homelab" / "home-assistant" / "custom_zha_quirks"
+)
+sys.path.insert(0, str(QUIRKS_PATH))
+
+import aqara_fp300  # noqa: E402
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+FP300_IEEE = "54:ef:44:10:00:ab:cd:ef"
+# Frame time between the end of one replay lap and the start of the next
+REPLAY_LAP_GAP = 60.0
+
+
+class AttributeRecorder:
+    """Cluster listener counting attribute_updated events (entity state writes)."""
+
+    def __init__(self) -> None:
+        self.events: list[tuple[int, object]] = []
+
+    def attribute_updated(self, attrid: int, value: object, timestamp: object) -> None:
+        self.events.append((attrid, value))
+
+
+def make_fp300_endpoint(adaptive_sampling: bool = False) -> zigpy.endpoint.Endpoint:
+    """Build endpoint 1 of an FP300 with the quirk's clusters attached.
+
+    Adaptive sampling is off unless asked for, as on a freshly paired device,
+    so presence reports do not schedule profile writes that would need a
+    running event loop and radio.
+    """
+    device = zigpy.device.Device(MagicMock(), t.EUI64.convert(FP300_IEEE), 0x1234)
+    device.manufacturer = "Aqara"
+    device.model = "lumi.sensor_occupy.agl8"
+    endpoint = device.add_endpoint(1)
+    for cluster_cls in (
+        aqara_fp300.AqaraFP300ManuCluster,
+        aqara_fp300.FP300DetectionRangeCluster,
+        aqara_fp300.FP300SamplingCluster,
+        aqara_fp300.FP300ReportFilterCluster,
+        aqara_fp300.XiaomiPowerConfigurationPercent,
+    ):
+        endpoint.add_input_cluster(cluster_cls.cluster_id, cluster_cls(endpoint))
+    if adaptive_sampling:
+        endpoint.in_clusters[aqara_fp300.FP300SamplingCluster.cluster_id]._update_attribute(
+            aqara_fp300.FP300SamplingCluster.AttributeDefs.adaptive_sampling.id, True
+        )
+    return endpoint
+
+
+class ReplayClock:
+    """Stand-in for the quirk module's ``time``, driven by fixture frame times."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@dataclass
+class ReplayResult:
+    """Outcome of a replay run."""
+
+    frames: int
+    elapsed_s: float
+
+    @property
+    def frames_per_sec(self) -> float:
+        return self.frames / self.elapsed_s if self.elapsed_s else float("inf")
+
+
+def load_fixture(name: str) -> dict[str, Any]:
+    """Load ``fixtures/<name>.json``."""
+    return json.loads((FIXTURES_DIR / f"{name}.json").read_text())
+
+
+def fixture_names() -> list[str]:
+    """All fixtures, for parametrizing."""
+    return sorted(path.stem for path in FIXTURES_DIR.glob("*.json"))
+
+
+def replay(
+    endpoint: zigpy.endpoint.Endpoint, frames: list[dict[str, Any]], laps: int = 1
+) -> ReplayResult:
+    """Deserialize and dispatch each frame to its cluster, ``laps`` times over."""
+    decoded = [
+        (frame["t"], endpoint.in_clusters[int(frame["cluster"], 16)], bytes.fromhex(frame["data"]))
+        for frame in frames
+    ]
+    lap_length = decoded[-1][0] + REPLAY_LAP_GAP
+
+    clock = ReplayClock()
+    real_time, aqara_fp300.time = aqara_fp300.time, clock
+    try:
+        start = time.perf_counter()
+        for lap in range(laps):
+            for frame_at, cluster, data in decoded:
+                clock.now = lap * lap_length + frame_at
+                hdr, args = cluster.deserialize(data)
+                cluster.handle_message(hdr, args)
+        elapsed = time.perf_counter() - start
+    finally:
+        aqara_fp300.time = real_time
+
+    return ReplayResult(frames=len(decoded) * laps, elapsed_s=elapsed)
+
+
+def cache_state(
+    endpoint: zigpy.endpoint.Endpoint, expected: dict[str, dict[str, Any]]
+) -> tuple[dict, dict]:
+    """Return (actual, expected) attribute caches keyed by int ids for comparison."""
+    wanted = {
+        int(cluster_id, 16): {int(attr_id, 16): value for attr_id, value in attrs.items()}
+        for cluster_id, attrs in expected.items()
+    }
+    actual = {
+        cluster_id: {
+            attr_id: endpoint.in_clusters[cluster_id]._attr_cache.get(attr_id) for attr_id in attrs
+        }
+        for cluster_id, attrs in wanted.items()
+    }
+    return actual, wanted
+
+
+def filter_counters(endpoint: zigpy.endpoint.Endpoint) -> dict[int, dict[str, int]]:
+    """Forwarded/dropped counts of the manufacturer cluster's report filters."""
+    manu = endpoint.in_clusters[aqara_fp300.AqaraFP300ManuCluster.cluster_id]
+    return {
+        attr_id: {"forwarded": report_filter.forwarded, "dropped": report_filter.dropped}
+        for attr_id, report_filter in manu.report_filters.items()
+    }
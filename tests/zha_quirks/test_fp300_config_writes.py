@@ -0,0 +1,71 @@
+"""FP300 batched configuration writes and 0x019A write skipping."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from zigpy.quirks import CustomCluster
+from zigpy.zcl import foundation
+
+from aqara_fp300 import AqaraFP300ManuCluster, ReportMode, TempHumiditySampling
+
+RAW_ID = AqaraFP300ManuCluster.AttributeDefs.detection_range_raw.id
+PROFILE = {
+    "temp_humidity_sampling": TempHumiditySampling.CUSTOM,
+    "temp_humidity_sampling_period": 60_000,
+    "temp_reporting_mode": ReportMode.THRESHOLD,
+    "humidity_reporting_mode": ReportMode.THRESHOLD,
+}
+
+
+@pytest.fixture
+def radio_write(monkeypatch) -> AsyncMock:
+    """Replace the over-the-air write with a successful mock."""
+    write = AsyncMock(
+        return_value=[[foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)]]
+    )
+    monkeypatch.setattr(CustomCluster, "write_attributes", write)
+    return write
+
+
+async def test_profile_is_one_frame(manu_cluster, radio_write) -> None:
+    """All profile settings go out in a single write with latency recorded."""
+    await manu_cluster.write_profile(PROFILE)
+
+    radio_write.assert_awaited_once()
+    written = radio_write.await_args.args[0]
+    assert set(written) == {manu_cluster.find_attribute(name).id for name in PROFILE}
+    assert manu_cluster.last_write_latency_ms is not None
+
+
+async def test_profile_skips_unchanged(manu_cluster, radio_write) -> None:
+    """Settings already at the requested value are not re-sent."""
+    sampling_id = manu_cluster.AttributeDefs.temp_humidity_sampling.id
+    manu_cluster._attr_cache[sampling_id] = TempHumiditySampling.CUSTOM
+
+    await manu_cluster.write_profile(PROFILE)
+
+    assert sampling_id not in radio_write.await_args.args[0]
+
+
+async def test_profile_noop(manu_cluster, radio_write) -> None:
+    """Re-applying the current profile costs no radio traffic."""
+    for name, value in PROFILE.items():
+        manu_cluster._attr_cache[manu_cluster.find_attribute(name).id] = value
+
+    assert await manu_cluster.write_profile(PROFILE) is None
+    radio_write.assert_not_awaited()
+
+
+async def test_detection_range_skips_unchanged_buffer(
+    manu_cluster, detection_range, radio_write
+) -> None:
+    """0x019A is only written when the encoded buffer differs from the device's."""
+    manu_cluster._update_attribute(RAW_ID, b"\x00\x03\xff\xff\xff")
+    range_0_1m = detection_range.AttributeDefs.range_0_1m.id
+
+    await detection_range.write_attributes({range_0_1m: True})
+    radio_write.assert_not_awaited()
+
+    await detection_range.write_attributes({range_0_1m: False})
+    radio_write.assert_awaited_once()
+    assert bytes(radio_write.await_args.args[0][RAW_ID]) == b"\x00\x03\xf0\xff\xff"
@@ -0,0 +1,130 @@
+"""FP300 0x019A detection range decoding: correctness and micro-benchmark.
+
+The benchmark is deselected by default; run it with ``-s`` to see the
+speedup report:
+
+    pytest tests/zha_quirks/test_fp300_detection_range.py -m benchmark -s
+"""
+
+import random
+import time
+
+import pytest
+from zhaquirks import LocalDataCluster
+from zigpy import types as t
+
+from aqara_fp300 import FP300DetectionRangeCluster
+from quirk_harness import AttributeRecorder
+
+BUFFERS = 20_000
+PARITY_BUFFERS = 500
+RANGE_IDS = [attr_id for attr_id, _ in FP300DetectionRangeCluster.RANGE_SEGMENTS]
+
+
+def _legacy_update_from_raw(cluster: FP300DetectionRangeCluster, raw) -> None:
+    """Decoder as it was before the precomputed segment table."""
+    data = bytes(raw) if isinstance(raw, (bytes, bytearray)) else b""
+    if len(data) >= 5:
+        prefix = int.from_bytes(data[0:2], "little")
+        mask = int.from_bytes(data[2:5], "little") & ((1 << 24) - 1)
+    else:
+        prefix = 0x0300
+        mask = (1 << 24) - 1
+
+    LocalDataCluster._update_attribute(cluster, 0x0000, prefix)
+    for attr_id, start_bit in zip(RANGE_IDS, range(0, 24, 4)):
+        enabled = (mask & (((1 << 4) - 1) << start_bit)) != 0
+        LocalDataCluster._update_attribute(cluster, attr_id, bool(enabled))
+
+
+def _random_buffers(count: int) -> list[t.LVBytes]:
+    """Buffers as the device sends them: mostly repeats, occasional bin toggles."""
+    rng = random.Random(0x019A)
+    mask = 0xFFFFFF
+    buffers = []
+    for _ in range(count):
+        if rng.random() < 0.2:
+            mask ^= 0xF << (4 * rng.randrange(6))
+        buffers.append(t.LVBytes((0x0300 | mask << 16).to_bytes(5, "little")))
+    return buffers
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        (b"\x00\x03\xff\xff\xff", [True] * 6),
+        (b"\x00\x03\x0f\x00\x00", [True, False, False, False, False, False]),
+        (b"\x00\x03\x00\x10\xf0", [False, False, False, True, False, True]),
+        (b"\x00\x03", [True] * 6),
+        (None, [True] * 6),
+    ],
+)
+def test_decode(detection_range, raw, expected) -> None:
+    """Each 4-bit segment maps to one range switch."""
+    detection_range._update_from_raw(raw)
+
+    assert [detection_range._attr_cache[attr_id] for attr_id in RANGE_IDS] == expected
+    assert detection_range._attr_cache[0x0000] == 0x0300
+
+
+def test_only_changed_bins_update(detection_range) -> None:
+    """Repeated buffers are silent; a toggled bin updates only that switch."""
+    recorder = AttributeRecorder()
+    detection_range._update_from_raw(b"\x00\x03\xff\xff\xff")
+    detection_range.add_listener(recorder)
+
+    detection_range._update_from_raw(b"\x00\x03\xff\xff\xff")
+    assert recorder.events == []
+
+    detection_range._update_from_raw(b"\x00\x03\xff\xff\x0f")
+    assert recorder.events == [(RANGE_IDS[5], False)]
+
+
+def test_build_raw_round_trip(detection_range) -> None:
+    """Encoding the decoded switches reproduces the device buffer."""
+    raw = b"\x00\x03\xf0\x0f\xf0"
+    detection_range._update_from_raw(raw)
+
+    assert bytes(detection_range._build_raw()) == raw
+
+
+def test_matches_legacy_decoder(detection_range, fp300_endpoint) -> None:
+    """The table decoder ends in the legacy state with fewer entity updates."""
+    legacy = FP300DetectionRangeCluster(fp300_endpoint)
+    legacy_events, new_events = AttributeRecorder(), AttributeRecorder()
+    legacy.add_listener(legacy_events)
+    detection_range.add_listener(new_events)
+
+    for raw in _random_buffers(PARITY_BUFFERS):
+        _legacy_update_from_raw(legacy, raw)
+        detection_range._update_from_raw(raw)
+
+    for attr_id in [0x0000, *RANGE_IDS]:
+        assert detection_range._attr_cache[attr_id] == legacy._attr_cache[attr_id]
+    assert len(new_events.events) < len(legacy_events.events)
+
+
+@pytest.mark.benchmark
+def test_decode_benchmark(detection_range, fp300_endpoint) -> None:
+    """Time the table decoder against the legacy one on randomized buffers."""
+    buffers = _random_buffers(BUFFERS)
+    legacy = FP300DetectionRangeCluster(fp300_endpoint)
+    legacy_events, new_events = AttributeRecorder(), AttributeRecorder()
+    legacy.add_listener(legacy_events)
+    detection_range.add_listener(new_events)
+
+    start = time.perf_counter()
+    for raw in buffers:
+        _legacy_update_from_raw(legacy, raw)
+    legacy_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for raw in buffers:
+        detection_range._update_from_raw(raw)
+    new_s = time.perf_counter() - start
+
+    print(
+        f"\n0x019A decode, {BUFFERS} buffers: legacy {legacy_s * 1e6 / BUFFERS:.2f} us/buf "
+        f"({len(legacy_events.events)} updates), table {new_s * 1e6 / BUFFERS:.2f} us/buf "
+        f"({len(new_events.events)} updates), {legacy_s / new_s:.1f}x faster"
+    )
@@ -0,0 +1,89 @@
+"""FP300 heartbeat (0x00F7) fast-path parser: parity and benchmark.
+
+The benchmark is deselected by default; run it with ``-s`` to see the
+speedup report:
+
+    pytest tests/zha_quirks/test_fp300_heartbeat.py -m benchmark -s
+"""
+
+import time
+
+import pytest
+from zhaquirks.xiaomi import (
+    BATTERY_PERCENTAGE_REMAINING_ATTRIBUTE,
+    BATTERY_VOLTAGE_MV,
+    XiaomiAqaraE1Cluster,
+)
+
+from aqara_fp300 import MANU_ATTR_BATTERY_PERCENT, MANU_ATTR_BATTERY_VOLTAGE
+
+ITERATIONS = 20_000
+
+# agl8 heartbeats: device temp, outage count, battery mV/%, plus FP300 tags
+HEARTBEATS = [
+    bytes.fromhex("03281a" "05210c00" "0a210000" "1721b80b" "182055" "652001" "662002"),
+    bytes.fromhex("032819" "05210c00" "0a210000" "1721a40b" "182054" "652000" "662002" "00"),
+    bytes.fromhex("03281b" "05210d00" "08213a12" "1721980b" "182053" "652001" "67390000c03f"),
+]
+# A string-typed value is outside the fast path and must fall back
+FALLBACK = bytes.fromhex("03281a" "1721b80b" "0842" "03" "616263")
+
+
+def _legacy_parse(cluster, payload: bytes) -> dict:
+    """Parser as it was before the fast path."""
+    attributes = XiaomiAqaraE1Cluster._parse_aqara_attributes(cluster, payload)
+    if MANU_ATTR_BATTERY_VOLTAGE in attributes:
+        attributes[BATTERY_VOLTAGE_MV] = attributes.pop(MANU_ATTR_BATTERY_VOLTAGE)
+    if MANU_ATTR_BATTERY_PERCENT in attributes:
+        attributes[BATTERY_PERCENTAGE_REMAINING_ATTRIBUTE] = attributes.pop(
+            MANU_ATTR_BATTERY_PERCENT
+        )
+    return attributes
+
+
+@pytest.mark.parametrize("payload", [*HEARTBEATS, FALLBACK])
+def test_matches_generic_parser(manu_cluster, payload: bytes) -> None:
+    """Fast path yields exactly what the generic parser + renames did."""
+    assert manu_cluster._parse_aqara_attributes(payload) == _legacy_parse(
+        manu_cluster, payload
+    )
+
+
+def test_battery_keys(manu_cluster) -> None:
+    """Battery tags land on the project's battery attribute names."""
+    attributes = manu_cluster._parse_heartbeat(HEARTBEATS[0])
+
+    assert attributes[BATTERY_VOLTAGE_MV] == 3000
+    assert attributes[BATTERY_PERCENTAGE_REMAINING_ATTRIBUTE] == 85
+    assert MANU_ATTR_BATTERY_VOLTAGE not in attributes
+
+
+@pytest.mark.parametrize("payload", [FALLBACK, HEARTBEATS[0][:-1]])
+def test_unsupported_payload_declined(manu_cluster, payload: bytes) -> None:
+    """Unknown value types and truncated payloads are left to the generic parser."""
+    assert manu_cluster._parse_heartbeat(payload) is None
+
+
+@pytest.mark.benchmark
+def test_heartbeat_benchmark(manu_cluster) -> None:
+    """Compare the fast path with the generic parser on sample heartbeats."""
+    manu_cluster._parse_heartbeat(HEARTBEATS[0])  # build the tag table up front
+
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        for payload in HEARTBEATS:
+            _legacy_parse(manu_cluster, payload)
+    legacy_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        for payload in HEARTBEATS:
+            manu_cluster._parse_aqara_attributes(payload)
+    fast_s = time.perf_counter() - start
+
+    parsed = ITERATIONS * len(HEARTBEATS)
+    print(
+        f"\nheartbeat parse, {parsed} payloads: generic {legacy_s * 1e6 / parsed:.2f} us, "
+        f"fast path {fast_s * 1e6 / parsed:.2f} us, {legacy_s / fast_s:.1f}x faster"
+    )
+    assert fast_s < legacy_s
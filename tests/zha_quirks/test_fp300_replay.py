@@ -0,0 +1,55 @@
+"""Replay synthetic FP300 ZCL frames through the quirk and check the result.
+
+Every ``fixtures/*.json`` file is replayed; add a fixture there to cover a
+new regression. The throughput benchmark is deselected by default; run it
+with ``-s`` to see the report:
+
+    pytest tests/zha_quirks/test_fp300_replay.py -m benchmark -s
+"""
+
+import pytest
+
+from quirk_harness import (
+    cache_state,
+    filter_counters,
+    fixture_names,
+    load_fixture,
+    make_fp300_endpoint,
+    replay,
+)
+
+BENCHMARK_LAPS = 2_000
+# Conservative floor; a parser regression shows up as an order of magnitude drop
+MIN_FRAMES_PER_SEC = 1_000
+
+
+@pytest.mark.parametrize("name", fixture_names())
+def test_replay(fp300_endpoint, name: str) -> None:
+    """Replaying a fixture leaves the attribute cache in the expected state."""
+    fixture = load_fixture(name)
+
+    replay(fp300_endpoint, fixture["frames"])
+
+    actual, expected = cache_state(fp300_endpoint, fixture["expected"])
+    assert actual == expected
+    if "expected_filters" in fixture:
+        expected_filters = {
+            int(attr_id, 16): counts for attr_id, counts in fixture["expected_filters"].items()
+        }
+        counters = filter_counters(fp300_endpoint)
+        assert {attr_id: counters[attr_id] for attr_id in expected_filters} == expected_filters
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("name", fixture_names())
+def test_replay_throughput(name: str) -> None:
+    """Frames/sec through deserialize + quirk handling for each fixture."""
+    fixture = load_fixture(name)
+
+    result = replay(make_fp300_endpoint(), fixture["frames"], laps=BENCHMARK_LAPS)
+
+    print(
+        f"\n{name}: {result.frames} frames in {result.elapsed_s:.2f}s "
+        f"({result.frames_per_sec:,.0f} frames/s)"
+    )
+    assert result.frames_per_sec >= MIN_FRAMES_PER_SEC
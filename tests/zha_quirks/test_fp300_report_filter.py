@@ -0,0 +1,86 @@
+"""FP300 presence / target_distance report storm suppression."""
+
+from aqara_fp300 import AqaraFP300ManuCluster, FP300ReportFilterCluster, ReportFilter
+from quirk_harness import AttributeRecorder
+
+DISTANCE_ID = AqaraFP300ManuCluster.AttributeDefs.target_distance.id
+PRESENCE_ID = AqaraFP300ManuCluster.AttributeDefs.presence.id
+
+
+def test_deadband_and_heartbeat() -> None:
+    """Small moves are dropped until the heartbeat interval passes."""
+    report_filter = ReportFilter(deadband=10, heartbeat=5.0)
+
+    assert report_filter.accept(200, now=0.0)
+    assert not report_filter.accept(205, now=1.0)
+    assert not report_filter.accept(195, now=2.0)
+    assert report_filter.accept(215, now=3.0)
+    assert not report_filter.accept(220, now=4.0)
+    assert report_filter.accept(220, now=8.0)
+    assert (report_filter.forwarded, report_filter.dropped) == (3, 3)
+
+
+def test_walking_storm_is_thinned(manu_cluster) -> None:
+    """A 1 Hz stream of jittery distances only forwards real movement."""
+    recorder = AttributeRecorder()
+    manu_cluster.add_listener(recorder)
+    distances = [300, 302, 298, 301, 299, 350, 352, 349, 351, 350]
+
+    for distance in distances:
+        manu_cluster._update_attribute(DISTANCE_ID, distance)
+
+    report_filter = manu_cluster.report_filters[DISTANCE_ID]
+    assert [value for attrid, value in recorder.events if attrid == DISTANCE_ID] == [300, 350]
+    assert report_filter.forwarded + report_filter.dropped == len(distances)
+    assert manu_cluster._attr_cache[DISTANCE_ID] == 350
+
+
+def test_presence_changes_always_forwarded(manu_cluster) -> None:
+    """Presence edges pass straight through; only repeats are dropped."""
+    for value in (True, True, False, False, True):
+        manu_cluster._update_attribute(PRESENCE_ID, value)
+
+    report_filter = manu_cluster.report_filters[PRESENCE_ID]
+    assert (report_filter.forwarded, report_filter.dropped) == (3, 2)
+    assert manu_cluster._attr_cache[PRESENCE_ID] is True
+
+
+
+async def test_filters_follow_config_entities(fp300_endpoint, manu_cluster) -> None:
+    """Deadband and heartbeat written through the config cluster take effect."""
+    config = fp300_endpoint.in_clusters[FP300ReportFilterCluster.cluster_id]
+
+    await config.write_attributes(
+        {"target_distance_deadband": 50, "report_heartbeat_interval": 30}
+    )
+
+    assert manu_cluster.report_filters[DISTANCE_ID].deadband == 50
+    assert manu_cluster.report_filters[DISTANCE_ID].heartbeat == 30
+    assert manu_cluster.report_filters[PRESENCE_ID].heartbeat == 30
+
+
+def test_restored_config_applied_on_first_report(fp300_endpoint, manu_cluster) -> None:
+    """Settings restored straight into the cache are picked up lazily."""
+    config = fp300_endpoint.in_clusters[FP300ReportFilterCluster.cluster_id]
+    config._attr_cache[config.AttributeDefs.target_distance_deadband.id] = 40
+
+    for distance in (300, 330):
+        manu_cluster._update_attribute(DISTANCE_ID, distance)
+
+    report_filter = manu_cluster.report_filters[DISTANCE_ID]
+    assert report_filter.deadband == 40
+    assert (report_filter.forwarded, report_filter.dropped) == (1, 1)
+
+
+def test_subclass_defaults_apply_until_set(fp300_endpoint) -> None:
+    """Class attribute defaults are kept while the config entities are unset."""
+
+    class WideDeadband(AqaraFP300ManuCluster):
+        target_distance_deadband = 25
+
+    manu = WideDeadband(fp300_endpoint)
+    fp300_endpoint.in_clusters[AqaraFP300ManuCluster.cluster_id] = manu
+
+    manu._update_attribute(DISTANCE_ID, 300)
+
+    assert manu.report_filters[DISTANCE_ID].deadband == 25
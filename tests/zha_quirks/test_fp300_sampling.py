@@ -0,0 +1,178 @@
+"""FP300 adaptive sampling driven by presence."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from zhaquirks.xiaomi import BATTERY_VOLTAGE_MV
+from zigpy.quirks import CustomCluster
+from zigpy.zcl import foundation
+
+import aqara_fp300
+from aqara_fp300 import (
+    HEARTBEAT_ATTR_ID,
+    SAMPLING_ACTIVE,
+    SAMPLING_IDLE,
+    SAMPLING_PROFILES,
+    AqaraFP300ManuCluster,
+    FP300SamplingCluster,
+    SamplingController,
+)
+from quirk_harness import ReplayClock, make_fp300_endpoint
+
+PRESENCE_ID = AqaraFP300ManuCluster.AttributeDefs.presence.id
+
+
+def test_switches_are_rate_limited() -> None:
+    """The first switch is immediate; later ones wait for the interval."""
+    controller = SamplingController(min_interval=600)
+
+    assert controller.target(True, now=0) == SAMPLING_ACTIVE
+    assert controller.target(True, now=1) is None  # write still in flight
+    controller.applied(SAMPLING_ACTIVE, now=1)
+
+    assert controller.target(False, now=60) is None
+    assert controller.deferred == 1
+    assert controller.target(False, now=601) == SAMPLING_IDLE
+
+
+def test_failed_write_is_retried() -> None:
+    """A failed write leaves the profile unset so the next ask retries."""
+    controller = SamplingController(min_interval=600)
+
+    assert controller.target(True, now=0) == SAMPLING_ACTIVE
+    controller.failed()
+
+    assert controller.profile is None
+    assert controller.target(True, now=30) == SAMPLING_ACTIVE
+
+
+def test_battery_drain_per_profile() -> None:
+    """Voltage drops are attributed to the profile active at the time."""
+    controller = SamplingController(min_interval=600)
+    controller.applied(SAMPLING_ACTIVE, now=0)
+
+    controller.record_battery(3000, now=0)
+    controller.record_battery(2990, now=7200)
+    controller.record_battery(2995, now=10800)  # recovery is ignored
+
+    drain = controller.drain[SAMPLING_ACTIVE]
+    assert drain.millivolts == 10
+    assert drain.mv_per_day == 10 * 86400 / 10800
+    assert controller.drain[SAMPLING_IDLE].mv_per_day is None
+
+
+async def test_adaptive_sampling_is_opt_in(monkeypatch) -> None:
+    """Without the switch, presence leaves the manual sampling settings alone."""
+    write = AsyncMock()
+    monkeypatch.setattr(CustomCluster, "write_attributes", write)
+    endpoint = make_fp300_endpoint()
+    manu = endpoint.in_clusters[AqaraFP300ManuCluster.cluster_id]
+
+    assert endpoint.in_clusters[FP300SamplingCluster.cluster_id].enabled is False
+    manu._update_attribute(PRESENCE_ID, True)
+    await asyncio.sleep(0)
+
+    write.assert_not_awaited()
+    assert manu.sampling.profile is None
+
+
+async def test_disabling_releases_profile() -> None:
+    """Turning the switch off lets a later opt-in write its profile again."""
+    endpoint = make_fp300_endpoint(adaptive_sampling=True)
+    manu = endpoint.in_clusters[AqaraFP300ManuCluster.cluster_id]
+    manu.sampling.applied(SAMPLING_ACTIVE, now=0)
+
+    await endpoint.in_clusters[FP300SamplingCluster.cluster_id].write_attributes(
+        {"adaptive_sampling": False}
+    )
+
+    assert manu.sampling.profile is None
+
+
+async def test_presence_applies_profile(monkeypatch) -> None:
+    """Presence going on writes the active profile in one frame."""
+    write = AsyncMock(
+        return_value=[[foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)]]
+    )
+    monkeypatch.setattr(CustomCluster, "write_attributes", write)
+    manu = make_fp300_endpoint(adaptive_sampling=True).in_clusters[
+        AqaraFP300ManuCluster.cluster_id
+    ]
+
+    manu._update_attribute(PRESENCE_ID, True)
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    write.assert_awaited_once()
+    assert set(write.await_args.args[0]) == {
+        manu.find_attribute(name).id for name in SAMPLING_PROFILES[SAMPLING_ACTIVE]
+    }
+    assert manu.sampling.profile == SAMPLING_ACTIVE
+
+
+async def test_rejected_profile_is_retried(monkeypatch) -> None:
+    """A profile the device refuses is not recorded as applied."""
+    write = AsyncMock(
+        return_value=[[
+            foundation.WriteAttributesStatusRecord(
+                foundation.Status.UNSUPPORTED_ATTRIBUTE,
+                AqaraFP300ManuCluster.AttributeDefs.light_sampling.id,
+            )
+        ]]
+    )
+    monkeypatch.setattr(CustomCluster, "write_attributes", write)
+    manu = make_fp300_endpoint(adaptive_sampling=True).in_clusters[
+        AqaraFP300ManuCluster.cluster_id
+    ]
+
+    await manu._async_apply_sampling(SAMPLING_ACTIVE)
+
+    assert manu.sampling.profile is None
+    assert manu.sampling.in_flight is False
+
+
+async def test_cancelled_write_releases_controller(monkeypatch) -> None:
+    """Cancellation mid-write does not leave the controller stuck in flight."""
+    monkeypatch.setattr(
+        CustomCluster, "write_attributes", AsyncMock(side_effect=asyncio.CancelledError)
+    )
+    manu = make_fp300_endpoint(adaptive_sampling=True).in_clusters[
+        AqaraFP300ManuCluster.cluster_id
+    ]
+    assert manu.sampling.target(True, now=0) == SAMPLING_ACTIVE
+
+    with pytest.raises(asyncio.CancelledError):
+        await manu._async_apply_sampling(SAMPLING_ACTIVE)
+
+    assert manu.sampling.in_flight is False
+    assert manu.sampling.target(True, now=1) == SAMPLING_ACTIVE
+
+
+def test_heartbeat_tracks_battery() -> None:
+    """Heartbeat battery voltage feeds the controller."""
+    manu = make_fp300_endpoint(adaptive_sampling=True).in_clusters[
+        AqaraFP300ManuCluster.cluster_id
+    ]
+
+    manu._update_attribute(HEARTBEAT_ATTR_ID, bytes.fromhex("1721b80b182055"))
+
+    assert manu.last_heartbeat[BATTERY_VOLTAGE_MV] == 3000
+    assert manu.sampling._last_voltage[1] == 3000
+
+
+def test_heartbeat_publishes_drain(monkeypatch) -> None:
+    """Per-profile drain shows up on the sampling cluster once measurable."""
+    clock = ReplayClock()
+    monkeypatch.setattr(aqara_fp300, "time", clock)
+    endpoint = make_fp300_endpoint(adaptive_sampling=True)
+    manu = endpoint.in_clusters[AqaraFP300ManuCluster.cluster_id]
+    sampling = endpoint.in_clusters[FP300SamplingCluster.cluster_id]
+    manu.sampling.applied(SAMPLING_IDLE, now=0)
+
+    manu._update_attribute(HEARTBEAT_ATTR_ID, bytes.fromhex("1721b80b182055"))
+    clock.now = 7200
+    manu._update_attribute(HEARTBEAT_ATTR_ID, bytes.fromhex("1721ae0b182055"))
+
+    assert sampling.get("idle_drain") == 120.0  # 10 mV in 2 h
+    assert sampling.get("active_drain") is None